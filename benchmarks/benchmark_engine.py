@@ -7,13 +7,15 @@ Targets:
 
 from __future__ import annotations
 
-import time
+import itertools
+import timeit
+from collections.abc import Callable
 from datetime import UTC, datetime
 from decimal import Decimal
 
 from liq.core import Bar, PortfolioState
 
-from liq.risk import MarketState, RiskConfig, RiskEngine
+from liq.risk import MarketState, RiskConfig, RiskEngine, RiskEngineResult
 from liq.risk.constraints import (
     CorrelationConstraint,
     GrossLeverageConstraint,
@@ -23,45 +25,58 @@ from liq.risk.constraints import (
     SectorExposureConstraint,
 )
 
+# Shared Decimal constants so fixture construction doesn't re-parse literals
+_OPEN = Decimal("100")
+_HIGH = Decimal("102")
+_LOW = Decimal("98")
+_CLOSE = Decimal("100")
+_BAR_VOLUME = Decimal("1000000")
+_VOLATILITY = Decimal("2.00")
+_LIQUIDITY = Decimal("50000000")
+_SECTORS = ("Technology", "Healthcare", "Financials", "Energy", "Consumer")
 
-def create_signals(n: int, now: datetime) -> list:
-    """Create n test signals."""
+
+def create_symbols(n: int) -> list[str]:
+    """Create n test symbols; shared by signals, orders and market state."""
+    return [f"SYM{i:04d}" for i in range(n)]
+
+
+def create_signals(symbols: list[str], now: datetime) -> list:
+    """Create one test signal per symbol, in symbol order.
+
+    Signals differ only by symbol, so one validated template is copied
+    rather than validating every signal from scratch.
+    """
     from liq.signals import Signal
 
-    symbols = [f"SYM{i:04d}" for i in range(n)]
-    return [
-        Signal(
-            symbol=symbol,
-            timestamp=now,
-            direction="long",
-            strength=0.7,
-        )
-        for symbol in symbols
-    ]
+    if not symbols:
+        return []
+    template = Signal(
+        symbol=symbols[0],
+        timestamp=now,
+        direction="long",
+        strength=0.7,
+    )
+    return [template.model_copy(update={"symbol": symbol}) for symbol in symbols]
 
 
 def create_market_state(symbols: list[str], now: datetime) -> MarketState:
     """Create market state with bars and volatility for all symbols."""
-    bars = {}
-    volatility = {}
-    liquidity = {}
-    sector_map = {}
-
-    sectors = ["Technology", "Healthcare", "Financials", "Energy", "Consumer"]
-
-    for i, symbol in enumerate(symbols):
-        bars[symbol] = Bar(
+    bars = {
+        symbol: Bar(
             timestamp=now,
             symbol=symbol,
-            open=Decimal("100"),
-            high=Decimal("102"),
-            low=Decimal("98"),
-            close=Decimal("100"),
-            volume=Decimal("1000000"),
+            open=_OPEN,
+            high=_HIGH,
+            low=_LOW,
+            close=_CLOSE,
+            volume=_BAR_VOLUME,
         )
-        volatility[symbol] = Decimal("2.00")
-        liquidity[symbol] = Decimal("50000000")
-        sector_map[symbol] = sectors[i % len(sectors)]
+        for symbol in symbols
+    }
+    volatility = dict.fromkeys(symbols, _VOLATILITY)
+    liquidity = dict.fromkeys(symbols, _LIQUIDITY)
+    sector_map = dict(zip(symbols, itertools.cycle(_SECTORS), strict=False))
 
     return MarketState(
         current_bars=bars,
@@ -72,14 +87,27 @@ def create_market_state(symbols: list[str], now: datetime) -> MarketState:
     )
 
 
-def benchmark_size_signals(n_signals: int = 1000, iterations: int = 100) -> float:
-    """Benchmark sizing n signals through the engine.
+def _time_ms(func: Callable[[], object], min_loops: int) -> float:
+    """Average wall time of func in milliseconds, measured with timeit.
 
-    Returns average time in milliseconds.
+    Timer.autorange picks a loop count that runs for at least 0.2s;
+    at least min_loops calls are always timed.
+    """
+    timer = timeit.Timer(func)
+    n_loops, total = timer.autorange()
+    if n_loops < min_loops:
+        n_loops, total = min_loops, timer.timeit(number=min_loops)
+    return total / n_loops * 1000
+
+
+def make_size_signals(n_signals: int) -> Callable[[], object]:
+    """Build fixtures for sizing n signals and return the call to time.
+
+    The engine is warmed up once before returning.
     """
     now = datetime.now(UTC)
-    signals = create_signals(n_signals, now)
-    symbols = [s.symbol for s in signals]
+    symbols = create_symbols(n_signals)
+    signals = create_signals(symbols, now)
     market_state = create_market_state(symbols, now)
     portfolio = PortfolioState(
         cash=Decimal("10000000"),  # $10M
@@ -88,20 +116,22 @@ def benchmark_size_signals(n_signals: int = 1000, iterations: int = 100) -> floa
     )
     config = RiskConfig(max_positions=500)
     engine = RiskEngine()
+    out = RiskEngineResult()  # Containers reused across iterations
+
+    def size_signals() -> RiskEngineResult:
+        return engine.process_signals(signals, portfolio, market_state, config, out=out)
 
     # Warmup
-    engine.process_signals(signals, portfolio, market_state, config)
+    size_signals()
+    return size_signals
 
-    # Benchmark
-    times = []
-    for _ in range(iterations):
-        start = time.perf_counter()
-        engine.process_signals(signals, portfolio, market_state, config)
-        elapsed = time.perf_counter() - start
-        times.append(elapsed * 1000)  # Convert to ms
 
-    avg_ms = sum(times) / len(times)
-    return avg_ms
+def benchmark_size_signals(n_signals: int = 1000, iterations: int = 100) -> float:
+    """Benchmark sizing n signals through the engine.
+
+    Returns average time in milliseconds.
+    """
+    return _time_ms(make_size_signals(n_signals), iterations)
 
 
 def benchmark_constraint_chain(n_orders: int = 1000, iterations: int = 100) -> float:
@@ -112,7 +142,7 @@ def benchmark_constraint_chain(n_orders: int = 1000, iterations: int = 100) -> f
     from liq.core import OrderRequest, OrderSide, OrderType
 
     now = datetime.now(UTC)
-    symbols = [f"SYM{i:04d}" for i in range(n_orders)]
+    symbols = create_symbols(n_orders)
     market_state = create_market_state(symbols, now)
     portfolio = PortfolioState(
         cash=Decimal("10000000"),
@@ -146,31 +176,20 @@ def benchmark_constraint_chain(n_orders: int = 1000, iterations: int = 100) -> f
         CorrelationConstraint(),
     ]
 
+    def run_chain() -> None:
+        result = orders
+        for c in constraints:
+            output = c.apply(result, portfolio, market_state, config)
+            if isinstance(output, list):
+                result = output
+            else:
+                result = output.orders
+
     # Warmup
-    result = orders
-    for c in constraints:
-        output = c.apply(result, portfolio, market_state, config)
-        if isinstance(output, list):
-            result = output
-        else:
-            result = output.orders
+    run_chain()
 
     # Benchmark
-    times = []
-    for _ in range(iterations):
-        start = time.perf_counter()
-    result = orders
-    for c in constraints:
-        output = c.apply(result, portfolio, market_state, config)
-        if isinstance(output, list):
-            result = output
-        else:
-            result = output.orders
-        elapsed = time.perf_counter() - start
-        times.append(elapsed * 1000)
-
-    avg_ms = sum(times) / len(times)
-    return avg_ms
+    return _time_ms(run_chain, iterations)
 
 
 def main() -> None:
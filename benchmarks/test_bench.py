@@ -0,0 +1,22 @@
+"""pytest-benchmark scaling sweep for liq-risk.
+
+Run with ``pytest benchmarks/test_bench.py``; skipped when pytest-benchmark
+is not installed. The standalone ``benchmark_engine.py`` script remains the
+quick human-readable report.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from benchmark_engine import make_size_signals  # noqa: E402
+
+
+@pytest.mark.parametrize("n", [100, 500, 1000, 2000])
+def test_size_signals_scaling(benchmark, n: int) -> None:
+    """Size n signals through the engine, with warmup rounds before timing."""
+    size_signals = make_size_signals(n)
+    result = benchmark.pedantic(size_signals, rounds=10, iterations=100, warmup_rounds=3)
+    assert result.orders
@@ -27,6 +27,7 @@ __all__ = [
     # Configuration
     "RiskConfig",
     "MarketState",
+    "CorrelationMatrix",
     # Layered State
     "PriceState",
     "RiskFactors",
@@ -68,7 +69,7 @@ __all__ = [
     "ShortSellingConstraint",
 ]
 
-from liq.risk.config import MarketState, RiskConfig
+from liq.risk.config import CorrelationMatrix, MarketState, RiskConfig
 from liq.risk.constraints import (
     BuyingPowerConstraint,
     CorrelationConstraint,
@@ -0,0 +1,125 @@
+"""Vectorized float64 screens shared by constraints.
+
+Constraints keep exact Decimal arithmetic as the source of truth. These
+kernels run one NumPy pass over a whole batch first, using the float64
+views on MarketState; a constraint may skip its exact per-order loop only
+when the screen clears its limit beyond float rounding error.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+from liq.core import OrderSide
+
+if TYPE_CHECKING:
+    from liq.core import OrderRequest
+    from numpy.typing import NDArray
+
+# Relative headroom a float64 estimate must clear before it is trusted
+# over the exact Decimal accounting.
+FLOAT_SCREEN_MARGIN = 1e-9
+
+
+def clears(estimate: float, limit: float) -> bool:
+    """Return True if a float64 estimate is clearly within limit."""
+    return estimate * (1 + FLOAT_SCREEN_MARGIN) <= limit
+
+
+def screened_floor(
+    estimates: NDArray[np.float64],
+) -> tuple[NDArray[np.float64], NDArray[np.bool_]]:
+    """Floor float64 estimates, flagging which floors can be trusted.
+
+    An estimate within FLOAT_SCREEN_MARGIN (relative) of an integer could
+    floor to the wrong side of it; those entries are False in the mask and
+    the caller must recompute them exactly.
+
+    Returns:
+        (floors, trusted) aligned with estimates.
+    """
+    floors = np.floor(estimates)
+    tolerance = FLOAT_SCREEN_MARGIN * np.maximum(np.abs(estimates), 1.0)
+    trusted = (estimates - floors > tolerance) & (floors + 1 - estimates > tolerance)
+    return floors, trusted
+
+
+def symbol_indices(
+    orders: list[OrderRequest],
+    symbol_index: dict[str, int],
+) -> list[int] | None:
+    """Positions of a batch's symbols in the MarketState arrays.
+
+    Args:
+        orders: Orders to look up.
+        symbol_index: Symbol to position in the MarketState arrays.
+
+    Returns:
+        Indices aligned with orders, or None if any order has no bar data
+        (the caller must take its exact path).
+    """
+    try:
+        return [symbol_index[order.symbol] for order in orders]
+    except KeyError:
+        return None
+
+
+def gather_buys(
+    orders: list[OrderRequest],
+    symbol_index: dict[str, int],
+) -> tuple[NDArray[np.intp], NDArray[np.float64]] | None:
+    """Gather symbol indices and quantities of the buy orders in a batch.
+
+    Args:
+        orders: Orders to scan; sells are skipped.
+        symbol_index: Symbol to position in the MarketState arrays.
+
+    Returns:
+        (indices, quantities) aligned with the buys in order, or None if
+        any buy has no bar data (the caller must take its exact path).
+    """
+    indices: list[int] = []
+    quantities: list[float] = []
+    for order in orders:
+        if order.side is OrderSide.SELL:
+            continue
+        idx = symbol_index.get(order.symbol)
+        if idx is None:
+            return None
+        indices.append(idx)
+        quantities.append(float(order.quantity))
+    return np.asarray(indices, dtype=np.intp), np.asarray(quantities, dtype=np.float64)
+
+
+def batch_notional(
+    prices: NDArray[np.float64],
+    indices: NDArray[np.intp] | list[int],
+    quantities: NDArray[np.float64],
+) -> float:
+    """Total notional (sum of price * quantity) of a batch."""
+    return float(quantities @ prices[indices])
+
+
+def sector_notional(
+    prices: NDArray[np.float64],
+    sector_ids: NDArray[np.int32],
+    n_sectors: int,
+    indices: NDArray[np.intp],
+    quantities: NDArray[np.float64],
+) -> tuple[NDArray[np.float64], NDArray[np.bool_]]:
+    """Aggregate batch notional per sector id with a single bincount.
+
+    Orders whose symbol has no sector (id -1) are left out.
+
+    Returns:
+        (totals, touched): notional per sector, and which sectors
+        received at least one order.
+    """
+    order_sector_ids = sector_ids[indices]
+    mapped = order_sector_ids >= 0
+    order_sector_ids = order_sector_ids[mapped]
+    notional = prices[indices][mapped] * quantities[mapped]
+    totals = np.bincount(order_sector_ids, weights=notional, minlength=n_sectors)
+    touched = np.bincount(order_sector_ids, minlength=n_sectors) > 0
+    return totals, touched
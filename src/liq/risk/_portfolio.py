@@ -0,0 +1,98 @@
+"""Portfolio figures shared by constraints.
+
+Gross and net exposure are needed by both leverage constraints. RiskEngine
+computes them once per call and publishes them for the duration of its
+constraint chain through exposure_scope; outside such a scope they are
+computed on demand. The scope is held in a context variable, so it is
+private to the calling thread or task and is released when the call ends.
+
+The position-based risk classification behind every constraint's
+classify_risk lives here as well.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from decimal import Decimal
+from typing import TYPE_CHECKING
+
+from liq.core import OrderSide
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from liq.core import OrderRequest, PortfolioState
+
+# Snapshot and its (gross, net) exposure for the engine call in progress
+_scoped_exposures: ContextVar[tuple[PortfolioState, Decimal, Decimal] | None] = ContextVar(
+    "_scoped_exposures", default=None
+)
+
+
+def _compute_exposures(portfolio_state: PortfolioState) -> tuple[Decimal, Decimal]:
+    """Sum gross and net position market values in one pass."""
+    gross = Decimal("0")
+    net = Decimal("0")
+    for position in portfolio_state.positions.values():
+        value = position.market_value
+        gross += abs(value)
+        net += value
+    return gross, net
+
+
+@contextmanager
+def exposure_scope(portfolio_state: PortfolioState) -> Iterator[None]:
+    """Compute exposures once and reuse them until the block exits.
+
+    Within the block, exposures(portfolio_state) returns the figures
+    computed on entry, so positions must not change while it is active.
+
+    Args:
+        portfolio_state: Portfolio snapshot for one engine call.
+    """
+    gross, net = _compute_exposures(portfolio_state)
+    token = _scoped_exposures.set((portfolio_state, gross, net))
+    try:
+        yield
+    finally:
+        _scoped_exposures.reset(token)
+
+
+def exposures(portfolio_state: PortfolioState) -> tuple[Decimal, Decimal]:
+    """Gross and net exposure of the current positions.
+
+    Gross exposure is the sum of absolute position market values; net
+    exposure is the signed sum (longs positive, shorts negative).
+
+    Args:
+        portfolio_state: Portfolio snapshot.
+
+    Returns:
+        (gross, net) exposure.
+    """
+    scoped = _scoped_exposures.get()
+    if scoped is not None and scoped[0] is portfolio_state:
+        return scoped[1], scoped[2]
+    return _compute_exposures(portfolio_state)
+
+
+def is_risk_increasing(order: OrderRequest, portfolio_state: PortfolioState) -> bool:
+    """Whether an order adds to (or opens) risk in its symbol.
+
+    An order is risk-reducing only when it trades against the current
+    position: a buy against a short or a sell against a long. This is the
+    classify_risk rule shared by every constraint.
+
+    Args:
+        order: The order to classify.
+        portfolio_state: Current portfolio for context.
+
+    Returns:
+        True if risk-increasing, False if risk-reducing.
+    """
+    position = portfolio_state.positions.get(order.symbol)
+    if position is None:
+        return True
+    qty = position.quantity
+    return qty >= 0 if order.side is OrderSide.BUY else qty <= 0
@@ -79,7 +79,7 @@ class OutputSpaceBoundConstraint:
         position = portfolio_state.positions.get(order.symbol)
         current_qty = position.quantity if position else Decimal("0")
 
-        if order.side == OrderSide.BUY:
+        if order.side is OrderSide.BUY:
             return current_qty >= 0
         else:
             return current_qty <= 0
@@ -130,7 +130,7 @@ class OutputSpaceBoundConstraint:
             order_value = order.quantity * price
 
             # Proposed weight change
-            if order.side == OrderSide.BUY:
+            if order.side is OrderSide.BUY:
                 delta_w = float(order_value / equity)
             else:
                 delta_w = float(order_value / equity)
@@ -233,7 +233,7 @@ class RiskSpaceBoundConstraint:
         position = portfolio_state.positions.get(order.symbol)
         current_qty = position.quantity if position else Decimal("0")
 
-        if order.side == OrderSide.BUY:
+        if order.side is OrderSide.BUY:
             return current_qty >= 0
         else:
             return current_qty <= 0
@@ -370,7 +370,7 @@ class RiskSpaceBoundConstraint:
                 order_value = float(order.quantity * bar.close)
                 weight_delta = order_value / float(equity)
 
-                if order.side == OrderSide.BUY:
+                if order.side is OrderSide.BUY:
                     proposed[idx] += weight_delta
                 else:
                     proposed[idx] -= weight_delta
@@ -406,7 +406,7 @@ class RiskSpaceBoundConstraint:
 
             if order.symbol in symbols:
                 idx = symbols.index(order.symbol)
-                if order.side == OrderSide.BUY:
+                if order.side is OrderSide.BUY:
                     proposed[idx] += weight_delta
                 else:
                     proposed[idx] -= weight_delta
@@ -6,29 +6,87 @@ current market conditions.
 
 from __future__ import annotations
 
+import itertools
 import logging
+import sys
 import warnings
+from collections.abc import Mapping
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Self
 
+import numpy as np
+from liq.core import Bar
+from numpy.typing import NDArray
 from pydantic import (
     BaseModel,
     ConfigDict,
     Field,
+    PrivateAttr,
+    ValidationInfo,
     field_validator,
-    model_validator,
 )
 
 from liq.risk.enums import HaltMode, PriceReference, SizingMode
 
 if TYPE_CHECKING:
-    pass
+    import polars as pl
 
 logger = logging.getLogger(__name__)
 
 
-class RiskConfig(BaseModel):
+# Range checks applied in RiskConfig.__post_init__:
+# (field, lower bound, lower bound inclusive, upper bound inclusive or None)
+_RANGE_CHECKS: tuple[tuple[str, float, bool, float | None], ...] = (
+    ("max_position_pct", 0.0, False, 1.0),
+    ("max_positions", 0, False, None),
+    ("min_position_value", 0, True, None),
+    ("max_sector_pct", 0.0, False, 1.0),
+    ("max_gross_leverage", 0.0, False, None),
+    ("max_net_leverage", 0.0, False, None),
+    ("max_correlation", 0.0, False, 1.0),
+    ("risk_per_trade", 0.0, False, 1.0),
+    ("kelly_fraction", 0.0, False, 1.0),
+    ("vol_target", 0.0, False, None),
+    ("stop_loss_atr_mult", 0.0, False, None),
+    ("take_profit_atr_mult", 0.0, False, None),
+    ("max_drawdown_halt", 0.0, False, 1.0),
+    ("max_daily_loss_halt", 0.0, False, 1.0),
+    ("default_borrow_rate", 0.0, True, None),
+    ("default_slippage_pct", 0.0, True, None),
+    ("default_commission_pct", 0.0, True, None),
+)
+
+_FLOAT_FIELDS: tuple[str, ...] = (
+    "max_position_pct",
+    "max_sector_pct",
+    "max_gross_leverage",
+    "max_net_leverage",
+    "max_correlation",
+    "risk_per_trade",
+    "kelly_fraction",
+    "vol_target",
+    "stop_loss_atr_mult",
+    "take_profit_atr_mult",
+    "max_drawdown_halt",
+    "max_daily_loss_halt",
+    "default_borrow_rate",
+    "default_slippage_pct",
+    "default_commission_pct",
+)
+
+# Float fields whose Decimal form constraints read on every apply():
+# (field, derived Decimal attribute)
+_DECIMAL_MIRRORS: tuple[tuple[str, str], ...] = (
+    ("max_position_pct", "max_position_pct_dec"),
+    ("max_gross_leverage", "max_gross_leverage_dec"),
+    ("max_net_leverage", "max_net_leverage_dec"),
+)
+
+
+@dataclass(frozen=True, slots=True)
+class RiskConfig:
     """Risk parameters for position sizing.
 
     All percentages are expressed as decimals (0.05 = 5%).
@@ -36,6 +94,11 @@ class RiskConfig(BaseModel):
     This class supports zero-config usage: all fields have sensible
     defaults that provide a conservative starting point.
 
+    RiskConfig is read on every constraint application, so it is a
+    frozen, slotted dataclass rather than a pydantic model: attribute
+    reads are plain slot loads. Field types and ranges are checked once
+    in ``__post_init__``; invalid values raise ValueError.
+
     Attributes:
         max_position_pct: Maximum position size as fraction of equity.
         max_positions: Maximum number of concurrent positions.
@@ -56,6 +119,12 @@ class RiskConfig(BaseModel):
         halt_mode: What "halt" means - which orders to block.
         allow_shorts: Allow short selling (False for long-only strategies).
         allow_leverage: Allow gross leverage > 1.0.
+        max_position_pct_dec: Derived, not an init argument: max_position_pct
+            as a Decimal, parsed from its string form once.
+        max_gross_leverage_dec: Derived, not an init argument: max_gross_leverage
+            as a Decimal, parsed from its string form once.
+        max_net_leverage_dec: Derived, not an init argument: max_net_leverage
+            as a Decimal, parsed from its string form once.
 
     Example:
         >>> config = RiskConfig()  # Use all defaults
@@ -67,137 +136,92 @@ class RiskConfig(BaseModel):
         0.10
     """
 
-    model_config = ConfigDict(frozen=True)
-
     # Position limits
-    max_position_pct: float = Field(
-        default=0.05,
-        gt=0.0,
-        le=1.0,
-        description="Max position size as fraction of equity (0.05 = 5%)",
-    )
-    max_positions: int = Field(
-        default=50,
-        gt=0,
-        description="Maximum number of concurrent positions",
-    )
-    min_position_value: Decimal = Field(
-        default=Decimal("100"),
-        ge=Decimal("0"),
-        description="Minimum order notional value",
-    )
+    max_position_pct: float = 0.05  # Max position size as fraction of equity (0.05 = 5%)
+    max_positions: int = 50  # Maximum number of concurrent positions
+    min_position_value: Decimal = Decimal("100")  # Minimum order notional value
 
     # Exposure limits
-    max_sector_pct: float = Field(
-        default=0.30,
-        gt=0.0,
-        le=1.0,
-        description="Max exposure to any single sector (0.30 = 30%)",
-    )
-    max_gross_leverage: float = Field(
-        default=1.0,
-        gt=0.0,
-        description="Max gross exposure / equity ratio",
-    )
-    max_net_leverage: float = Field(
-        default=1.0,
-        gt=0.0,
-        description="Max net exposure / equity ratio",
-    )
-    max_correlation: float | None = Field(
-        default=None,
-        gt=0.0,
-        le=1.0,
-        description="Max average pairwise correlation",
-    )
+    max_sector_pct: float = 0.30  # Max exposure to any single sector (0.30 = 30%)
+    max_gross_leverage: float = 1.0  # Max gross exposure / equity ratio
+    max_net_leverage: float = 1.0  # Max net exposure / equity ratio
+    max_correlation: float | None = None  # Max average pairwise correlation
 
     # Sizing parameters
-    risk_per_trade: float = Field(
-        default=0.01,
-        gt=0.0,
-        le=1.0,
-        description="Fraction of equity to risk per trade (0.01 = 1%)",
-    )
-    kelly_fraction: float = Field(
-        default=0.25,
-        gt=0.0,
-        le=1.0,
-        description="Fractional Kelly multiplier (0.25 = quarter Kelly)",
-    )
-    vol_target: float | None = Field(
-        default=None,
-        gt=0.0,
-        description="Target portfolio volatility (annualized)",
-    )
+    risk_per_trade: float = 0.01  # Fraction of equity to risk per trade (0.01 = 1%)
+    kelly_fraction: float = 0.25  # Fractional Kelly multiplier (0.25 = quarter Kelly)
+    vol_target: float | None = None  # Target portfolio volatility (annualized)
 
     # Sizing behavior
-    sizing_mode: SizingMode = Field(
-        default=SizingMode.REBALANCE,
-        description="How to handle existing positions when sizing",
-    )
-    price_reference: PriceReference = Field(
-        default=PriceReference.MIDRANGE,
-        description="Which price to use for sizing calculations",
-    )
+    sizing_mode: SizingMode = SizingMode.REBALANCE  # How to handle existing positions
+    price_reference: PriceReference = PriceReference.MIDRANGE  # Price used for sizing
 
     # Risk controls
-    stop_loss_atr_mult: float = Field(
-        default=2.0,
-        gt=0.0,
-        description="Stop-loss distance in ATR multiples",
-    )
-    take_profit_atr_mult: float | None = Field(
-        default=None,
-        gt=0.0,
-        description="Take-profit distance in ATR multiples",
-    )
-    max_drawdown_halt: float = Field(
-        default=0.15,
-        gt=0.0,
-        le=1.0,
-        description="Halt new buys at this drawdown level (0.15 = 15%)",
-    )
-    max_daily_loss_halt: float | None = Field(
-        default=None,
-        gt=0.0,
-        le=1.0,
-        description="Halt trading at this daily loss level",
-    )
-    halt_mode: HaltMode = Field(
-        default=HaltMode.HALT_BUYS_ONLY,
-        description="What 'halt' means - which orders to block",
-    )
+    stop_loss_atr_mult: float = 2.0  # Stop-loss distance in ATR multiples
+    take_profit_atr_mult: float | None = None  # Take-profit distance in ATR multiples
+    max_drawdown_halt: float = 0.15  # Halt new buys at this drawdown level (0.15 = 15%)
+    max_daily_loss_halt: float | None = None  # Halt trading at this daily loss level
+    halt_mode: HaltMode = HaltMode.HALT_BUYS_ONLY  # What 'halt' means - which orders to block
 
     # Trading permissions
-    allow_shorts: bool = Field(
-        default=True,
-        description="Allow short selling (False = long-only strategy)",
-    )
-    allow_leverage: bool = Field(
-        default=False,
-        description="Allow gross leverage > 1.0",
-    )
+    allow_shorts: bool = True  # Allow short selling (False = long-only strategy)
+    allow_leverage: bool = False  # Allow gross leverage > 1.0
 
     # Trading costs (for cost-aware sizing)
-    default_borrow_rate: float = Field(
-        default=0.0,
-        ge=0.0,
-        description="Default annualized borrow rate for shorts (0.02 = 2%)",
-    )
-    default_slippage_pct: float = Field(
-        default=0.0,
-        ge=0.0,
-        description="Default slippage estimate as fraction (0.001 = 0.1%)",
-    )
-    default_commission_pct: float = Field(
-        default=0.0,
-        ge=0.0,
-        description="Default commission rate as fraction (0.001 = 0.1%)",
-    )
-
-    @model_validator(mode="after")
-    def validate_leverage_consistency(self) -> RiskConfig:
-        """Validate that leverage settings are consistent."""
+    default_borrow_rate: float = 0.0  # Annualized borrow rate for shorts (0.02 = 2%)
+    default_slippage_pct: float = 0.0  # Slippage estimate as fraction (0.001 = 0.1%)
+    default_commission_pct: float = 0.0  # Commission rate as fraction (0.001 = 0.1%)
+
+    # Derived: Decimal forms of position and leverage limits, for exact math
+    max_position_pct_dec: Decimal = field(init=False, repr=False, compare=False)
+    max_gross_leverage_dec: Decimal = field(init=False, repr=False, compare=False)
+    max_net_leverage_dec: Decimal = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Coerce field types and validate ranges and leverage consistency."""
+        for name in _FLOAT_FIELDS:
+            value = getattr(self, name)
+            if value is not None and not isinstance(value, float):
+                object.__setattr__(self, name, _to_float(name, value))
+
+        if isinstance(self.max_positions, bool) or not isinstance(self.max_positions, int):
+            object.__setattr__(self, "max_positions", _to_int("max_positions", self.max_positions))
+        if not isinstance(self.min_position_value, Decimal):
+            object.__setattr__(
+                self,
+                "min_position_value",
+                _to_decimal("min_position_value", self.min_position_value),
+            )
+        object.__setattr__(self, "sizing_mode", SizingMode(self.sizing_mode))
+        object.__setattr__(self, "price_reference", PriceReference(self.price_reference))
+        object.__setattr__(self, "halt_mode", HaltMode(self.halt_mode))
+
+        for name, lower, lower_inclusive, upper in _RANGE_CHECKS:
+            value = getattr(self, name)
+            if value is None:
+                continue
+            # NaN fails no ordering comparison, so reject it before the bounds
+            if value.is_nan() if isinstance(value, Decimal) else value != value:
+                raise ValueError(f"{name} must be a number, got {value}")
+            if value < lower or (value == lower and not lower_inclusive):
+                op = ">=" if lower_inclusive else ">"
+                raise ValueError(f"{name} must be {op} {lower}, got {value}")
+            if upper is not None and value > upper:
+                raise ValueError(f"{name} must be <= {upper}, got {value}")
+
+        for name, derived in _DECIMAL_MIRRORS:
+            object.__setattr__(self, derived, Decimal(str(getattr(self, name))))
+
+        # Caller -> generated __init__ -> __post_init__ -> here
+        self.validate_leverage_consistency(stacklevel=4)
+
+    def validate_leverage_consistency(self, *, stacklevel: int = 2) -> RiskConfig:
+        """Validate that leverage settings are consistent.
+
+        Args:
+            stacklevel: Passed to warnings.warn so the warning points at the
+                code that built the config; internal callers add their frames.
+        """
         # Net leverage should not exceed gross leverage
         if self.max_net_leverage > self.max_gross_leverage:
             raise ValueError(
@@ -214,7 +238,7 @@ class RiskConfig(BaseModel):
                 f"max_gross_leverage ({self.max_gross_leverage}). "
                 f"Consider adjusting limits.",
                 UserWarning,
-                stacklevel=2,
+                stacklevel=stacklevel,
             )
             logger.warning(
                 "Config warning: max_position_pct * max_positions = %.2f "
@@ -225,6 +249,337 @@ class RiskConfig(BaseModel):
 
         return self
 
+    @classmethod
+    def model_validate(cls, data: RiskConfig | Mapping[str, Any]) -> RiskConfig:
+        """Build a RiskConfig from a mapping (pydantic-style compatibility).
+
+        For callers written against the pydantic API. Equivalent to
+        ``RiskConfig(**data)``; an existing RiskConfig is returned as is.
+
+        Args:
+            data: Field values by name, or a RiskConfig.
+
+        Returns:
+            Validated RiskConfig.
+
+        Raises:
+            ValueError: If a value is out of range or of the wrong type.
+            TypeError: If data names an unknown field.
+        """
+        if isinstance(data, cls):
+            return data
+        return cls(**data)
+
+    def derive(self, **overrides: Any) -> RiskConfig:
+        """Return a copy with some fields replaced, skipping re-validation.
+
+        Intended for trusted callers on hot paths that tweak one or two
+        fields of an already-validated config (e.g. per-symbol
+        kelly_fraction overrides). Override values are used as given: no
+        type coercion or range checks are applied. Leverage consistency is
+        re-checked only if a leverage-related field changes. Use
+        ``dataclasses.replace`` when the overrides are untrusted.
+
+        Args:
+            **overrides: Field values to replace.
+
+        Returns:
+            New RiskConfig sharing all other field values with this one.
+
+        Raises:
+            TypeError: If an override names an unknown field.
+
+        Example:
+            >>> aggressive = config.derive(kelly_fraction=0.5)
+        """
+        unknown = overrides.keys() - _INIT_FIELDS
+        if unknown:
+            raise TypeError(f"RiskConfig has no field(s) {', '.join(sorted(unknown))}")
+
+        derived = object.__new__(RiskConfig)
+        for name in _INIT_FIELDS:
+            value = overrides[name] if name in overrides else getattr(self, name)
+            object.__setattr__(derived, name, value)
+        for name, mirror in _DECIMAL_MIRRORS:
+            if name in overrides:
+                value = Decimal(str(getattr(derived, name)))
+            else:
+                value = getattr(self, mirror)
+            object.__setattr__(derived, mirror, value)
+
+        if overrides.keys() & _LEVERAGE_FIELDS:
+            # Caller -> derive -> here
+            derived.validate_leverage_consistency(stacklevel=3)
+        return derived
+
+
+# Init fields of RiskConfig, and those validate_leverage_consistency reads
+_INIT_FIELDS = frozenset(f.name for f in fields(RiskConfig) if f.init)
+_LEVERAGE_FIELDS = frozenset(
+    {"max_position_pct", "max_positions", "max_gross_leverage", "max_net_leverage"}
+)
+
+
+def _to_float(name: str, value: Any) -> float:
+    """Coerce a numeric config value to float, rejecting bools and junk."""
+    if isinstance(value, bool):
+        raise ValueError(f"{name} must be a number, got {value!r}")
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"{name} must be a number, got {value!r}") from None
+
+
+def _to_int(name: str, value: Any) -> int:
+    """Coerce an integral config value to int, rejecting fractional values."""
+    number = _to_float(name, value)
+    if not number.is_integer():
+        raise ValueError(f"{name} must be an integer, got {value!r}")
+    return int(number)
+
+
+def _to_decimal(name: str, value: Any) -> Decimal:
+    """Coerce a currency config value to Decimal via its string form."""
+    if isinstance(value, bool):
+        raise ValueError(f"{name} must be a number, got {value!r}")
+    try:
+        return Decimal(str(value))
+    except ArithmeticError:
+        raise ValueError(f"{name} must be a number, got {value!r}") from None
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class CorrelationMatrix:
+    """Dense pairwise correlations with a symbol index.
+
+    ``values[index[a], index[b]]`` is the correlation of a and b. The
+    matrix is float64 and read-only; missing pairs and the diagonal are
+    NaN, so every comparison against them is False ("no data").
+
+    Attributes:
+        values: Square correlation matrix.
+        index: Symbol to row/column of values.
+        symbols: Symbols in row order (inverse of index).
+
+    Example:
+        >>> matrix = CorrelationMatrix.from_pairs({("AAPL", "MSFT"): 0.8})
+        >>> matrix.values[matrix.index["MSFT"], matrix.index["AAPL"]]
+        0.8
+    """
+
+    values: NDArray[np.float64]
+    index: dict[str, int]
+    symbols: list[str]
+
+    @classmethod
+    def from_pairs(
+        cls,
+        correlations: dict[tuple[str, str], float | None],
+        symbols: list[str] | None = None,
+    ) -> CorrelationMatrix:
+        """Densify a pair-keyed correlation dict.
+
+        A pair given in one order only is mirrored; when both orders are
+        present, each keeps its own value.
+
+        Args:
+            correlations: {(symbol_a, symbol_b): correlation}; None means no data.
+            symbols: Symbols to place first, in order (e.g. MarketState
+                symbols with bar data). Other symbols named in the pairs
+                follow in first-seen order.
+        """
+        first = [a for a, _ in correlations]
+        second = [b for _, b in correlations]
+        values = np.fromiter(
+            (np.nan if value is None else float(value) for value in correlations.values()),
+            dtype=np.float64,
+            count=len(correlations),
+        )
+        return cls._from_columns(first, second, values, symbols)
+
+    @classmethod
+    def from_frame(cls, frame: pl.DataFrame, symbols: list[str] | None = None) -> CorrelationMatrix:
+        """Densify a long-format Polars table of pairwise correlations.
+
+        Same semantics as from_pairs, one row per pair.
+
+        Args:
+            frame: Columns sym_a (str), sym_b (str) and corr (numeric;
+                null means no data).
+            symbols: Symbols to place first, in order.
+        """
+        import polars as pl
+
+        values = frame["corr"].cast(pl.Float64).fill_null(np.nan).to_numpy()
+        return cls._from_columns(
+            frame["sym_a"].to_list(), frame["sym_b"].to_list(), values, symbols
+        )
+
+    @classmethod
+    def _from_columns(
+        cls,
+        first: list[str],
+        second: list[str],
+        values: NDArray[np.float64],
+        symbols: list[str] | None,
+    ) -> CorrelationMatrix:
+        """Build the matrix from aligned (sym_a, sym_b, corr) columns."""
+        ordered = [sys.intern(s) for s in symbols or []]
+        index = {s: i for i, s in enumerate(ordered)}
+        for symbol in itertools.chain(first, second):
+            if symbol not in index:
+                symbol = sys.intern(symbol)
+                index[symbol] = len(ordered)
+                ordered.append(symbol)
+
+        size = len(ordered)
+        matrix = np.full((size, size), np.nan, dtype=np.float64)
+        rows = np.fromiter((index[s] for s in first), dtype=np.intp, count=len(first))
+        cols = np.fromiter((index[s] for s in second), dtype=np.intp, count=len(second))
+        # Mirror first so a pair given in both orders keeps each direct value
+        matrix[cols, rows] = values
+        matrix[rows, cols] = values
+        return cls._sealed(matrix, index, ordered)
+
+    @classmethod
+    def from_array(cls, values: Any, symbols: list[str]) -> CorrelationMatrix:
+        """Wrap a square array whose rows are ordered like symbols.
+
+        Raises:
+            ValueError: If values is not (len(symbols), len(symbols)).
+        """
+        matrix = np.array(values, dtype=np.float64)
+        n = len(symbols)
+        if matrix.shape != (n, n):
+            raise ValueError(
+                f"correlations array must have shape ({n}, {n}) matching "
+                f"symbol_index, got {matrix.shape}"
+            )
+        ordered = [sys.intern(s) for s in symbols]
+        return cls._sealed(matrix, {s: i for i, s in enumerate(ordered)}, ordered)
+
+    @classmethod
+    def _sealed(
+        cls, matrix: NDArray[np.float64], index: dict[str, int], symbols: list[str]
+    ) -> CorrelationMatrix:
+        """Blank the diagonal, freeze the matrix and build the instance."""
+        np.fill_diagonal(matrix, np.nan)
+        matrix.flags.writeable = False
+        return cls(values=matrix, index=index, symbols=symbols)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CorrelationMatrix):
+            return NotImplemented
+        return self.index == other.index and np.array_equal(
+            self.values, other.values, equal_nan=True
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+
+class _MarketArrays:
+    """Float64 views of MarketState data, aligned by symbol index.
+
+    Built once per MarketState so constraints can gather prices for a
+    whole batch with integer indexing instead of per-order Decimal math.
+    Entries missing from the source dicts are NaN; symbols without a
+    sector get sector id -1.
+    """
+
+    __slots__ = (
+        "symbol_index",
+        "close_prices",
+        "prices",
+        "volatility",
+        "liquidity",
+        "sectors",
+        "sector_index",
+        "sector_ids",
+        "universe",
+    )
+
+    def __init__(
+        self,
+        current_bars: dict[str, Bar],
+        volatility: dict[str, Decimal],
+        liquidity: dict[str, Decimal],
+        sector_map: dict[str, str] | None,
+    ) -> None:
+        self.close_prices: dict[str, Decimal] = {
+            s: bar.close for s, bar in current_bars.items() if bar is not None
+        }
+        symbols = list(self.close_prices)
+        n = len(symbols)
+        self.symbol_index: dict[str, int] = {s: i for i, s in enumerate(symbols)}
+        self.prices = np.fromiter(
+            (float(c) for c in self.close_prices.values()), dtype=np.float64, count=n
+        )
+        self.volatility = np.fromiter(
+            (float(volatility.get(s, np.nan)) for s in symbols), dtype=np.float64, count=n
+        )
+        self.liquidity = np.fromiter(
+            (float(liquidity.get(s, np.nan)) for s in symbols), dtype=np.float64, count=n
+        )
+        sector_map = sector_map or {}
+        self.sectors: list[str] = sorted(set(sector_map.values()))
+        self.sector_index: dict[str, int] = {sec: i for i, sec in enumerate(self.sectors)}
+        self.sector_ids = np.fromiter(
+            (self.sector_index.get(sector_map.get(s, ""), -1) for s in symbols),
+            dtype=np.int32,
+            count=n,
+        )
+        for arr in (
+            self.prices,
+            self.volatility,
+            self.liquidity,
+            self.sector_ids,
+        ):
+            arr.flags.writeable = False
+
+        # Polars universe table is built on first use (see universe_frame)
+        self.universe: pl.DataFrame | None = None
+
+    def universe_frame(self) -> pl.DataFrame:
+        """Return the per-symbol Polars table, building it on first call."""
+        if self.universe is None:
+            import polars as pl
+
+            self.universe = pl.DataFrame(
+                {
+                    "symbol": list(self.symbol_index),
+                    "price": self.prices,
+                    "vol": self.volatility,
+                    "liquidity": self.liquidity,
+                    "sector": [
+                        self.sectors[i] if i >= 0 else None for i in self.sector_ids.tolist()
+                    ],
+                    "sector_id": self.sector_ids,
+                },
+                schema={
+                    "symbol": pl.Utf8,
+                    "price": pl.Float64,
+                    "vol": pl.Float64,
+                    "liquidity": pl.Float64,
+                    "sector": pl.Categorical,
+                    "sector_id": pl.Int32,
+                },
+            ).with_columns(pl.col("price", "vol", "liquidity").fill_nan(None))
+        return self.universe
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, _MarketArrays):
+            return NotImplemented
+        return (
+            self.symbol_index == other.symbol_index
+            and np.array_equal(self.prices, other.prices, equal_nan=True)
+            and np.array_equal(self.volatility, other.volatility, equal_nan=True)
+            and np.array_equal(self.liquidity, other.liquidity, equal_nan=True)
+            and self.sectors == other.sectors
+            and np.array_equal(self.sector_ids, other.sector_ids)
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
 
 class MarketState(BaseModel):
     """Current market conditions for sizing decisions.
@@ -232,12 +587,28 @@ class MarketState(BaseModel):
     Provides the context needed for volatility-based sizing
     and constraint checking.
 
+    On construction, derived views are built once for fast batch access:
+
+    - ``close_prices``: exact Decimal close per symbol (no bar hop).
+    - ``price_array``, ``volatility_array``, ``liquidity_array``: float64
+      arrays indexed by ``symbol_index``.
+    - ``sector_ids``: sectors interned to integer ids (positions into
+      ``sector_list``).
+    - ``universe``: the same per-symbol columns as a Polars DataFrame for
+      join/group-by access (built lazily on first access).
+
+    The fields remain the source of truth for exact arithmetic.
+
     Attributes:
         current_bars: Most recent bar for each symbol.
         volatility: ATR or range-based volatility per symbol.
         liquidity: Average daily volume per symbol.
         sector_map: Symbol to sector mapping (optional).
-        correlations: Pairwise correlation matrix (optional).
+        correlations: Pairwise correlations (optional). Accepts a
+            CorrelationMatrix, a dict keyed by (symbol, symbol) pairs, a
+            long-format polars DataFrame (sym_a, sym_b, corr), or a square
+            array (or nested list) indexed by symbol_index; always stored
+            as a CorrelationMatrix.
         borrow_rates: Per-symbol annualized borrow rates (optional).
         regime: Market regime label (optional).
         timestamp: State snapshot time (UTC, timezone-aware).
@@ -253,9 +624,13 @@ class MarketState(BaseModel):
         ... )
     """
 
-    model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
+    # Snapshots are immutable once built: an existing instance passed where
+    # a MarketState is expected is reused, never copied or re-validated.
+    model_config = ConfigDict(
+        frozen=True, arbitrary_types_allowed=True, revalidate_instances="never"
+    )
 
-    current_bars: dict[str, Any] = Field(
+    current_bars: dict[str, Bar] = Field(
         description="Most recent bar for each symbol (symbol -> Bar)",
     )
     volatility: dict[str, Decimal] = Field(
@@ -268,9 +643,9 @@ class MarketState(BaseModel):
         default=None,
         description="Symbol to sector mapping",
     )
-    correlations: Any | None = Field(
+    correlations: CorrelationMatrix | None = Field(
         default=None,
-        description="Pairwise correlation matrix (polars.DataFrame)",
+        description="Pairwise correlations (from pair dict, polars frame or square array)",
     )
     borrow_rates: dict[str, Decimal] | None = Field(
         default=None,
@@ -284,6 +659,147 @@ class MarketState(BaseModel):
         description="State snapshot time (UTC, timezone-aware)",
     )
 
+    _arrays: _MarketArrays = PrivateAttr()
+
+    def model_post_init(self, __context: Any) -> None:
+        """Build the float64 array views once per snapshot."""
+        self._arrays = _MarketArrays(
+            self.current_bars, self.volatility, self.liquidity, self.sector_map
+        )
+
+    def model_copy(self, *, update: Mapping[str, Any] | None = None, deep: bool = False) -> Self:
+        """Copy the snapshot, rebuilding the derived views if fields are updated.
+
+        pydantic does not rerun model_post_init on copies, so without this a
+        copy with new bars would keep the original prices.
+        """
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            copied.model_post_init(None)
+        return copied
+
+    @property
+    def close_prices(self) -> dict[str, Decimal]:
+        """Close price per symbol, extracted once from current_bars."""
+        return self._arrays.close_prices
+
+    @property
+    def symbol_index(self) -> dict[str, int]:
+        """Symbol to position in the float64 arrays (symbols with bar data only)."""
+        return self._arrays.symbol_index
+
+    @property
+    def price_array(self) -> NDArray[np.float64]:
+        """Close prices as a read-only float64 array, aligned with symbol_index."""
+        return self._arrays.prices
+
+    @property
+    def volatility_array(self) -> NDArray[np.float64]:
+        """Volatility as a read-only float64 array (NaN if missing)."""
+        return self._arrays.volatility
+
+    @property
+    def liquidity_array(self) -> NDArray[np.float64]:
+        """Liquidity as a read-only float64 array (NaN if missing)."""
+        return self._arrays.liquidity
+
+    @property
+    def correlation_index(self) -> dict[str, int]:
+        """Symbol to row/column of correlation_matrix (empty without correlations)."""
+        return self.correlations.index if self.correlations is not None else {}
+
+    @property
+    def correlation_symbols(self) -> list[str]:
+        """Symbols in correlation_matrix order (empty without correlations)."""
+        return self.correlations.symbols if self.correlations is not None else []
+
+    @property
+    def correlation_matrix(self) -> NDArray[np.float64] | None:
+        """Dense read-only correlation matrix (NaN = no data), or None."""
+        return self.correlations.values if self.correlations is not None else None
+
+    @property
+    def sector_list(self) -> list[str]:
+        """Distinct sectors in sorted order; a sector's id is its position here."""
+        return self._arrays.sectors
+
+    @property
+    def sector_index(self) -> dict[str, int]:
+        """Sector to id (position in sector_list)."""
+        return self._arrays.sector_index
+
+    @property
+    def sector_ids(self) -> NDArray[np.int32]:
+        """Sector id per symbol as a read-only int32 array (-1 if unmapped)."""
+        return self._arrays.sector_ids
+
+    @property
+    def universe(self) -> pl.DataFrame:
+        """Per-symbol table aligned with symbol_index.
+
+        Columns: symbol, price, vol, liquidity (float64, null if missing),
+        sector (categorical, null if unmapped) and sector_id (int32, -1 if
+        unmapped). Batch orders can be joined on "symbol".
+        """
+        return self._arrays.universe_frame()
+
+    @field_validator(
+        "current_bars", "volatility", "liquidity", "sector_map", "borrow_rates", mode="after"
+    )
+    @classmethod
+    def intern_symbol_keys(cls, v: dict[str, Any] | None) -> dict[str, Any] | None:
+        """Intern symbol keys so lookups with interned symbols compare by identity."""
+        if v is None:
+            return v
+        return {sys.intern(symbol): value for symbol, value in v.items()}
+
+    @field_validator("correlations", mode="before")
+    @classmethod
+    def build_correlation_matrix(cls, v: Any, info: ValidationInfo) -> CorrelationMatrix | None:
+        """Convert pair dicts and arrays to a CorrelationMatrix once.
+
+        Rows start with the symbols that have bar data, in current_bars
+        order, so the matrix lines up with symbol_index.
+        """
+        if v is None or isinstance(v, CorrelationMatrix):
+            return v
+        bars = info.data.get("current_bars") or {}
+        symbols = [s for s, bar in bars.items() if bar is not None]
+        if isinstance(v, dict):
+            return CorrelationMatrix.from_pairs(v, symbols)
+        # A Polars frame can only be passed if polars is already imported
+        if "polars" in sys.modules and isinstance(v, sys.modules["polars"].DataFrame):
+            return CorrelationMatrix.from_frame(v, symbols)
+        if isinstance(v, np.ndarray | list):
+            # Nested lists are how a square matrix arrives from JSON
+            return CorrelationMatrix.from_array(v, symbols)
+        raise ValueError(
+            "correlations must be a CorrelationMatrix, a {(symbol, symbol): corr} dict, "
+            f"a (sym_a, sym_b, corr) polars DataFrame or a square array, got {type(v).__name__}"
+        )
+
+    @classmethod
+    def from_json(cls, raw: str | bytes) -> MarketState:
+        """Validate a MarketState directly from JSON.
+
+        Uses ``model_validate_json``, so pydantic's core parses and
+        validates in one pass without building an intermediate Python
+        dict. Prefer handing raw bytes from a feed over parsing them
+        first. Decimal fields accept JSON strings (exact) or numbers;
+        correlations, if present, must be a nested list ordered like
+        the symbols in current_bars.
+
+        Args:
+            raw: JSON document.
+
+        Returns:
+            Validated MarketState.
+
+        Raises:
+            pydantic.ValidationError: If the document is malformed or invalid.
+        """
+        return cls.model_validate_json(raw)
+
     @field_validator("timestamp")
     @classmethod
     def validate_timestamp_timezone(cls, v: datetime) -> datetime:
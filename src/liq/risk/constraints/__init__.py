@@ -4,6 +4,11 @@ This module provides various risk constraints that implement
 the Constraint protocol.
 """
 
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
 __all__ = [
     "MaxPositionConstraint",
     "MaxPositionsConstraint",
@@ -22,18 +27,52 @@ __all__ = [
     "create_frequency_cap",
 ]
 
-from liq.risk.constraints.buying_power import BuyingPowerConstraint
-from liq.risk.constraints.correlation import CorrelationConstraint
-from liq.risk.constraints.frequency_cap import (
-    FrequencyCapConfig,
-    FrequencyCapConstraint,
-    Timeframe,
-    create_frequency_cap,
-)
-from liq.risk.constraints.leverage import GrossLeverageConstraint
-from liq.risk.constraints.min_value import MinPositionValueConstraint
-from liq.risk.constraints.net_leverage import NetLeverageConstraint
-from liq.risk.constraints.position import MaxPositionConstraint, MaxPositionsConstraint
-from liq.risk.constraints.pyramiding import PyramidingConstraint, PyramidingState
-from liq.risk.constraints.sector import SectorExposureConstraint
-from liq.risk.constraints.short_selling import ShortSellingConstraint
+if TYPE_CHECKING:
+    from liq.risk.constraints.buying_power import BuyingPowerConstraint
+    from liq.risk.constraints.correlation import CorrelationConstraint
+    from liq.risk.constraints.frequency_cap import (
+        FrequencyCapConfig,
+        FrequencyCapConstraint,
+        Timeframe,
+        create_frequency_cap,
+    )
+    from liq.risk.constraints.leverage import GrossLeverageConstraint
+    from liq.risk.constraints.min_value import MinPositionValueConstraint
+    from liq.risk.constraints.net_leverage import NetLeverageConstraint
+    from liq.risk.constraints.position import MaxPositionConstraint, MaxPositionsConstraint
+    from liq.risk.constraints.pyramiding import PyramidingConstraint, PyramidingState
+    from liq.risk.constraints.sector import SectorExposureConstraint
+    from liq.risk.constraints.short_selling import ShortSellingConstraint
+
+# Submodules are imported on first attribute access (PEP 562), so importing
+# one constraint does not load the others.
+_LAZY: dict[str, str] = {
+    "BuyingPowerConstraint": "buying_power",
+    "CorrelationConstraint": "correlation",
+    "FrequencyCapConfig": "frequency_cap",
+    "FrequencyCapConstraint": "frequency_cap",
+    "Timeframe": "frequency_cap",
+    "create_frequency_cap": "frequency_cap",
+    "GrossLeverageConstraint": "leverage",
+    "MinPositionValueConstraint": "min_value",
+    "NetLeverageConstraint": "net_leverage",
+    "MaxPositionConstraint": "position",
+    "MaxPositionsConstraint": "position",
+    "PyramidingConstraint": "pyramiding",
+    "PyramidingState": "pyramiding",
+    "SectorExposureConstraint": "sector",
+    "ShortSellingConstraint": "short_selling",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -6,11 +6,14 @@ BuyingPowerConstraint: Limits buy orders to available cash.
 from __future__ import annotations
 
 import logging
-from decimal import ROUND_DOWN, Decimal
+from decimal import Decimal
 from typing import TYPE_CHECKING
 
+import numpy as np
 from liq.core import OrderRequest, OrderSide
 
+from liq.risk._fast import batch_notional, clears
+from liq.risk._portfolio import is_risk_increasing
 from liq.risk.types import ConstraintResult, RejectedOrder
 
 if TYPE_CHECKING:
@@ -57,13 +60,7 @@ class BuyingPowerConstraint:
         Returns:
             True if risk-increasing, False if risk-reducing.
         """
-        position = portfolio_state.positions.get(order.symbol)
-        current_qty = position.quantity if position else Decimal("0")
-
-        if order.side == OrderSide.BUY:
-            return current_qty >= 0
-        else:
-            return current_qty <= 0
+        return is_risk_increasing(order, portfolio_state)
 
     def apply(
         self,
@@ -94,47 +91,70 @@ class BuyingPowerConstraint:
         cost_multiplier = Decimal("1") + commission_pct + slippage_pct
 
         # Separate buy and sell orders
+        symbol_index = market_state.symbol_index
         sell_orders: list[OrderRequest] = []
-        buy_orders: list[tuple[OrderRequest, Decimal]] = []  # (order, cost)
+        candidate_buys: list[OrderRequest] = []
+        candidate_indices: list[int] = []
 
         for order in orders:
-            if order.side == OrderSide.SELL:
+            if order.side is OrderSide.SELL:
                 # Sell orders pass freely
                 sell_orders.append(order)
-            else:
-                # Buy orders need cash check
-                bar = market_state.current_bars.get(order.symbol)
-                if bar is None:
-                    rejected.append(
-                        RejectedOrder(
-                            order=order,
-                            constraint_name=self.name,
-                            reason=f"No bar data for {order.symbol}",
-                        )
+                continue
+
+            # Buy orders need cash check
+            idx = symbol_index.get(order.symbol)
+            if idx is None:
+                rejected.append(
+                    RejectedOrder(
+                        order=order,
+                        constraint_name=self.name,
+                        reason=f"No bar data for {order.symbol}",
                     )
-                    continue
+                )
+                continue
 
-                price = bar.close
-                order_cost = order.quantity * price * cost_multiplier
-                buy_orders.append((order, order_cost))
+            candidate_buys.append(order)
+            candidate_indices.append(idx)
 
         # Start with sell orders (always pass)
         result: list[OrderRequest] = list(sell_orders)
 
-        if not buy_orders:
+        if not candidate_buys:
+            return ConstraintResult(orders=result, rejected=rejected, warnings=warnings)
+
+        # Fast path: estimate the batch cost in float64. Only a clear pass
+        # (beyond float rounding error) skips the exact Decimal accounting.
+        quantities = np.fromiter(
+            (float(o.quantity) for o in candidate_buys),
+            dtype=np.float64,
+            count=len(candidate_buys),
+        )
+        estimated_cost = batch_notional(
+            market_state.price_array, candidate_indices, quantities
+        ) * float(cost_multiplier)
+        if clears(estimated_cost, float(cash)):
+            result.extend(candidate_buys)
             return ConstraintResult(orders=result, rejected=rejected, warnings=warnings)
 
+        close_prices = market_state.close_prices
+        # (order, cost, price): each close is looked up once and reused when scaling
+        buy_orders: list[tuple[OrderRequest, Decimal, Decimal]] = []
+        for order in candidate_buys:
+            price = close_prices[order.symbol]
+            buy_orders.append((order, order.quantity * price * cost_multiplier, price))
+
         # Calculate total buy cost
-        total_buy_cost = sum(cost for _, cost in buy_orders)
+        total_buy_cost = sum(cost for _, cost, _ in buy_orders)
 
         if total_buy_cost <= cash:
             # All buys fit within cash
-            result.extend(order for order, _ in buy_orders)
+            result.extend(order for order, _, _ in buy_orders)
             return ConstraintResult(orders=result, rejected=rejected, warnings=warnings)
 
         if cash <= 0:
             # No cash available, no buys allowed
-            for order, _ in buy_orders:
+            for order, _, _ in buy_orders:
                 rejected.append(
                     RejectedOrder(
                         order=order,
@@ -147,35 +167,14 @@ class BuyingPowerConstraint:
         # Scale down proportionally
         scale_factor = cash / total_buy_cost
 
-        for order, order_cost in buy_orders:
-            bar = market_state.current_bars.get(order.symbol)
-            if bar is None:
-                continue
-
-            price = bar.close
+        for order, order_cost, price in buy_orders:
             # Calculate scaled cost and back-calculate quantity
             scaled_cost = order_cost * scale_factor
             # Quantity = cost / (price * cost_multiplier)
-            scaled_quantity = (scaled_cost / (price * cost_multiplier)).to_integral_value(
-                rounding=ROUND_DOWN
-            )
+            scaled_quantity = scaled_cost // (price * cost_multiplier)
 
             if scaled_quantity >= 1:
-                new_order = OrderRequest(
-                    client_order_id=order.client_order_id,
-                    symbol=order.symbol,
-                    side=order.side,
-                    order_type=order.order_type,
-                    quantity=scaled_quantity,
-                    limit_price=order.limit_price,
-                    stop_price=order.stop_price,
-                    time_in_force=order.time_in_force,
-                    timestamp=order.timestamp,
-                    policy_id=order.policy_id,
-                    confidence=order.confidence,
-                    tags=order.tags,
-                    metadata=order.metadata,
-                )
+                new_order = order.model_copy(update={"quantity": scaled_quantity})
                 result.append(new_order)
                 if scaled_quantity < order.quantity:
                     rejected.append(
@@ -5,11 +5,12 @@ CorrelationConstraint: Limits exposure to highly correlated assets.
 
 from __future__ import annotations
 
-from decimal import Decimal
 from typing import TYPE_CHECKING
 
+import numpy as np
 from liq.core import OrderRequest, OrderSide
 
+from liq.risk._portfolio import is_risk_increasing
 from liq.risk.types import ConstraintResult, RejectedOrder
 
 if TYPE_CHECKING:
@@ -32,6 +33,10 @@ class CorrelationConstraint:
     Sell orders always pass (reduce exposure).
     Missing correlation data is treated as allowed.
 
+    Correlations are read from the dense ``MarketState.correlations``
+    matrix (built once per MarketState), so the check against existing
+    positions is one vectorized comparison for the whole batch.
+
     Example:
         >>> constraint = CorrelationConstraint()
         >>> result = constraint.apply(orders, portfolio, market, config)
@@ -58,13 +63,7 @@ class CorrelationConstraint:
         Returns:
             True if risk-increasing, False if risk-reducing.
         """
-        position = portfolio_state.positions.get(order.symbol)
-        current_qty = position.quantity if position else Decimal("0")
-
-        if order.side == OrderSide.BUY:
-            return current_qty >= 0
-        else:
-            return current_qty <= 0
+        return is_risk_increasing(order, portfolio_state)
 
     def apply(
         self,
@@ -96,30 +95,79 @@ class CorrelationConstraint:
             return ConstraintResult(orders=list(orders), rejected=rejected, warnings=warnings)
 
         # If no correlation data, pass all orders through
-        correlations = market_state.correlations
-        if correlations is None:
+        corr = market_state.correlation_matrix
+        if corr is None:
             return ConstraintResult(orders=list(orders), rejected=rejected, warnings=warnings)
 
-        # Get existing position symbols
-        existing_symbols: set[str] = set(portfolio_state.positions.keys())
+        corr_index = market_state.correlation_index
+        corr_symbols = market_state.correlation_symbols
+
+        # Sides are enum singletons: compare by identity against a local
+        sell = OrderSide.SELL
+
+        # Matrix rows of candidate buys (-1 = no correlation data, always allowed)
+        candidate_indices = np.fromiter(
+            (corr_index.get(o.symbol, -1) for o in orders if o.side is not sell),
+            dtype=np.intp,
+        )
+        known_indices = candidate_indices[candidate_indices >= 0]
 
-        # Track accepted symbols for this batch
-        accepted_symbols: set[str] = set()
+        # Sells always pass, so with no buys that have correlation data there
+        # is nothing to check (common in sell-heavy rebalances)
+        if not known_indices.size:
+            return ConstraintResult(orders=list(orders), rejected=rejected, warnings=warnings)
+
+        # Existing positions as matrix columns (symbols without data can't conflict)
+        existing_indices = np.fromiter(
+            (corr_index[s] for s in portfolio_state.positions if s in corr_index),
+            dtype=np.intp,
+        )
+
+        # Compare all known buys against existing positions and against each
+        # other in two broadcast tiles. NaN (missing pair, diagonal) compares
+        # False, i.e. allowed. Negative correlations are allowed (hedging).
+        existing_hits = corr[np.ix_(known_indices, existing_indices)] > max_correlation
+        batch_hits = corr[np.ix_(known_indices, known_indices)] > max_correlation
+        if not existing_hits.any() and not batch_hits.any():
+            return ConstraintResult(orders=list(orders), rejected=rejected, warnings=warnings)
+
+        # Rejection reason with the threshold pre-formatted once per call
+        reason_template = f"Highly correlated with {{}} (max correlation {max_correlation:.2f})"
+
+        # Batch conflicts only count against orders accepted earlier, so walk
+        # the buys in order with a cumulative accepted mask. Per-row flags let
+        # orders with no possible conflict skip the row scan entirely.
+        hits_existing = existing_hits.any(axis=1).tolist()
+        hits_batch = batch_hits.any(axis=1).tolist()
+        accepted = np.zeros(len(known_indices), dtype=bool)
+        row_hits = np.empty(len(known_indices), dtype=bool)
 
         result: list[OrderRequest] = []
+        candidate = -1
+        known = -1
 
         for order in orders:
             # Sell orders always pass (reduce exposure)
-            if order.side == OrderSide.SELL:
+            if order.side is sell:
                 result.append(order)
                 continue
 
-            # Check correlation with existing positions and accepted orders
-            all_check_symbols = existing_symbols | accepted_symbols
-
-            correlated_with = self._find_highly_correlated(
-                order.symbol, all_check_symbols, correlations, max_correlation
-            )
+            candidate += 1
+            if candidate_indices[candidate] < 0:
+                # No correlation data for this symbol - allow
+                result.append(order)
+                continue
+            known += 1
+
+            # Check correlation with existing positions, then accepted orders
+            correlated_with: str | None = None
+            if hits_existing[known]:
+                first = existing_hits[known].argmax()
+                correlated_with = corr_symbols[existing_indices[first]]
+            elif hits_batch[known]:
+                np.logical_and(batch_hits[known], accepted, out=row_hits)
+                if row_hits.any():
+                    correlated_with = corr_symbols[known_indices[row_hits.argmax()]]
 
             if correlated_with is not None:
                 # Skip this order - too correlated
@@ -127,52 +175,13 @@ class CorrelationConstraint:
                     RejectedOrder(
                         order=order,
                         constraint_name=self.name,
-                        reason=f"Highly correlated with {correlated_with} "
-                        f"(max correlation {max_correlation:.2f})",
+                        reason=reason_template.format(correlated_with),
                     )
                 )
                 continue
 
             # Accept the order
             result.append(order)
-            accepted_symbols.add(order.symbol)
+            accepted[known] = True
 
         return ConstraintResult(orders=result, rejected=rejected, warnings=warnings)
-
-    def _find_highly_correlated(
-        self,
-        symbol: str,
-        check_symbols: set[str],
-        correlations: dict[tuple[str, str], float],
-        max_correlation: float,
-    ) -> str | None:
-        """Find a symbol highly correlated with this one.
-
-        Args:
-            symbol: Symbol to check.
-            check_symbols: Symbols to check correlation against.
-            correlations: Correlation matrix as dict.
-            max_correlation: Maximum allowed correlation.
-
-        Returns:
-            Symbol that is highly correlated, or None if none found.
-        """
-        for check_symbol in check_symbols:
-            if check_symbol == symbol:
-                continue
-
-            # Try both orderings of the pair
-            corr = correlations.get((symbol, check_symbol))
-            if corr is None:
-                corr = correlations.get((check_symbol, symbol))
-
-            if corr is None:
-                # No correlation data for this pair - allow
-                continue
-
-            # Check if absolute correlation exceeds threshold
-            # Negative correlations are allowed (hedging)
-            if corr > max_correlation:
-                return check_symbol
-
-        return None
@@ -6,6 +6,8 @@ Configurable as N trades per Y timeframe (minute, hour, day, week, etc.).
 
 from __future__ import annotations
 
+import bisect
+import sys
 from collections import deque
 from dataclasses import dataclass
 from datetime import datetime, timedelta
@@ -15,9 +17,12 @@ from typing import TYPE_CHECKING
 
 from liq.core import OrderRequest, OrderSide
 
+from liq.risk._portfolio import is_risk_increasing
 from liq.risk.types import ConstraintResult, RejectedOrder
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from liq.core import PortfolioState
 
     from liq.risk.config import MarketState, RiskConfig
@@ -57,34 +62,9 @@ class Timeframe(Enum):
         """
         s = s.lower().strip()
 
-        # Direct matches
-        mapping = {
-            "second": cls.SECOND,
-            "sec": cls.SECOND,
-            "s": cls.SECOND,
-            "1s": cls.SECOND,
-            "minute": cls.MINUTE,
-            "min": cls.MINUTE,
-            "m": cls.MINUTE,
-            "1m": cls.MINUTE,
-            "hour": cls.HOUR,
-            "hr": cls.HOUR,
-            "h": cls.HOUR,
-            "1h": cls.HOUR,
-            "day": cls.DAY,
-            "d": cls.DAY,
-            "1d": cls.DAY,
-            "week": cls.WEEK,
-            "wk": cls.WEEK,
-            "w": cls.WEEK,
-            "1w": cls.WEEK,
-            "month": cls.MONTH,
-            "mo": cls.MONTH,
-            "1mo": cls.MONTH,
-        }
-
-        if s in mapping:
-            return mapping[s]
+        timeframe = _TIMEFRAME_ALIASES.get(s)
+        if timeframe is not None:
+            return timeframe
 
         raise ValueError(
             f"Unknown timeframe: {s}. Valid options: second, minute, hour, day, week, month"
@@ -95,7 +75,34 @@ class Timeframe(Enum):
         return timedelta(seconds=self.value)
 
 
-@dataclass
+# Accepted spellings for Timeframe.from_string, keyed by lowercased name
+_TIMEFRAME_ALIASES: dict[str, Timeframe] = {
+    "second": Timeframe.SECOND,
+    "sec": Timeframe.SECOND,
+    "s": Timeframe.SECOND,
+    "1s": Timeframe.SECOND,
+    "minute": Timeframe.MINUTE,
+    "min": Timeframe.MINUTE,
+    "m": Timeframe.MINUTE,
+    "1m": Timeframe.MINUTE,
+    "hour": Timeframe.HOUR,
+    "hr": Timeframe.HOUR,
+    "h": Timeframe.HOUR,
+    "1h": Timeframe.HOUR,
+    "day": Timeframe.DAY,
+    "d": Timeframe.DAY,
+    "1d": Timeframe.DAY,
+    "week": Timeframe.WEEK,
+    "wk": Timeframe.WEEK,
+    "w": Timeframe.WEEK,
+    "1w": Timeframe.WEEK,
+    "month": Timeframe.MONTH,
+    "mo": Timeframe.MONTH,
+    "1mo": Timeframe.MONTH,
+}
+
+
+@dataclass(frozen=True, slots=True)
 class FrequencyCapConfig:
     """Configuration for a frequency cap rule.
 
@@ -116,7 +123,7 @@ class FrequencyCapConfig:
     per_symbol: bool = True
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TradeRecord:
     """Record of a trade for frequency tracking.
 
@@ -183,10 +190,39 @@ class FrequencyCapConstraint:
                 raise ValueError(f"max_trades must be >= 1, got {cap.max_trades}")
 
         self._caps = caps
-        self._trade_history: deque[TradeRecord] = deque(trade_history or [])
+        # Window lengths (in seconds) and message labels are fixed per cap,
+        # so resolve them once rather than per order
+        self._cap_durations = [float(cap.timeframe.value) for cap in caps]
+        self._cap_labels = [cap.timeframe.name.lower() for cap in caps]
+
+        # Trade history is stored column-wise: POSIX timestamps and symbols
+        # in parallel lists, sorted by time, so range counts and pruning are
+        # a bisect and the remaining scans run over contiguous lists
+        self._timestamps: list[float] = []
+        self._symbols: list[str] = []
+
+        # Sliding window per cap, keyed by symbol (or None for global caps).
+        # Each deque holds trade timestamps in ascending order, so expired
+        # trades are popped from the front and a cap check is a len().
+        self._cap_windows: list[dict[str | None, deque[float]]] = [{} for _ in caps]
+        # Time of the last apply(); windows only slide forward, so an earlier
+        # time (e.g. a replayed backtest) rebuilds them from the history
+        self._last_now: float | None = None
+        for record in trade_history or []:
+            self._append(record.symbol, record.timestamp.timestamp())
 
         # Calculate max history retention (longest cap window + buffer)
-        self._max_history_duration = max(cap.timeframe.to_timedelta() for cap in caps)
+        self._max_history_seconds = max(self._cap_durations) + 60.0  # Small buffer
+
+        # A single cap (the default) is checked without the per-cap loop
+        self._check_order: Callable[[OrderRequest, dict[str, int], int], str | None]
+        if len(caps) == 1:
+            self._single_per_symbol = caps[0].per_symbol
+            self._single_max_trades = caps[0].max_trades
+            self._single_windows = self._cap_windows[0]
+            self._check_order = self._check_single_cap
+        else:
+            self._check_order = self._check_caps
 
     @property
     def name(self) -> str:
@@ -214,13 +250,7 @@ class FrequencyCapConstraint:
         Returns:
             True if risk-increasing, False if risk-reducing.
         """
-        position = portfolio_state.positions.get(order.symbol)
-        current_qty = position.quantity if position else Decimal("0")
-
-        if order.side == OrderSide.BUY:
-            return current_qty >= 0
-        else:
-            return current_qty <= 0
+        return is_risk_increasing(order, portfolio_state)
 
     def apply(
         self,
@@ -242,24 +272,35 @@ class FrequencyCapConstraint:
         """
         rejected: list[RejectedOrder] = []
         warnings: list[str] = []
-        result: list[OrderRequest] = []
+        # Accepted orders, materialised only once an order is rejected;
+        # until then the accepted orders are a prefix of the input
+        result: list[OrderRequest] | None = None
 
         # Get current time from market state or orders
         now = market_state.timestamp
 
-        # Prune old history
-        self._prune_history(now)
+        # Prune old history and slide each cap window up to now
+        now_ts = now.timestamp()
+        self._prune_history(now_ts)
+        window_starts = [now_ts - duration for duration in self._cap_durations]
+        if self._last_now is not None and now_ts < self._last_now:
+            self._rebuild_windows(window_starts)
+        else:
+            self._advance_windows(window_starts)
+        self._last_now = now_ts
 
         # Track how many orders we're accepting in this batch
         # (for proper accounting within a single apply() call)
         batch_trades_by_symbol: dict[str, int] = {}
         batch_trades_global = 0
 
-        for order in orders:
+        for i, order in enumerate(orders):
             # Check all caps
-            violation = self._check_caps(order, now, batch_trades_by_symbol, batch_trades_global)
+            violation = self._check_order(order, batch_trades_by_symbol, batch_trades_global)
 
             if violation:
+                if result is None:
+                    result = orders[:i]
                 rejected.append(
                     RejectedOrder(
                         order=order,
@@ -268,19 +309,21 @@ class FrequencyCapConstraint:
                     )
                 )
             else:
-                result.append(order)
+                if result is not None:
+                    result.append(order)
                 # Track this order for remaining orders in batch
                 batch_trades_by_symbol[order.symbol] = (
                     batch_trades_by_symbol.get(order.symbol, 0) + 1
                 )
                 batch_trades_global += 1
 
+        if result is None:
+            result = list(orders)
         return ConstraintResult(orders=result, rejected=rejected, warnings=warnings)
 
     def _check_caps(
         self,
         order: OrderRequest,
-        now: datetime,
         batch_by_symbol: dict[str, int],
         batch_global: int,
     ) -> str | None:
@@ -288,51 +331,140 @@ class FrequencyCapConstraint:
 
         Args:
             order: Order to check.
-            now: Current timestamp.
             batch_by_symbol: Orders accepted in current batch by symbol.
             batch_global: Total orders accepted in current batch.
 
         Returns:
             Violation message if violated, None if OK.
         """
-        for cap in self._caps:
-            window_start = now - cap.timeframe.to_timedelta()
-
+        for index, (cap, windows) in enumerate(zip(self._caps, self._cap_windows, strict=True)):
             if cap.per_symbol:
-                # Count trades for this symbol in window
-                history_count = sum(
-                    1
-                    for t in self._trade_history
-                    if t.symbol == order.symbol and t.timestamp >= window_start
-                )
+                window = windows.get(order.symbol)
                 batch_count = batch_by_symbol.get(order.symbol, 0)
-                total_count = history_count + batch_count
-
-                if total_count >= cap.max_trades:
-                    return (
-                        f"Frequency cap exceeded for {order.symbol}: "
-                        f"{total_count} trades in {cap.timeframe.name.lower()} "
-                        f"(max {cap.max_trades})"
-                    )
             else:
-                # Count all trades in window
-                history_count = sum(1 for t in self._trade_history if t.timestamp >= window_start)
-                total_count = history_count + batch_global
-
-                if total_count >= cap.max_trades:
-                    return (
-                        f"Global frequency cap exceeded: "
-                        f"{total_count} trades in {cap.timeframe.name.lower()} "
-                        f"(max {cap.max_trades})"
-                    )
+                window = windows.get(None)
+                batch_count = batch_global
+            history_count = len(window) if window is not None else 0
+            total_count = history_count + batch_count
+
+            if total_count >= cap.max_trades:
+                return self._violation(index, order.symbol, total_count)
 
         return None
 
-    def _prune_history(self, now: datetime) -> None:
+    def _check_single_cap(
+        self,
+        order: OrderRequest,
+        batch_by_symbol: dict[str, int],
+        batch_global: int,
+    ) -> str | None:
+        """Check an order against the only cap (the default configuration).
+
+        Same result as _check_caps, without the per-cap loop.
+        """
+        if self._single_per_symbol:
+            window = self._single_windows.get(order.symbol)
+            batch_count = batch_by_symbol.get(order.symbol, 0)
+        else:
+            window = self._single_windows.get(None)
+            batch_count = batch_global
+        total_count = (len(window) if window is not None else 0) + batch_count
+
+        if total_count >= self._single_max_trades:
+            return self._violation(0, order.symbol, total_count)
+        return None
+
+    def _violation(self, index: int, symbol: str, total_count: int) -> str:
+        """Rejection reason for an order that would exceed cap ``index``."""
+        cap = self._caps[index]
+        label = self._cap_labels[index]
+        if cap.per_symbol:
+            return (
+                f"Frequency cap exceeded for {symbol}: "
+                f"{total_count} trades in {label} "
+                f"(max {cap.max_trades})"
+            )
+        return (
+            f"Global frequency cap exceeded: {total_count} trades in {label} (max {cap.max_trades})"
+        )
+
+    def _prune_history(self, now: float) -> None:
         """Remove trade records older than the max history duration."""
-        cutoff = now - self._max_history_duration - timedelta(minutes=1)  # Small buffer
-        while self._trade_history and self._trade_history[0].timestamp < cutoff:
-            self._trade_history.popleft()
+        cutoff = now - self._max_history_seconds
+        expired = bisect.bisect_left(self._timestamps, cutoff)
+        if expired:
+            del self._timestamps[:expired]
+            del self._symbols[:expired]
+
+    def _advance_windows(self, window_starts: list[float]) -> None:
+        """Drop trades that have slid out of each cap's window.
+
+        Windows are keyed by symbol for per-symbol caps; a symbol whose
+        window empties is removed so idle symbols don't accumulate.
+
+        Args:
+            window_starts: Start of the current window for each cap, as a
+                POSIX timestamp.
+        """
+        for window_start, windows in zip(window_starts, self._cap_windows, strict=True):
+            for key in list(windows):
+                window = windows[key]
+                while window and window[0] < window_start:
+                    window.popleft()
+                if not window:
+                    del windows[key]
+
+    def _rebuild_windows(self, window_starts: list[float]) -> None:
+        """Refill each cap's window from the retained trade history.
+
+        Used when time moves backwards, since _advance_windows has already
+        dropped trades that fall back inside the earlier window.
+
+        Args:
+            window_starts: Start of the current window for each cap, as a
+                POSIX timestamp.
+        """
+        timestamps = self._timestamps
+        symbols = self._symbols
+        for window_start, cap, windows in zip(
+            window_starts, self._caps, self._cap_windows, strict=True
+        ):
+            windows.clear()
+            start = bisect.bisect_left(timestamps, window_start)
+            for index in range(start, len(timestamps)):
+                key = symbols[index] if cap.per_symbol else None
+                window = windows.get(key)
+                if window is None:
+                    windows[key] = deque([timestamps[index]])
+                else:
+                    window.append(timestamps[index])
+
+    def _append(self, symbol: str, timestamp: float) -> None:
+        """Add a trade to the history and every cap window it counts towards.
+
+        The symbol is interned, matching MarketState's symbol keys, so
+        symbol comparisons against it usually succeed on identity.
+        """
+        symbol = sys.intern(symbol)
+        timestamps = self._timestamps
+        if not timestamps or timestamp >= timestamps[-1]:
+            timestamps.append(timestamp)
+            self._symbols.append(symbol)
+        else:
+            # Late fill reported out of order: keep the history sorted
+            position = bisect.bisect_right(timestamps, timestamp)
+            timestamps.insert(position, timestamp)
+            self._symbols.insert(position, symbol)
+        for cap, windows in zip(self._caps, self._cap_windows, strict=True):
+            key = symbol if cap.per_symbol else None
+            window = windows.get(key)
+            if window is None:
+                windows[key] = deque([timestamp])
+            elif not window or timestamp >= window[-1]:
+                window.append(timestamp)
+            else:
+                # Late fill reported out of order: keep the window sorted
+                bisect.insort(window, timestamp)
 
     def record_trade(
         self,
@@ -343,7 +475,9 @@ class FrequencyCapConstraint:
     ) -> None:
         """Record a completed trade for frequency tracking.
 
-        Call this after an order is filled to update trade history.
+        Call this after an order is filled to update trade history. Only
+        the symbol and time count towards caps, so side and quantity are
+        not retained.
 
         Args:
             symbol: Symbol traded.
@@ -351,13 +485,7 @@ class FrequencyCapConstraint:
             side: Order side.
             quantity: Quantity filled.
         """
-        record = TradeRecord(
-            symbol=symbol,
-            timestamp=timestamp,
-            side=side,
-            quantity=quantity,
-        )
-        self._trade_history.append(record)
+        self._append(symbol, timestamp.timestamp())
 
     def get_trade_count(
         self,
@@ -373,18 +501,23 @@ class FrequencyCapConstraint:
         Returns:
             Number of matching trades.
         """
-        count = 0
-        for record in self._trade_history:
-            if symbol is not None and record.symbol != symbol:
-                continue
-            if since is not None and record.timestamp < since:
-                continue
-            count += 1
-        return count
+        if since is None:
+            if symbol is None:
+                return len(self._timestamps)
+            return self._symbols.count(symbol)
+
+        start = bisect.bisect_left(self._timestamps, since.timestamp())
+        if symbol is None:
+            return len(self._timestamps) - start
+        return self._symbols[start:].count(symbol)
 
     def clear_history(self) -> None:
         """Clear all trade history."""
-        self._trade_history.clear()
+        self._timestamps.clear()
+        self._symbols.clear()
+        for windows in self._cap_windows:
+            windows.clear()
+        self._last_now = None
 
 
 def create_frequency_cap(
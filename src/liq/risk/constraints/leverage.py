@@ -5,11 +5,14 @@ GrossLeverageConstraint: Limits total gross exposure / equity ratio.
 
 from __future__ import annotations
 
-from decimal import ROUND_DOWN, Decimal
+from decimal import Decimal
 from typing import TYPE_CHECKING
 
+import numpy as np
 from liq.core import OrderRequest, OrderSide
 
+from liq.risk._fast import batch_notional, clears, screened_floor, symbol_indices
+from liq.risk._portfolio import exposures, is_risk_increasing
 from liq.risk.types import ConstraintResult, RejectedOrder
 
 if TYPE_CHECKING:
@@ -17,6 +20,8 @@ if TYPE_CHECKING:
 
     from liq.risk.config import MarketState, RiskConfig
 
+_ZERO = Decimal("0")
+
 
 class GrossLeverageConstraint:
     """Limit total gross exposure as multiple of equity.
@@ -57,15 +62,7 @@ class GrossLeverageConstraint:
         Returns:
             True if risk-increasing, False if risk-reducing.
         """
-        position = portfolio_state.positions.get(order.symbol)
-        current_qty = position.quantity if position else Decimal("0")
-
-        if order.side == OrderSide.BUY:
-            # Buying when short = reducing risk
-            return current_qty >= 0
-        else:
-            # Selling when long = reducing risk
-            return current_qty <= 0
+        return is_risk_increasing(order, portfolio_state)
 
     def apply(
         self,
@@ -89,20 +86,36 @@ class GrossLeverageConstraint:
         warnings: list[str] = []
 
         equity = portfolio_state.equity
-        max_exposure = equity * Decimal(str(risk_config.max_gross_leverage))
+        max_exposure = equity * risk_config.max_gross_leverage_dec
 
-        # Calculate current gross exposure
-        current_exposure = Decimal("0")
-        for position in portfolio_state.positions.values():
-            current_exposure += abs(position.market_value)
+        # Current gross exposure (shared with other constraints in the chain)
+        current_exposure, _ = exposures(portfolio_state)
+        remaining_capacity = max_exposure - current_exposure
 
-        # Categorize orders based on whether they increase or reduce exposure
+        # Fast path: counting every order as exposure-increasing gives an
+        # upper bound on new exposure. If even that clearly fits, no order
+        # needs splitting or scaling.
+        symbol_index = market_state.symbol_index
+        indices = symbol_indices(orders, symbol_index) if remaining_capacity > 0 else None
+        if orders and indices is not None:
+            quantities = np.fromiter(
+                (float(o.quantity) for o in orders), dtype=np.float64, count=len(orders)
+            )
+            upper_bound = batch_notional(market_state.price_array, indices, quantities)
+            if clears(upper_bound, float(remaining_capacity)):
+                return ConstraintResult(orders=list(orders), rejected=rejected, warnings=warnings)
+
+        # Categorize orders based on whether they increase or reduce exposure.
+        # The symbol index found here is kept with each increasing order so
+        # the float screen below needs no further lookups.
         exposure_reducing_orders: list[OrderRequest] = []
-        exposure_increasing_orders: list[tuple[OrderRequest, Decimal]] = []
+        exposure_increasing_orders: list[OrderRequest] = []
+        increasing_indices: list[int] = []
 
+        positions = portfolio_state.positions
         for order in orders:
-            bar = market_state.current_bars.get(order.symbol)
-            if bar is None:
+            idx = symbol_index.get(order.symbol)
+            if idx is None:
                 rejected.append(
                     RejectedOrder(
                         order=order,
@@ -112,121 +125,30 @@ class GrossLeverageConstraint:
                 )
                 continue
 
-            price = bar.close
-            maybe_position = portfolio_state.positions.get(order.symbol)
-            current_qty = maybe_position.quantity if maybe_position else Decimal("0")
-
-            # Determine if this order increases or reduces gross exposure
-            if order.side == OrderSide.BUY:
-                if current_qty < 0:
-                    # Covering a short - how much reduces vs increases exposure
-                    cover_qty = min(order.quantity, abs(current_qty))
-                    new_long_qty = order.quantity - cover_qty
-
-                    # Cover portion always passes (reduces exposure)
-                    if cover_qty > 0:
-                        if new_long_qty > 0:
-                            # Split: cover passes, new long constrained
-                            cover_order = OrderRequest(
-                                client_order_id=order.client_order_id,
-                                symbol=order.symbol,
-                                side=order.side,
-                                order_type=order.order_type,
-                                quantity=cover_qty,
-                                limit_price=order.limit_price,
-                                stop_price=order.stop_price,
-                                time_in_force=order.time_in_force,
-                                timestamp=order.timestamp,
-                                policy_id=order.policy_id,
-                                confidence=order.confidence,
-                                tags=order.tags,
-                                metadata=order.metadata,
-                            )
-                            exposure_reducing_orders.append(cover_order)
-
-                            # Create order for the new long portion
-                            new_long_order = OrderRequest(
-                                client_order_id=order.client_order_id,
-                                symbol=order.symbol,
-                                side=order.side,
-                                order_type=order.order_type,
-                                quantity=new_long_qty,
-                                limit_price=order.limit_price,
-                                stop_price=order.stop_price,
-                                time_in_force=order.time_in_force,
-                                timestamp=order.timestamp,
-                                policy_id=order.policy_id,
-                                confidence=order.confidence,
-                                tags=order.tags,
-                                metadata=order.metadata,
-                            )
-                            exposure_increasing_orders.append(
-                                (new_long_order, new_long_qty * price)
-                            )
-                        else:
-                            # All cover - passes freely
-                            exposure_reducing_orders.append(order)
-                    else:
-                        # No short to cover, all increases exposure
-                        exposure_increasing_orders.append((order, order.quantity * price))
-                else:
-                    # No short position - buy increases exposure
-                    exposure_increasing_orders.append((order, order.quantity * price))
-            else:  # SELL
-                if current_qty > 0:
-                    # Closing a long - how much closes vs goes short
-                    close_qty = min(order.quantity, current_qty)
-                    new_short_qty = order.quantity - close_qty
-
-                    # Close portion always passes (reduces exposure)
-                    if close_qty > 0:
-                        if new_short_qty > 0:
-                            # Split: close passes, new short constrained
-                            close_order = OrderRequest(
-                                client_order_id=order.client_order_id,
-                                symbol=order.symbol,
-                                side=order.side,
-                                order_type=order.order_type,
-                                quantity=close_qty,
-                                limit_price=order.limit_price,
-                                stop_price=order.stop_price,
-                                time_in_force=order.time_in_force,
-                                timestamp=order.timestamp,
-                                policy_id=order.policy_id,
-                                confidence=order.confidence,
-                                tags=order.tags,
-                                metadata=order.metadata,
-                            )
-                            exposure_reducing_orders.append(close_order)
-
-                            # Create order for the new short portion
-                            new_short_order = OrderRequest(
-                                client_order_id=order.client_order_id,
-                                symbol=order.symbol,
-                                side=order.side,
-                                order_type=order.order_type,
-                                quantity=new_short_qty,
-                                limit_price=order.limit_price,
-                                stop_price=order.stop_price,
-                                time_in_force=order.time_in_force,
-                                timestamp=order.timestamp,
-                                policy_id=order.policy_id,
-                                confidence=order.confidence,
-                                tags=order.tags,
-                                metadata=order.metadata,
-                            )
-                            exposure_increasing_orders.append(
-                                (new_short_order, new_short_qty * price)
-                            )
-                        else:
-                            # All close - passes freely
-                            exposure_reducing_orders.append(order)
-                    else:
-                        # No long to close, all goes short (increases exposure)
-                        exposure_increasing_orders.append((order, order.quantity * price))
-                else:
-                    # No long position - sell increases short exposure
-                    exposure_increasing_orders.append((order, order.quantity * price))
+            maybe_position = positions.get(order.symbol)
+            current_qty = maybe_position.quantity if maybe_position else _ZERO
+
+            # The part of the order that unwinds an opposite position (a buy
+            # covering a short, a sell closing a long) reduces exposure; the
+            # rest opens new exposure in the order's direction
+            opposite_qty = -current_qty if order.side is OrderSide.BUY else current_qty
+            reducing_qty = min(order.quantity, opposite_qty) if opposite_qty > 0 else _ZERO
+            increasing_qty = order.quantity - reducing_qty
+
+            if reducing_qty == 0:
+                # Nothing to unwind - all increases exposure
+                exposure_increasing_orders.append(order)
+                increasing_indices.append(idx)
+            elif increasing_qty == 0:
+                # All unwind - passes freely
+                exposure_reducing_orders.append(order)
+            else:
+                # Split: unwind portion passes, new exposure constrained
+                exposure_reducing_orders.append(order.model_copy(update={"quantity": reducing_qty}))
+                exposure_increasing_orders.append(
+                    order.model_copy(update={"quantity": increasing_qty})
+                )
+                increasing_indices.append(idx)
 
         # Start with exposure-reducing orders (always pass)
         result: list[OrderRequest] = list(exposure_reducing_orders)
@@ -234,15 +156,9 @@ class GrossLeverageConstraint:
         if not exposure_increasing_orders:
             return ConstraintResult(orders=result, rejected=rejected, warnings=warnings)
 
-        # Calculate total new exposure
-        total_new_exposure = sum(value for _, value in exposure_increasing_orders)
-
-        # Calculate remaining capacity
-        remaining_capacity = max_exposure - current_exposure
-
         if remaining_capacity <= 0:
             # Already at or over limit - no exposure-increasing orders allowed
-            for order, _ in exposure_increasing_orders:
+            for order in exposure_increasing_orders:
                 rejected.append(
                     RejectedOrder(
                         order=order,
@@ -253,39 +169,63 @@ class GrossLeverageConstraint:
                 )
             return ConstraintResult(orders=result, rejected=rejected, warnings=warnings)
 
+        # Fast path: estimate the new exposure in float64. Only a clear pass
+        # (beyond float rounding error) skips the exact Decimal accounting.
+        quantities = np.fromiter(
+            (float(o.quantity) for o in exposure_increasing_orders),
+            dtype=np.float64,
+            count=len(exposure_increasing_orders),
+        )
+        estimated_exposure = batch_notional(
+            market_state.price_array, increasing_indices, quantities
+        )
+        if clears(estimated_exposure, float(remaining_capacity)):
+            result.extend(exposure_increasing_orders)
+            return ConstraintResult(orders=result, rejected=rejected, warnings=warnings)
+
+        # Calculate total new exposure. Per-order values are not kept: only
+        # the few orders the float screen below cannot floor need them again.
+        close_prices = market_state.close_prices
+        total_new_exposure = sum(
+            (order.quantity * close_prices[order.symbol] for order in exposure_increasing_orders),
+            _ZERO,
+        )
+
         if total_new_exposure <= remaining_capacity:
             # All orders fit
-            result.extend(order for order, _ in exposure_increasing_orders)
+            result.extend(exposure_increasing_orders)
             return ConstraintResult(orders=result, rejected=rejected, warnings=warnings)
 
-        # Scale down proportionally
+        # Scale down proportionally. The price cancels out of each order's
+        # scaled quantity, so candidates come from one float64 pass over the
+        # quantities; only those too close to an integer boundary for float
+        # rounding to be trusted are recomputed in Decimal.
         scale_factor = remaining_capacity / total_new_exposure
+        estimates = quantities * float(scale_factor)
+
+        if clears(float(estimates.max()), 1.0):
+            # Capacity too small for even one unit of any order
+            reason = f"Scaled quantity < 1 (gross leverage limit {risk_config.max_gross_leverage}x)"
+            rejected.extend(
+                RejectedOrder(order=order, constraint_name=self.name, reason=reason)
+                for order in exposure_increasing_orders
+            )
+            return ConstraintResult(orders=result, rejected=rejected, warnings=warnings)
 
-        for order, order_value in exposure_increasing_orders:
-            bar = market_state.current_bars.get(order.symbol)
-            if bar is None:
-                continue
+        floors, trusted = screened_floor(estimates)
 
-            price = bar.close
-            scaled_value = order_value * scale_factor
-            scaled_quantity = (scaled_value / price).to_integral_value(rounding=ROUND_DOWN)
+        for order, floor, is_trusted in zip(
+            exposure_increasing_orders, floors.tolist(), trusted.tolist(), strict=True
+        ):
+            if is_trusted:
+                scaled_quantity = Decimal(int(floor))
+            else:
+                price = close_prices[order.symbol]
+                scaled_value = order.quantity * price * scale_factor
+                scaled_quantity = scaled_value // price
 
             if scaled_quantity >= 1:
-                new_order = OrderRequest(
-                    client_order_id=order.client_order_id,
-                    symbol=order.symbol,
-                    side=order.side,
-                    order_type=order.order_type,
-                    quantity=scaled_quantity,
-                    limit_price=order.limit_price,
-                    stop_price=order.stop_price,
-                    time_in_force=order.time_in_force,
-                    timestamp=order.timestamp,
-                    policy_id=order.policy_id,
-                    confidence=order.confidence,
-                    tags=order.tags,
-                    metadata=order.metadata,
-                )
+                new_order = order.model_copy(update={"quantity": scaled_quantity})
                 result.append(new_order)
                 if scaled_quantity < order.quantity:
                     rejected.append(
@@ -5,11 +5,12 @@ MinPositionValueConstraint: Filters out orders below minimum notional value.
 
 from __future__ import annotations
 
-from decimal import Decimal
 from typing import TYPE_CHECKING
 
 from liq.core import OrderRequest, OrderSide
 
+from liq.risk._fast import clears, gather_buys
+from liq.risk._portfolio import is_risk_increasing
 from liq.risk.types import ConstraintResult, RejectedOrder
 
 if TYPE_CHECKING:
@@ -50,13 +51,7 @@ class MinPositionValueConstraint:
         Returns:
             True if risk-increasing, False if risk-reducing.
         """
-        position = portfolio_state.positions.get(order.symbol)
-        current_qty = position.quantity if position else Decimal("0")
-
-        if order.side == OrderSide.BUY:
-            return current_qty >= 0
-        else:
-            return current_qty <= 0
+        return is_risk_increasing(order, portfolio_state)
 
     def apply(
         self,
@@ -82,15 +77,31 @@ class MinPositionValueConstraint:
 
         min_value = risk_config.min_position_value
 
+        # Fast path: compute every buy's notional in one float64 pass. If all
+        # buys have bar data and the smallest clearly exceeds the minimum
+        # (beyond float rounding error), nothing is filtered.
+        batch = gather_buys(orders, market_state.symbol_index)
+        if batch is not None:
+            indices, quantities = batch
+            if not len(indices):
+                return ConstraintResult(orders=list(orders), rejected=rejected, warnings=warnings)
+            values = quantities * market_state.price_array[indices]
+            if clears(float(min_value), float(values.min())):
+                return ConstraintResult(orders=list(orders), rejected=rejected, warnings=warnings)
+
+        close_prices = market_state.close_prices
+        # The minimum is the same in every rejection reason, so format it once
+        min_value_label = f"${min_value:.2f}"
+
         for order in orders:
             # Sell orders always pass (reducing position)
-            if order.side == OrderSide.SELL:
+            if order.side is OrderSide.SELL:
                 result.append(order)
                 continue
 
             # Get bar data for price
-            bar = market_state.current_bars.get(order.symbol)
-            if bar is None:
+            price = close_prices.get(order.symbol)
+            if price is None:
                 rejected.append(
                     RejectedOrder(
                         order=order,
@@ -100,7 +111,6 @@ class MinPositionValueConstraint:
                 )
                 continue
 
-            price = bar.close
             order_value = order.quantity * price
 
             if order_value >= min_value:
@@ -110,7 +120,7 @@ class MinPositionValueConstraint:
                     RejectedOrder(
                         order=order,
                         constraint_name=self.name,
-                        reason=f"Order value ${order_value:.2f} below minimum ${min_value:.2f}",
+                        reason=f"Order value ${order_value:.2f} below minimum {min_value_label}",
                     )
                 )
 
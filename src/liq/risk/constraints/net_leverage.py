@@ -6,11 +6,14 @@ NetLeverageConstraint: Limits net exposure (longs - shorts) to equity multiple.
 from __future__ import annotations
 
 import logging
-from decimal import ROUND_DOWN, Decimal
+from decimal import Decimal
 from typing import TYPE_CHECKING
 
+import numpy as np
 from liq.core import OrderRequest, OrderSide
 
+from liq.risk._fast import clears, screened_floor
+from liq.risk._portfolio import exposures, is_risk_increasing
 from liq.risk.types import ConstraintResult, RejectedOrder
 
 if TYPE_CHECKING:
@@ -20,6 +23,8 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+_ZERO = Decimal("0")
+
 
 class NetLeverageConstraint:
     """Limit net exposure to equity multiple.
@@ -57,13 +62,7 @@ class NetLeverageConstraint:
         Returns:
             True if risk-increasing, False if risk-reducing.
         """
-        position = portfolio_state.positions.get(order.symbol)
-        current_qty = position.quantity if position else Decimal("0")
-
-        if order.side == OrderSide.BUY:
-            return current_qty >= 0
-        else:
-            return current_qty <= 0
+        return is_risk_increasing(order, portfolio_state)
 
     def apply(
         self,
@@ -87,23 +86,25 @@ class NetLeverageConstraint:
         warnings: list[str] = []
 
         equity = portfolio_state.equity
-        max_net_leverage = Decimal(str(risk_config.max_net_leverage))
-        max_net_exposure = equity * max_net_leverage
+        max_net_exposure = equity * risk_config.max_net_leverage_dec
 
         # Calculate current net exposure from positions
         # Use position.market_value which uses current_price or average_price
-        current_net_exposure = Decimal("0")
-        for position in portfolio_state.positions.values():
-            # market_value is signed: positive for long, negative for short
-            current_net_exposure += position.market_value
+        # market_value is signed: positive for long, negative for short
+        _, current_net_exposure = exposures(portfolio_state)
 
         # Categorize orders into reducing vs increasing net exposure
         reducing_orders: list[OrderRequest] = []
-        increasing_orders: list[tuple[OrderRequest, Decimal]] = []  # (order, delta)
+        # (order, delta, price)
+        increasing_orders: list[tuple[OrderRequest, Decimal, Decimal]] = []
 
+        # Total delta of the increasing orders, accumulated while classifying
+        proposed_delta = _ZERO
+        abs_current_net = abs(current_net_exposure)
+        close_prices = market_state.close_prices
         for order in orders:
-            bar = market_state.current_bars.get(order.symbol)
-            if bar is None:
+            price = close_prices.get(order.symbol)
+            if price is None:
                 rejected.append(
                     RejectedOrder(
                         order=order,
@@ -113,22 +114,21 @@ class NetLeverageConstraint:
                 )
                 continue
 
-            price = bar.close
-
             # Calculate net exposure delta for this order
-            if order.side == OrderSide.BUY:
+            if order.side is OrderSide.BUY:
                 order_delta = order.quantity * price
             else:
                 order_delta = -order.quantity * price
 
             # Determine if this order increases or decreases absolute net exposure
             new_net_exposure = current_net_exposure + order_delta
-            if abs(new_net_exposure) < abs(current_net_exposure):
+            if abs(new_net_exposure) < abs_current_net:
                 # This order reduces absolute net exposure - always pass
                 reducing_orders.append(order)
             else:
                 # This order increases absolute net exposure - may need constraining
-                increasing_orders.append((order, order_delta))
+                increasing_orders.append((order, order_delta, price))
+                proposed_delta += order_delta
 
         # Start with reducing orders (always pass)
         result: list[OrderRequest] = list(reducing_orders)
@@ -136,13 +136,11 @@ class NetLeverageConstraint:
         if not increasing_orders:
             return ConstraintResult(orders=result, rejected=rejected, warnings=warnings)
 
-        # Calculate proposed total delta from increasing orders
-        proposed_delta = sum(delta for _, delta in increasing_orders)
         proposed_net_exposure = current_net_exposure + proposed_delta
 
         if abs(proposed_net_exposure) <= max_net_exposure:
             # All orders fit within limit
-            result.extend(order for order, _ in increasing_orders)
+            result.extend(order for order, _, _ in increasing_orders)
             return ConstraintResult(orders=result, rejected=rejected, warnings=warnings)
 
         # Calculate available room in the direction we're going
@@ -156,7 +154,7 @@ class NetLeverageConstraint:
 
         if available <= 0:
             # No room for more exposure in this direction
-            for order, _ in increasing_orders:
+            for order, _, _ in increasing_orders:
                 rejected.append(
                     RejectedOrder(
                         order=order,
@@ -168,34 +166,41 @@ class NetLeverageConstraint:
             return ConstraintResult(orders=result, rejected=rejected, warnings=warnings)
 
         # Scale down proportionally
-        total_delta: Decimal = abs(proposed_delta)  # type: ignore[assignment]
+        total_delta = abs(proposed_delta)
         scale_factor = available / total_delta
 
-        for order, delta in increasing_orders:
-            bar = market_state.current_bars.get(order.symbol)
-            if bar is None:
-                continue
+        # The price cancels out of each scaled quantity, so candidates come
+        # from one float64 pass over the quantities; only those too close to
+        # an integer boundary to trust are recomputed in Decimal
+        quantities = np.fromiter(
+            (float(order.quantity) for order, _, _ in increasing_orders),
+            dtype=np.float64,
+            count=len(increasing_orders),
+        )
+        estimates = quantities * float(scale_factor)
+
+        if clears(float(estimates.max()), 1.0):
+            # Room too small for even one unit of any order
+            reason = f"Scaled quantity < 1 (net leverage limit {risk_config.max_net_leverage}x)"
+            rejected.extend(
+                RejectedOrder(order=order, constraint_name=self.name, reason=reason)
+                for order, _, _ in increasing_orders
+            )
+            return ConstraintResult(orders=result, rejected=rejected, warnings=warnings)
+
+        floors, trusted = screened_floor(estimates)
 
-            price = bar.close
-            scaled_delta = abs(delta) * scale_factor
-            scaled_quantity = (scaled_delta / price).to_integral_value(rounding=ROUND_DOWN)
+        for (order, delta, price), floor, is_trusted in zip(
+            increasing_orders, floors.tolist(), trusted.tolist(), strict=True
+        ):
+            if is_trusted:
+                scaled_quantity = Decimal(int(floor))
+            else:
+                scaled_delta = abs(delta) * scale_factor
+                scaled_quantity = scaled_delta // price
 
             if scaled_quantity >= 1:
-                new_order = OrderRequest(
-                    client_order_id=order.client_order_id,
-                    symbol=order.symbol,
-                    side=order.side,
-                    order_type=order.order_type,
-                    quantity=scaled_quantity,
-                    limit_price=order.limit_price,
-                    stop_price=order.stop_price,
-                    time_in_force=order.time_in_force,
-                    timestamp=order.timestamp,
-                    policy_id=order.policy_id,
-                    confidence=order.confidence,
-                    tags=order.tags,
-                    metadata=order.metadata,
-                )
+                new_order = order.model_copy(update={"quantity": scaled_quantity})
                 result.append(new_order)
                 if scaled_quantity < order.quantity:
                     rejected.append(
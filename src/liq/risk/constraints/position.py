@@ -6,18 +6,26 @@ MaxPositionsConstraint: Limits total number of concurrent positions.
 
 from __future__ import annotations
 
-from decimal import ROUND_DOWN, Decimal
+import heapq
+from decimal import Decimal
+from itertools import pairwise
 from typing import TYPE_CHECKING
 
+import numpy as np
 from liq.core import OrderRequest, OrderSide
 
+from liq.risk._fast import FLOAT_SCREEN_MARGIN, symbol_indices
+from liq.risk._portfolio import is_risk_increasing
 from liq.risk.types import ConstraintResult, RejectedOrder
 
 if TYPE_CHECKING:
-    from liq.core import PortfolioState
+    from liq.core import PortfolioState, Position
+    from numpy.typing import NDArray
 
     from liq.risk.config import MarketState, RiskConfig
 
+_ZERO = Decimal("0")
+
 
 class MaxPositionConstraint:
     """Limit individual position size as percentage of equity.
@@ -57,15 +65,7 @@ class MaxPositionConstraint:
         Returns:
             True if risk-increasing, False if risk-reducing.
         """
-        position = portfolio_state.positions.get(order.symbol)
-        current_qty = position.quantity if position else Decimal("0")
-
-        if order.side == OrderSide.BUY:
-            # Buying when short = reducing risk, buying when flat/long = increasing
-            return current_qty >= 0
-        else:  # SELL
-            # Selling when long = reducing risk, selling when flat/short = increasing
-            return current_qty <= 0
+        return is_risk_increasing(order, portfolio_state)
 
     def apply(
         self,
@@ -90,12 +90,34 @@ class MaxPositionConstraint:
         warnings: list[str] = []
 
         equity = portfolio_state.equity
-        max_position_value = equity * Decimal(str(risk_config.max_position_pct))
+        max_position_value = equity * risk_config.max_position_pct_dec
+
+        # Fast path: if every order clearly fits (beyond float rounding
+        # error), the batch passes untouched without per-order Decimal math
+        positions = portfolio_state.positions
+        fits = self._clearly_fits(orders, positions, market_state, max_position_value)
+        if fits is not None and fits.all():
+            return ConstraintResult(orders=list(orders), rejected=rejected, warnings=warnings)
+
+        # The limit appears in most rejection reasons; format it once, along
+        # with the two reasons that carry no per-order data
+        pct_label = f"{risk_config.max_position_pct:.1%}"
+        at_max_reason = f"Position already at max ({pct_label} of equity)"
+        exceed_reason = f"Position would exceed {pct_label} of equity"
+
+        # Orders the screen cleared pass as-is; only the rest need the
+        # exact Decimal accounting below
+        clear_flags = fits.tolist() if fits is not None else [False] * len(orders)
+
+        close_prices = market_state.close_prices
+        for order, clearly_fits in zip(orders, clear_flags, strict=True):
+            if clearly_fits:
+                result.append(order)
+                continue
 
-        for order in orders:
             # Get bar data for price
-            bar = market_state.current_bars.get(order.symbol)
-            if bar is None:
+            price = close_prices.get(order.symbol)
+            if price is None:
                 rejected.append(
                     RejectedOrder(
                         order=order,
@@ -105,239 +127,114 @@ class MaxPositionConstraint:
                 )
                 continue
 
-            price = bar.close
-
-            # Get existing position
-            existing_position = portfolio_state.positions.get(order.symbol)
-            current_qty = existing_position.quantity if existing_position else Decimal("0")
-
-            if order.side == OrderSide.BUY:
-                if current_qty < 0:
-                    # Buying to cover a short
-                    cover_qty = min(order.quantity, abs(current_qty))
-                    new_long_qty = order.quantity - cover_qty
-
-                    if new_long_qty <= 0:
-                        # All cover - passes freely (reduces position)
-                        result.append(order)
-                        continue
-
-                    # Split: cover portion passes, new long constrained
-                    # Calculate room for new long position
-                    remaining_room = max_position_value  # New position, starts at 0
-                    constrained_qty = min(
-                        new_long_qty,
-                        (remaining_room / price).to_integral_value(rounding=ROUND_DOWN),
-                    )
-
-                    total_qty = cover_qty + constrained_qty
-                    if total_qty >= 1:
-                        new_order = OrderRequest(
-                            client_order_id=order.client_order_id,
-                            symbol=order.symbol,
-                            side=order.side,
-                            order_type=order.order_type,
-                            quantity=total_qty,
-                            limit_price=order.limit_price,
-                            stop_price=order.stop_price,
-                            time_in_force=order.time_in_force,
-                            timestamp=order.timestamp,
-                            policy_id=order.policy_id,
-                            confidence=order.confidence,
-                            tags=order.tags,
-                            metadata=order.metadata,
+            # Existing position measured in the order's direction: positive
+            # when the order adds to it, negative when the order trades
+            # against it (a buy against a short, a sell against a long)
+            existing_position = positions.get(order.symbol)
+            current_qty = existing_position.quantity if existing_position else _ZERO
+            held_qty = current_qty if order.side is OrderSide.BUY else -current_qty
+
+            if held_qty < 0:
+                # Closing/covering the opposite position passes freely; any
+                # remainder opens a new position, which starts from zero
+                unwind_qty = min(order.quantity, -held_qty)
+                new_qty = order.quantity - unwind_qty
+
+                if new_qty <= 0:
+                    # All unwind - passes freely (reduces position)
+                    result.append(order)
+                    continue
+
+                # Split: unwind portion passes, new position constrained
+                allowed_qty = unwind_qty + min(new_qty, max_position_value // price)
+            else:
+                # Opening or adding to a position (constrained)
+                existing_value = held_qty * price if held_qty > 0 else _ZERO
+                remaining_room = max_position_value - existing_value
+
+                if remaining_room <= 0:
+                    rejected.append(
+                        RejectedOrder(
+                            order=order,
+                            constraint_name=self.name,
+                            reason=at_max_reason,
                         )
-                        result.append(new_order)
-                        # Track partial reduction
-                        if total_qty < order.quantity:
-                            rejected.append(
-                                RejectedOrder(
-                                    order=order,
-                                    constraint_name=self.name,
-                                    reason=f"Reduced from {order.quantity} to {total_qty} "
-                                    f"(max position {risk_config.max_position_pct:.1%} of equity)",
-                                    original_quantity=order.quantity,
-                                )
-                            )
-                    else:
-                        rejected.append(
-                            RejectedOrder(
-                                order=order,
-                                constraint_name=self.name,
-                                reason=f"Position would exceed {risk_config.max_position_pct:.1%} of equity",
-                            )
-                        )
-                else:
-                    # No short position - normal buy constrained
-                    existing_value = abs(current_qty * price) if current_qty > 0 else Decimal("0")
-                    remaining_room = max_position_value - existing_value
-
-                    if remaining_room <= 0:
-                        rejected.append(
-                            RejectedOrder(
-                                order=order,
-                                constraint_name=self.name,
-                                reason=f"Position already at max ({risk_config.max_position_pct:.1%} of equity)",
-                            )
-                        )
-                        continue
-
-                    order_value = order.quantity * price
-                    if order_value <= remaining_room:
-                        result.append(order)
-                    else:
-                        max_quantity = (remaining_room / price).to_integral_value(
-                            rounding=ROUND_DOWN
-                        )
-                        if max_quantity >= 1:
-                            new_order = OrderRequest(
-                                client_order_id=order.client_order_id,
-                                symbol=order.symbol,
-                                side=order.side,
-                                order_type=order.order_type,
-                                quantity=max_quantity,
-                                limit_price=order.limit_price,
-                                stop_price=order.stop_price,
-                                time_in_force=order.time_in_force,
-                                timestamp=order.timestamp,
-                                policy_id=order.policy_id,
-                                confidence=order.confidence,
-                                tags=order.tags,
-                                metadata=order.metadata,
-                            )
-                            result.append(new_order)
-                            rejected.append(
-                                RejectedOrder(
-                                    order=order,
-                                    constraint_name=self.name,
-                                    reason=f"Reduced from {order.quantity} to {max_quantity} "
-                                    f"(max position {risk_config.max_position_pct:.1%} of equity)",
-                                    original_quantity=order.quantity,
-                                )
-                            )
-                        else:
-                            rejected.append(
-                                RejectedOrder(
-                                    order=order,
-                                    constraint_name=self.name,
-                                    reason=f"Position would exceed {risk_config.max_position_pct:.1%} of equity",
-                                )
-                            )
-            else:  # SELL
-                if current_qty > 0:
-                    # Selling to close a long
-                    close_qty = min(order.quantity, current_qty)
-                    new_short_qty = order.quantity - close_qty
-
-                    if new_short_qty <= 0:
-                        # All close - passes freely (reduces position)
-                        result.append(order)
-                        continue
-
-                    # Split: close portion passes, new short constrained
-                    # Calculate room for new short position
-                    remaining_room = max_position_value  # New position, starts at 0
-                    constrained_qty = min(
-                        new_short_qty,
-                        (remaining_room / price).to_integral_value(rounding=ROUND_DOWN),
                     )
-
-                    total_qty = close_qty + constrained_qty
-                    if total_qty >= 1:
-                        new_order = OrderRequest(
-                            client_order_id=order.client_order_id,
-                            symbol=order.symbol,
-                            side=order.side,
-                            order_type=order.order_type,
-                            quantity=total_qty,
-                            limit_price=order.limit_price,
-                            stop_price=order.stop_price,
-                            time_in_force=order.time_in_force,
-                            timestamp=order.timestamp,
-                            policy_id=order.policy_id,
-                            confidence=order.confidence,
-                            tags=order.tags,
-                            metadata=order.metadata,
-                        )
-                        result.append(new_order)
-                        # Track partial reduction
-                        if total_qty < order.quantity:
-                            rejected.append(
-                                RejectedOrder(
-                                    order=order,
-                                    constraint_name=self.name,
-                                    reason=f"Reduced from {order.quantity} to {total_qty} "
-                                    f"(max position {risk_config.max_position_pct:.1%} of equity)",
-                                    original_quantity=order.quantity,
-                                )
-                            )
-                    else:
-                        rejected.append(
-                            RejectedOrder(
-                                order=order,
-                                constraint_name=self.name,
-                                reason=f"Position would exceed {risk_config.max_position_pct:.1%} of equity",
-                            )
-                        )
-                else:
-                    # No long position - sell initiates/increases short (constrained)
-                    existing_value = abs(current_qty * price) if current_qty < 0 else Decimal("0")
-                    remaining_room = max_position_value - existing_value
-
-                    if remaining_room <= 0:
-                        rejected.append(
-                            RejectedOrder(
-                                order=order,
-                                constraint_name=self.name,
-                                reason=f"Position already at max ({risk_config.max_position_pct:.1%} of equity)",
-                            )
+                    continue
+
+                if order.quantity * price <= remaining_room:
+                    result.append(order)
+                    continue
+
+                allowed_qty = remaining_room // price
+
+            if allowed_qty >= 1:
+                new_order = order.model_copy(update={"quantity": allowed_qty})
+                result.append(new_order)
+                # Track partial reduction
+                if allowed_qty < order.quantity:
+                    rejected.append(
+                        RejectedOrder(
+                            order=order,
+                            constraint_name=self.name,
+                            reason=f"Reduced from {order.quantity} to {allowed_qty} "
+                            f"(max position {pct_label} of equity)",
+                            original_quantity=order.quantity,
                         )
-                        continue
-
-                    order_value = order.quantity * price
-                    if order_value <= remaining_room:
-                        result.append(order)
-                    else:
-                        max_quantity = (remaining_room / price).to_integral_value(
-                            rounding=ROUND_DOWN
-                        )
-                        if max_quantity >= 1:
-                            new_order = OrderRequest(
-                                client_order_id=order.client_order_id,
-                                symbol=order.symbol,
-                                side=order.side,
-                                order_type=order.order_type,
-                                quantity=max_quantity,
-                                limit_price=order.limit_price,
-                                stop_price=order.stop_price,
-                                time_in_force=order.time_in_force,
-                                timestamp=order.timestamp,
-                                policy_id=order.policy_id,
-                                confidence=order.confidence,
-                                tags=order.tags,
-                                metadata=order.metadata,
-                            )
-                            result.append(new_order)
-                            rejected.append(
-                                RejectedOrder(
-                                    order=order,
-                                    constraint_name=self.name,
-                                    reason=f"Reduced from {order.quantity} to {max_quantity} "
-                                    f"(max position {risk_config.max_position_pct:.1%} of equity)",
-                                    original_quantity=order.quantity,
-                                )
-                            )
-                        else:
-                            rejected.append(
-                                RejectedOrder(
-                                    order=order,
-                                    constraint_name=self.name,
-                                    reason=f"Position would exceed {risk_config.max_position_pct:.1%} of equity",
-                                )
-                            )
+                    )
+            else:
+                rejected.append(
+                    RejectedOrder(
+                        order=order,
+                        constraint_name=self.name,
+                        reason=exceed_reason,
+                    )
+                )
 
         return ConstraintResult(orders=result, rejected=rejected, warnings=warnings)
 
+    def _clearly_fits(
+        self,
+        orders: list[OrderRequest],
+        positions: dict[str, Position],
+        market_state: MarketState,
+        max_position_value: Decimal,
+    ) -> NDArray[np.bool_] | None:
+        """Screen each order against the position limit in float64.
+
+        An order clearly fits when it only closes (or covers) an opposite
+        position, or when it opens or adds to a position whose resulting
+        value stays within the limit beyond float rounding error. Orders
+        that flip a position are never marked: the exact pass floors the
+        quantity of their new leg.
+
+        Returns:
+            Mask aligned with orders, or None if any order has no bar data.
+        """
+        indices = symbol_indices(orders, market_state.symbol_index)
+        if indices is None:
+            return None
+
+        n = len(orders)
+        quantities = np.fromiter((float(o.quantity) for o in orders), dtype=np.float64, count=n)
+        # Quantity already held in each order's direction (NaN for flips)
+        held = np.zeros(n)
+        closing = np.zeros(n, dtype=np.bool_)
+        for i, order in enumerate(orders):
+            position = positions.get(order.symbol)
+            if position is None:
+                continue
+            qty = position.quantity if order.side is OrderSide.BUY else -position.quantity
+            if qty >= 0:
+                held[i] = float(qty)
+            elif order.quantity <= -qty:
+                closing[i] = True
+            else:
+                held[i] = np.nan
+
+        values = (quantities + held) * market_state.price_array[indices]
+        return closing | (values * (1 + FLOAT_SCREEN_MARGIN) <= float(max_position_value))
+
 
 class MaxPositionsConstraint:
     """Limit total number of concurrent positions.
@@ -378,15 +275,7 @@ class MaxPositionsConstraint:
         Returns:
             True if risk-increasing, False if risk-reducing.
         """
-        position = portfolio_state.positions.get(order.symbol)
-        current_qty = position.quantity if position else Decimal("0")
-
-        if order.side == OrderSide.BUY:
-            # Buying when short = reducing risk
-            return current_qty >= 0
-        else:  # SELL
-            # Selling when long = reducing risk
-            return current_qty <= 0
+        return is_risk_increasing(order, portfolio_state)
 
     def apply(
         self,
@@ -409,83 +298,80 @@ class MaxPositionsConstraint:
         rejected: list[RejectedOrder] = []
         warnings: list[str] = []
 
-        existing_symbols = set(portfolio_state.positions.keys())
-        current_count = len(existing_symbols)
+        positions = portfolio_state.positions
+        current_count = len(positions)
         max_positions = risk_config.max_positions
 
-        # Separate orders into categories based on whether they create new positions
-        reducing_orders: list[OrderRequest] = []  # Close/reduce existing positions
+        # Separate orders into categories based on whether they create new
+        # positions. Orders on held symbols always pass: those reducing a
+        # position (covering a short, closing a long) are listed first, then
+        # those adding to one; only new-position orders are selected below.
+        passed: list[OrderRequest] = []  # Close/reduce existing positions
         existing_position_orders: list[OrderRequest] = []  # Add to existing positions
         new_position_orders: list[OrderRequest] = []  # Create new positions
 
         for order in orders:
-            position = portfolio_state.positions.get(order.symbol)
-            current_qty = position.quantity if position else Decimal("0")
-
-            if order.side == OrderSide.BUY:
-                if current_qty < 0:
-                    # Buying to cover a short - reducing position
-                    reducing_orders.append(order)
-                elif order.symbol in existing_symbols:
-                    # Adding to existing long
-                    existing_position_orders.append(order)
-                else:
-                    # New long position
-                    new_position_orders.append(order)
-            else:  # SELL
-                if current_qty > 0:
-                    # Selling to close a long - reducing position
-                    reducing_orders.append(order)
-                elif order.symbol in existing_symbols:
-                    # Adding to existing short
-                    existing_position_orders.append(order)
-                else:
-                    # New short position
-                    new_position_orders.append(order)
+            position = positions.get(order.symbol)
+            if position is None:
+                # New long or short position
+                new_position_orders.append(order)
+                continue
+
+            qty = position.quantity
+            if qty < 0 if order.side is OrderSide.BUY else qty > 0:
+                # Trading against the position - reducing
+                passed.append(order)
+            else:
+                # Adding to the existing long or short
+                existing_position_orders.append(order)
+        passed.extend(existing_position_orders)
 
         # Calculate room for new positions
         room_for_new = max_positions - current_count
 
         if room_for_new <= 0:
             # No room for new positions - reject all new position orders
-            for order in new_position_orders:
-                rejected.append(
-                    RejectedOrder(
-                        order=order,
-                        constraint_name=self.name,
-                        reason=f"Max positions ({max_positions}) reached, "
-                        f"currently holding {current_count} positions",
-                    )
-                )
-            return ConstraintResult(
-                orders=reducing_orders + existing_position_orders,
-                rejected=rejected,
-                warnings=warnings,
+            reason = (
+                f"Max positions ({max_positions}) reached, "
+                f"currently holding {current_count} positions"
             )
-
-        # Sort new position orders by confidence (descending)
-        new_position_orders.sort(
-            key=lambda o: o.confidence if o.confidence is not None else 0.0,
-            reverse=True,
-        )
-
-        # Take top N new positions
-        accepted_new = new_position_orders[:room_for_new]
-        rejected_new = new_position_orders[room_for_new:]
-
-        # Track rejected orders
-        for order in rejected_new:
-            rejected.append(
-                RejectedOrder(
-                    order=order,
-                    constraint_name=self.name,
-                    reason=f"Exceeds max positions limit ({max_positions}), "
-                    f"lower confidence than accepted orders",
-                )
+            rejected.extend(
+                RejectedOrder(order=order, constraint_name=self.name, reason=reason)
+                for order in new_position_orders
             )
-
-        return ConstraintResult(
-            orders=reducing_orders + existing_position_orders + accepted_new,
-            rejected=rejected,
-            warnings=warnings,
+            return ConstraintResult(orders=passed, rejected=rejected, warnings=warnings)
+
+        confidences = [o.confidence or 0.0 for o in new_position_orders]
+
+        if room_for_new >= len(new_position_orders):
+            # Every new position fits, so none is rejected, but later
+            # first-come-first-served constraints (correlation, sector) still
+            # see them by confidence. Batches already in descending order, or
+            # with equal confidences, skip the sort.
+            if all(a >= b for a, b in pairwise(confidences)):
+                passed.extend(new_position_orders)
+            else:
+                order_idx = sorted(
+                    range(len(confidences)), key=confidences.__getitem__, reverse=True
+                )
+                passed.extend(new_position_orders[i] for i in order_idx)
+            return ConstraintResult(orders=passed, rejected=rejected, warnings=warnings)
+
+        # Take the top N new positions by confidence (descending; ties keep
+        # submission order). Confidences are read once, and the heap
+        # compares indices through a C-level key.
+        top = heapq.nlargest(room_for_new, range(len(confidences)), key=confidences.__getitem__)
+        passed.extend(new_position_orders[i] for i in top)
+        accepted = set(top)
+        rejected_new = [order for i, order in enumerate(new_position_orders) if i not in accepted]
+
+        # Track rejected orders (all share one reason)
+        reason = (
+            f"Exceeds max positions limit ({max_positions}), lower confidence than accepted orders"
         )
+        rejected.extend(
+            RejectedOrder(order=order, constraint_name=self.name, reason=reason)
+            for order in rejected_new
+        )
+
+        return ConstraintResult(orders=passed, rejected=rejected, warnings=warnings)
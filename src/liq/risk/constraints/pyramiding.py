@@ -12,6 +12,7 @@ from typing import TYPE_CHECKING
 
 from liq.core import OrderRequest, OrderSide
 
+from liq.risk._portfolio import is_risk_increasing
 from liq.risk.types import ConstraintResult, RejectedOrder
 
 if TYPE_CHECKING:
@@ -20,6 +21,9 @@ if TYPE_CHECKING:
     from liq.risk.config import MarketState, RiskConfig
 
 
+_ZERO = Decimal("0")
+
+
 @dataclass
 class PyramidingState:
     """Track pyramiding state for a symbol.
@@ -119,15 +123,7 @@ class PyramidingConstraint:
         Returns:
             True if risk-increasing (adding to position), False if risk-reducing.
         """
-        position = portfolio_state.positions.get(order.symbol)
-        current_qty = position.quantity if position else Decimal("0")
-
-        if order.side == OrderSide.BUY:
-            # Buying when short = reducing risk
-            return current_qty >= 0
-        else:
-            # Selling when long = reducing risk
-            return current_qty <= 0
+        return is_risk_increasing(order, portfolio_state)
 
     def apply(
         self,
@@ -151,9 +147,10 @@ class PyramidingConstraint:
         warnings: list[str] = []
         result: list[OrderRequest] = []
 
+        positions = portfolio_state.positions
         for order in orders:
-            maybe_position = portfolio_state.positions.get(order.symbol)
-            current_qty = maybe_position.quantity if maybe_position else Decimal("0")
+            maybe_position = positions.get(order.symbol)
+            current_qty = maybe_position.quantity if maybe_position else _ZERO
 
             # Check if this is a risk-reducing order
             is_risk_reducing = self._is_risk_reducing(order, current_qty)
@@ -204,27 +201,14 @@ class PyramidingConstraint:
             if order.quantity > max_add_qty:
                 # Scale down to max allowed
                 if max_add_qty >= 1:
-                    new_order = OrderRequest(
-                        client_order_id=order.client_order_id,
-                        symbol=order.symbol,
-                        side=order.side,
-                        order_type=order.order_type,
-                        quantity=max_add_qty.to_integral_value(),
-                        limit_price=order.limit_price,
-                        stop_price=order.stop_price,
-                        time_in_force=order.time_in_force,
-                        timestamp=order.timestamp,
-                        policy_id=order.policy_id,
-                        confidence=order.confidence,
-                        tags=order.tags,
-                        metadata=order.metadata,
-                    )
+                    scaled_quantity = max_add_qty.to_integral_value()
+                    new_order = order.model_copy(update={"quantity": scaled_quantity})
                     result.append(new_order)
                     rejected.append(
                         RejectedOrder(
                             order=order,
                             constraint_name=self.name,
-                            reason=f"Scaled from {order.quantity} to {max_add_qty.to_integral_value()} "
+                            reason=f"Scaled from {order.quantity} to {scaled_quantity} "
                             f"(max add {self._max_add_pct:.0%} of initial {base_qty})",
                             original_quantity=order.quantity,
                         )
@@ -246,7 +230,7 @@ class PyramidingConstraint:
 
     def _is_risk_reducing(self, order: OrderRequest, current_qty: Decimal) -> bool:
         """Check if order reduces position risk."""
-        if order.side == OrderSide.BUY:
+        if order.side is OrderSide.BUY:
             # Buy reduces risk if we're short
             return current_qty < 0
         else:
@@ -258,7 +242,7 @@ class PyramidingConstraint:
         if current_qty == 0:
             return False
 
-        if order.side == OrderSide.BUY:
+        if order.side is OrderSide.BUY:
             # Buying to close short
             return current_qty < 0 and order.quantity >= abs(current_qty)
         else:
@@ -286,7 +270,7 @@ class PyramidingConstraint:
             # Initial entry
             state.initial_quantity = filled_qty
             state.add_count = 0
-            state.total_added = Decimal("0")
+            state.total_added = _ZERO
         else:
             # Add to position
             state.add_count += 1
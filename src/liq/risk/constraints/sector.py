@@ -5,11 +5,13 @@ SectorExposureConstraint: Limits exposure to any single sector.
 
 from __future__ import annotations
 
-from decimal import ROUND_DOWN, Decimal
+from decimal import Decimal
 from typing import TYPE_CHECKING
 
 from liq.core import OrderRequest, OrderSide
 
+from liq.risk._fast import FLOAT_SCREEN_MARGIN, gather_buys, sector_notional
+from liq.risk._portfolio import is_risk_increasing
 from liq.risk.types import ConstraintResult, RejectedOrder
 
 if TYPE_CHECKING:
@@ -17,6 +19,8 @@ if TYPE_CHECKING:
 
     from liq.risk.config import MarketState, RiskConfig
 
+_ZERO = Decimal("0")
+
 
 class SectorExposureConstraint:
     """Limit exposure to any single sector.
@@ -51,13 +55,7 @@ class SectorExposureConstraint:
         Returns:
             True if risk-increasing, False if risk-reducing.
         """
-        position = portfolio_state.positions.get(order.symbol)
-        current_qty = position.quantity if position else Decimal("0")
-
-        if order.side == OrderSide.BUY:
-            return current_qty >= 0
-        else:
-            return current_qty <= 0
+        return is_risk_increasing(order, portfolio_state)
 
     def apply(
         self,
@@ -88,9 +86,16 @@ class SectorExposureConstraint:
         if sector_map is None:
             return ConstraintResult(orders=list(orders), rejected=rejected, warnings=warnings)
 
+        # Sell orders always pass, so a sell-only batch (e.g. end-of-day
+        # liquidation) needs no exposure accounting at all
+        if all(order.side is OrderSide.SELL for order in orders):
+            return ConstraintResult(orders=list(orders), rejected=rejected, warnings=warnings)
+
         equity = portfolio_state.equity
         max_sector_exposure = equity * Decimal(str(risk_config.max_sector_pct))
 
+        close_prices = market_state.close_prices
+
         # Calculate current sector exposure from existing positions
         sector_exposure: dict[str, Decimal] = {}
         for symbol, position in portfolio_state.positions.items():
@@ -99,27 +104,30 @@ class SectorExposureConstraint:
                 continue
 
             # Use current market price for position value
-            bar = market_state.current_bars.get(symbol)
-            if bar is not None:
-                position_value = abs(position.quantity) * bar.close
+            close = close_prices.get(symbol)
+            if close is not None:
+                position_value = abs(position.quantity) * close
             else:
                 position_value = position.market_value
 
             if sector not in sector_exposure:
-                sector_exposure[sector] = Decimal("0")
+                sector_exposure[sector] = _ZERO
             sector_exposure[sector] += position_value
 
+        if self._all_buys_fit(orders, market_state, sector_exposure, max_sector_exposure):
+            return ConstraintResult(orders=list(orders), rejected=rejected, warnings=warnings)
+
         result: list[OrderRequest] = []
 
         for order in orders:
             # Sell orders always pass (reduce exposure)
-            if order.side == OrderSide.SELL:
+            if order.side is OrderSide.SELL:
                 result.append(order)
                 continue
 
             # Get bar data for pricing
-            bar = market_state.current_bars.get(order.symbol)
-            if bar is None:
+            price = close_prices.get(order.symbol)
+            if price is None:
                 rejected.append(
                     RejectedOrder(
                         order=order,
@@ -136,11 +144,10 @@ class SectorExposureConstraint:
                 result.append(order)
                 continue
 
-            price = bar.close
             order_value = order.quantity * price
 
             # Get current sector exposure
-            current_exposure = sector_exposure.get(sector, Decimal("0"))
+            current_exposure = sector_exposure.get(sector, _ZERO)
 
             # Calculate remaining capacity
             remaining_capacity = max_sector_exposure - current_exposure
@@ -164,24 +171,10 @@ class SectorExposureConstraint:
             else:
                 # Scale down to fit
                 scaled_value = remaining_capacity
-                scaled_quantity = (scaled_value / price).to_integral_value(rounding=ROUND_DOWN)
+                scaled_quantity = scaled_value // price
 
                 if scaled_quantity >= 1:
-                    new_order = OrderRequest(
-                        client_order_id=order.client_order_id,
-                        symbol=order.symbol,
-                        side=order.side,
-                        order_type=order.order_type,
-                        quantity=scaled_quantity,
-                        limit_price=order.limit_price,
-                        stop_price=order.stop_price,
-                        time_in_force=order.time_in_force,
-                        timestamp=order.timestamp,
-                        policy_id=order.policy_id,
-                        confidence=order.confidence,
-                        tags=order.tags,
-                        metadata=order.metadata,
-                    )
+                    new_order = order.model_copy(update={"quantity": scaled_quantity})
                     result.append(new_order)
                     # Update tracking with actual value
                     sector_exposure[sector] = current_exposure + (scaled_quantity * price)
@@ -204,3 +197,39 @@ class SectorExposureConstraint:
                     )
 
         return ConstraintResult(orders=result, rejected=rejected, warnings=warnings)
+
+    def _all_buys_fit(
+        self,
+        orders: list[OrderRequest],
+        market_state: MarketState,
+        sector_exposure: dict[str, Decimal],
+        max_sector_exposure: Decimal,
+    ) -> bool:
+        """Screen the whole batch against sector limits in float64.
+
+        Buy notional is aggregated per sector id with a single bincount.
+        Returns True only when every buy has bar data and every sector
+        receiving orders clearly stays within the limit (beyond float
+        rounding error), in which case no order needs scaling. Otherwise
+        the caller falls back to the exact sequential Decimal pass.
+        """
+        batch = gather_buys(orders, market_state.symbol_index)
+        if batch is None:
+            return False
+        indices, quantities = batch
+        if len(indices) == 0:
+            return True
+
+        totals, touched = sector_notional(
+            market_state.price_array,
+            market_state.sector_ids,
+            len(market_state.sector_list),
+            indices,
+            quantities,
+        )
+        sector_index = market_state.sector_index
+        for sector, exposure in sector_exposure.items():
+            totals[sector_index[sector]] += float(exposure)
+
+        limit = float(max_sector_exposure)
+        return bool((totals[touched] * (1 + FLOAT_SCREEN_MARGIN) <= limit).all())
@@ -11,6 +11,7 @@ from typing import TYPE_CHECKING
 
 from liq.core import OrderRequest, OrderSide
 
+from liq.risk._portfolio import is_risk_increasing
 from liq.risk.types import ConstraintResult, RejectedOrder
 
 if TYPE_CHECKING:
@@ -18,6 +19,8 @@ if TYPE_CHECKING:
 
     from liq.risk.config import MarketState, RiskConfig
 
+_ZERO = Decimal("0")
+
 
 class ShortSellingConstraint:
     """Filter sell orders that would create short positions when shorts disabled.
@@ -56,13 +59,7 @@ class ShortSellingConstraint:
         Returns:
             True if risk-increasing, False if risk-reducing.
         """
-        position = portfolio_state.positions.get(order.symbol)
-        current_qty = position.quantity if position else Decimal("0")
-
-        if order.side == OrderSide.BUY:
-            return current_qty >= 0
-        else:
-            return current_qty <= 0
+        return is_risk_increasing(order, portfolio_state)
 
     def apply(
         self,
@@ -91,15 +88,16 @@ class ShortSellingConstraint:
 
         result: list[OrderRequest] = []
 
+        positions = portfolio_state.positions
         for order in orders:
             # Buy orders always pass
-            if order.side == OrderSide.BUY:
+            if order.side is OrderSide.BUY:
                 result.append(order)
                 continue
 
             # For sell orders, check if it would go short
-            position = portfolio_state.positions.get(order.symbol)
-            current_qty = position.quantity if position else Decimal("0")
+            position = positions.get(order.symbol)
+            current_qty = position.quantity if position else _ZERO
 
             # If current position is zero or already short, block the sell
             if current_qty <= 0:
@@ -115,21 +113,7 @@ class ShortSellingConstraint:
             # If sell quantity exceeds position, trim to position size
             if order.quantity > current_qty:
                 # Create new order with trimmed quantity
-                new_order = OrderRequest(
-                    client_order_id=order.client_order_id,
-                    symbol=order.symbol,
-                    side=order.side,
-                    order_type=order.order_type,
-                    quantity=current_qty,  # Trim to position size
-                    limit_price=order.limit_price,
-                    stop_price=order.stop_price,
-                    time_in_force=order.time_in_force,
-                    timestamp=order.timestamp,
-                    policy_id=order.policy_id,
-                    confidence=order.confidence,
-                    tags=order.tags,
-                    metadata=order.metadata,
-                )
+                new_order = order.model_copy(update={"quantity": current_qty})
                 result.append(new_order)
                 rejected.append(
                     RejectedOrder(
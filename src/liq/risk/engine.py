@@ -14,6 +14,7 @@ from typing import TYPE_CHECKING, Any
 from liq.core import OrderRequest, OrderSide
 from pydantic import BaseModel, ConfigDict, Field
 
+from liq.risk._portfolio import exposure_scope
 from liq.risk.types import TargetPosition
 
 if TYPE_CHECKING:
@@ -117,20 +118,27 @@ class RiskEngine:
         self._constraints = constraints
 
     def _get_sizer(self) -> TargetPositionSizer:
-        """Get the position sizer, defaulting to VolatilitySizer."""
-        if self._sizer is not None:
-            return self._sizer
+        """Get the position sizer, defaulting to VolatilitySizer.
 
-        from liq.risk.sizers import VolatilitySizer
+        The default is built on first use and reused by later calls.
+        """
+        if self._sizer is None:
+            from liq.risk.sizers import VolatilitySizer
+
+            self._sizer = VolatilitySizer()
 
-        return VolatilitySizer()
+        return self._sizer
 
     def _get_constraints(self) -> list[StructuredConstraint]:
-        """Get the constraint chain, defaulting to standard chain."""
-        if self._constraints is not None:
-            return self._constraints
+        """Get the constraint chain, defaulting to standard chain.
 
-        return self._default_constraints()
+        The default chain is built on first use and reused by later calls;
+        its constraints are stateless, so sharing them is safe.
+        """
+        if self._constraints is None:
+            self._constraints = self._default_constraints()
+
+        return self._constraints
 
     def _default_constraints(self) -> list[StructuredConstraint]:
         """Return the default constraint chain.
@@ -172,6 +180,7 @@ class RiskEngine:
         risk_config: RiskConfig,
         high_water_mark: Decimal | None = None,
         day_start_equity: Decimal | None = None,
+        out: RiskEngineResult | None = None,
     ) -> RiskEngineResult:
         """Process signals through the risk pipeline.
 
@@ -182,9 +191,13 @@ class RiskEngine:
             risk_config: Risk parameters.
             high_water_mark: Peak equity for drawdown calculation.
             day_start_equity: Equity at start of day for daily loss calculation.
+            out: Optional result to reuse across calls (e.g. in a tight loop).
+                Its lists and dicts are cleared and refilled in place, so any
+                earlier reference to them sees the new contents.
 
         Returns:
             RiskEngineResult with orders, rejections, and stop-losses.
+            When ``out`` is given, its containers are reused.
         """
         # Check for equity floor breach first
         halted, halt_reason = self._check_equity_floor(portfolio_state)
@@ -202,7 +215,8 @@ class RiskEngine:
             )
 
         if not signals:
-            return RiskEngineResult(
+            return self._build_result(
+                out,
                 orders=[],
                 rejected_signals=[],
                 constraint_violations={},
@@ -235,26 +249,34 @@ class RiskEngine:
 
         # If halted, only allow risk-reducing orders (sells for longs, buys for shorts)
         if halted:
-            orders = [o for o in orders if o.side == OrderSide.SELL]
+            orders = [o for o in orders if o.side is OrderSide.SELL]
 
         # Apply constraint chain
         constraints = self._get_constraints()
         constraint_violations: dict[str, list[str]] = {}
 
-        for constraint in constraints:
-            constraint_result = constraint.apply(orders, portfolio_state, market_state, risk_config)
-
-            # StructuredConstraint returns ConstraintResult
-            orders = constraint_result.orders
-            # Track violations from rejected orders
-            if constraint_result.rejected:
-                constraint_name = constraint.name
-                if constraint_name not in constraint_violations:
-                    constraint_violations[constraint_name] = []
-                for rejected in constraint_result.rejected:
-                    constraint_violations[constraint_name].append(
-                        f"{rejected.order.symbol}: {rejected.reason}"
-                    )
+        # Gross and net exposure are computed once for the whole chain
+        with exposure_scope(portfolio_state):
+            for constraint in constraints:
+                # Constraints only filter or scale orders: once the batch is empty
+                # the rest of the chain has nothing to do
+                if not orders:
+                    break
+                constraint_result = constraint.apply(
+                    orders, portfolio_state, market_state, risk_config
+                )
+
+                # StructuredConstraint returns ConstraintResult
+                orders = constraint_result.orders
+                # Track violations from rejected orders
+                if constraint_result.rejected:
+                    constraint_name = constraint.name
+                    if constraint_name not in constraint_violations:
+                        constraint_violations[constraint_name] = []
+                    for rejected in constraint_result.rejected:
+                        constraint_violations[constraint_name].append(
+                            f"{rejected.order.symbol}: {rejected.reason}"
+                        )
 
         # Identify rejected signals
         final_symbols = {o.symbol for o in orders}
@@ -264,7 +286,8 @@ class RiskEngine:
         stop_losses = self._calculate_stop_losses(orders, market_state, risk_config)
         take_profits = self._calculate_take_profits(orders, market_state, risk_config)
 
-        return RiskEngineResult(
+        return self._build_result(
+            out,
             orders=orders,
             rejected_signals=rejected_signals,
             constraint_violations=constraint_violations,
@@ -274,6 +297,48 @@ class RiskEngine:
             halt_reason=halt_reason,
         )
 
+    def _build_result(
+        self,
+        out: RiskEngineResult | None,
+        *,
+        orders: list[OrderRequest],
+        rejected_signals: list[Any],
+        constraint_violations: dict[str, list[str]],
+        stop_losses: dict[str, Decimal],
+        take_profits: dict[str, Decimal],
+        halted: bool,
+        halt_reason: str | None,
+    ) -> RiskEngineResult:
+        """Build a result, refilling the containers of ``out`` if given.
+
+        RiskEngineResult is frozen, so only its containers can be reused;
+        if the halt fields differ, a shallow copy sharing them is returned.
+        """
+        if out is None:
+            return RiskEngineResult(
+                orders=orders,
+                rejected_signals=rejected_signals,
+                constraint_violations=constraint_violations,
+                stop_losses=stop_losses,
+                take_profits=take_profits,
+                halted=halted,
+                halt_reason=halt_reason,
+            )
+
+        out.orders[:] = orders
+        out.rejected_signals[:] = rejected_signals
+        for target, source in (
+            (out.constraint_violations, constraint_violations),
+            (out.stop_losses, stop_losses),
+            (out.take_profits, take_profits),
+        ):
+            target.clear()
+            target.update(source)
+
+        if out.halted == halted and out.halt_reason == halt_reason:
+            return out
+        return out.model_copy(update={"halted": halted, "halt_reason": halt_reason})
+
     def _check_drawdown_halt(
         self,
         portfolio_state: PortfolioState,
@@ -410,7 +475,7 @@ class RiskEngine:
             # Use midrange as entry price estimate
             midrange = (bar.high + bar.low) / 2
 
-            if order.side == OrderSide.BUY:
+            if order.side is OrderSide.BUY:
                 # Long stop below entry
                 stop_losses[order.symbol] = midrange - (atr * atr_mult)
             else:
@@ -458,7 +523,7 @@ class RiskEngine:
             # Use midrange as entry price estimate
             midrange = (bar.high + bar.low) / 2
 
-            if order.side == OrderSide.BUY:
+            if order.side is OrderSide.BUY:
                 # Long take-profit above entry
                 take_profits[order.symbol] = midrange + (atr * atr_mult)
             else:
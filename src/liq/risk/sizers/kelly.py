@@ -64,6 +64,7 @@ class KellySizer:
 
         equity = portfolio_state.equity
         kelly_fraction = Decimal(str(risk_config.kelly_fraction))
+        close_prices = market_state.close_prices
 
         targets: list[TargetPosition] = []
 
@@ -72,9 +73,9 @@ class KellySizer:
             if signal.direction == "flat":
                 continue
 
-            # Get bar data
-            bar = market_state.current_bars.get(signal.symbol)
-            if bar is None:
+            # Get price data
+            price = close_prices.get(signal.symbol)
+            if price is None:
                 continue
 
             # Calculate Kelly fraction
@@ -92,7 +93,6 @@ class KellySizer:
 
             # Calculate position value and quantity
             position_value = equity * position_fraction
-            price = bar.close
             quantity = (position_value / price).to_integral_value(rounding=ROUND_DOWN)
 
             if quantity < 1:
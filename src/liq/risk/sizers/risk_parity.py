@@ -67,40 +67,39 @@ class RiskParitySizer:
         if not signals:
             return []
 
-        # Filter valid signals and collect their volatilities
-        valid_signals: list[tuple[Signal, Decimal, Decimal]] = []  # (signal, vol, price)
+        # Collect candidate signals with their row in the MarketState arrays
+        # (symbols without bar data have no row)
+        symbol_index = market_state.symbol_index
+        candidates: list[Signal] = []
+        rows: list[int] = []
 
         for signal in signals:
             # Skip flat signals
             if signal.direction == "flat":
                 continue
 
-            # Get bar data
-            bar = market_state.current_bars.get(signal.symbol)
-            if bar is None:
+            row = symbol_index.get(signal.symbol)
+            if row is None:
                 continue
 
-            # Get volatility
-            vol = market_state.volatility.get(signal.symbol)
-            if vol is None or vol <= 0:
-                continue
-
-            # Use midrange price
-            price = (bar.high + bar.low) / 2
-            valid_signals.append((signal, vol, price))
+            candidates.append(signal)
+            rows.append(row)
 
-        if not valid_signals:
+        # Volatility is a unitless weight input, so the weights are computed
+        # in float64 from the volatility array; NaN (missing) and zero or
+        # negative volatility fail the > 0 test and are skipped.
+        vols = market_state.volatility_array[rows]
+        valid = vols > 0
+        if not valid.any():
             return []
 
         # Calculate inverse volatility weights
         # weight_i = (1/vol_i) / Σ(1/vol_j)
-        inverse_vols = [Decimal("1") / vol for _, vol, _ in valid_signals]
-        total_inverse_vol = sum(inverse_vols)
-
-        if total_inverse_vol <= 0:
-            return []
-
-        weights = [iv / total_inverse_vol for iv in inverse_vols]
+        inverse_vols = 1.0 / vols[valid]
+        weights = (inverse_vols / inverse_vols.sum()).tolist()
+        valid_signals = [
+            signal for signal, ok in zip(candidates, valid.tolist(), strict=True) if ok
+        ]
 
         # Calculate total allocation
         equity = portfolio_state.equity
@@ -109,9 +108,15 @@ class RiskParitySizer:
 
         targets: list[TargetPosition] = []
 
-        for i, (signal, _vol, price) in enumerate(valid_signals):
+        current_bars = market_state.current_bars
+
+        for signal, weight in zip(valid_signals, weights, strict=True):
             # Allocation for this asset
-            allocation = total_allocation * weights[i]
+            allocation = total_allocation * Decimal(str(weight))
+
+            # Use midrange price
+            bar = current_bars[signal.symbol]
+            price = (bar.high + bar.low) / 2
 
             # Calculate quantity
             quantity = (allocation / price).to_integral_value(rounding=ROUND_DOWN)
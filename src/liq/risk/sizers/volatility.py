@@ -87,6 +87,12 @@ class VolatilitySizer:
         risk_pct = (
             self.risk_per_trade if self.risk_per_trade is not None else risk_config.risk_per_trade
         )
+        # Loop invariants: converted to Decimal once per call, not per signal
+        risk_amount = equity * Decimal(str(risk_pct))
+        atr_multiple = Decimal(str(self.atr_multiple))
+        current_bars = market_state.current_bars
+        volatilities = market_state.volatility
+        positions = portfolio_state.positions
 
         for signal in signals:
             # Skip flat signals
@@ -94,12 +100,12 @@ class VolatilitySizer:
                 continue
 
             # Get bar data
-            bar = market_state.current_bars.get(signal.symbol)
+            bar = current_bars.get(signal.symbol)
             if bar is None:
                 continue
 
             # Get volatility
-            volatility = market_state.volatility.get(signal.symbol)
+            volatility = volatilities.get(signal.symbol)
             if volatility is None or volatility <= 0:
                 continue
 
@@ -111,8 +117,7 @@ class VolatilitySizer:
 
             # Calculate quantity using volatility sizing formula
             # qty = (equity * risk_per_trade) / (price * atr_multiple * atr)
-            risk_amount = equity * Decimal(str(risk_pct))
-            divisor = price * Decimal(str(self.atr_multiple)) * volatility
+            divisor = price * atr_multiple * volatility
 
             if divisor <= 0:
                 continue
@@ -129,7 +134,7 @@ class VolatilitySizer:
                 continue
 
             # Get current position quantity
-            position = portfolio_state.positions.get(signal.symbol)
+            position = positions.get(signal.symbol)
             current_quantity = position.quantity if position else Decimal("0")
 
             # Determine target quantity and direction
@@ -142,7 +147,7 @@ class VolatilitySizer:
                 direction = "short"
 
             # Calculate stop price based on volatility
-            stop_distance = volatility * Decimal(str(self.atr_multiple))
+            stop_distance = volatility * atr_multiple
             if direction == "long":
                 stop_price = price - stop_distance
             else:
@@ -163,7 +163,7 @@ class ExecutionState:
 
         for order in self.open_orders:
             # Only buy orders reserve capital
-            if order.side != OrderSide.BUY:
+            if order.side is not OrderSide.BUY:
                 continue
 
             # Calculate order value (quantity * limit_price or estimate)
@@ -203,7 +203,7 @@ class TargetPosition:
 OrderOrTarget = Union["OrderRequest", TargetPosition]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RejectedOrder:
     """An order that was rejected or modified by a constraint.
 
@@ -230,7 +230,7 @@ class RejectedOrder:
     original_quantity: Decimal | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ConstraintResult:
     """Structured result from constraint application.
 
@@ -104,6 +104,81 @@ class TestRiskConfig:
         with pytest.raises((TypeError, AttributeError, ValidationError)):
             config.max_position_pct = 0.50  # type: ignore[misc]
 
+    def test_slotted_without_instance_dict(self) -> None:
+        """RiskConfig should use __slots__ for cheap attribute access."""
+        from liq.risk import RiskConfig
+
+        config = RiskConfig()
+
+        assert not hasattr(config, "__dict__")
+
+    def test_numeric_fields_are_coerced(self) -> None:
+        """Ints for float fields and floats for min_position_value are coerced."""
+        from liq.risk import RiskConfig
+
+        config = RiskConfig(max_gross_leverage=2, max_net_leverage=1, min_position_value=250)
+
+        assert isinstance(config.max_gross_leverage, float)
+        assert isinstance(config.max_net_leverage, float)
+        assert config.min_position_value == Decimal("250")
+        assert isinstance(config.min_position_value, Decimal)
+
+    def test_model_validate_compat(self) -> None:
+        """model_validate builds and validates from a mapping like pydantic."""
+        from liq.risk import RiskConfig
+
+        config = RiskConfig.model_validate({"max_positions": 10, "kelly_fraction": "0.5"})
+
+        assert config == RiskConfig(max_positions=10, kelly_fraction=0.5)
+        assert RiskConfig.model_validate(config) is config
+        with pytest.raises(ValueError, match="max_positions"):
+            RiskConfig.model_validate({"max_positions": 0})
+
+    def test_derive_replaces_fields(self) -> None:
+        """derive() copies a config with overrides and refreshes derived fields."""
+        from liq.risk import RiskConfig
+
+        config = RiskConfig(max_positions=10)
+        derived = config.derive(kelly_fraction=0.5, min_position_value=Decimal("250"))
+
+        assert derived.kelly_fraction == 0.5
+        assert derived.max_positions == 10
+        assert config.kelly_fraction == 0.25
+        assert derived == RiskConfig(
+            max_positions=10, kelly_fraction=0.5, min_position_value=Decimal("250")
+        )
+
+    def test_leverage_decimal_mirrors(self) -> None:
+        """Decimal leverage limits are parsed once and kept in sync by derive()."""
+        from liq.risk import RiskConfig
+
+        config = RiskConfig(max_gross_leverage=2.5, max_positions=10)
+        assert config.max_gross_leverage_dec == Decimal("2.5")
+        assert config.derive(kelly_fraction=0.5).max_gross_leverage_dec == Decimal("2.5")
+        assert config.derive(max_gross_leverage=3.0).max_gross_leverage_dec == Decimal("3.0")
+        assert config.max_net_leverage_dec == Decimal("1.0")
+        assert config.derive(max_net_leverage=0.5).max_net_leverage_dec == Decimal("0.5")
+
+    def test_position_pct_decimal_mirror(self) -> None:
+        """The Decimal position limit is parsed once and kept in sync by derive()."""
+        from liq.risk import RiskConfig
+
+        config = RiskConfig(max_position_pct=0.05)
+        assert config.max_position_pct_dec == Decimal("0.05")
+        assert config.derive(max_positions=10).max_position_pct_dec == Decimal("0.05")
+        assert config.derive(max_position_pct=0.1).max_position_pct_dec == Decimal("0.1")
+
+    def test_derive_rechecks_leverage_consistency(self) -> None:
+        """Leverage overrides are still checked for consistency."""
+        from liq.risk import RiskConfig
+
+        config = RiskConfig(max_positions=10)
+
+        with pytest.raises(ValueError, match="max_net_leverage"):
+            config.derive(max_net_leverage=2.0)
+        with pytest.raises(TypeError, match="no_such_field"):
+            config.derive(no_such_field=1)
+
 
 class TestRiskConfigValidation:
     """Tests for RiskConfig validation."""
@@ -177,6 +252,44 @@ class TestRiskConfigValidation:
         config = RiskConfig(kelly_fraction=1.0)
         assert config.kelly_fraction == 1.0
 
+    @pytest.mark.parametrize(
+        "name",
+        [
+            "max_position_pct",
+            "max_positions",
+            "min_position_value",
+            "max_sector_pct",
+            "max_gross_leverage",
+            "max_net_leverage",
+            "max_correlation",
+            "risk_per_trade",
+            "kelly_fraction",
+            "vol_target",
+            "stop_loss_atr_mult",
+            "take_profit_atr_mult",
+            "max_drawdown_halt",
+            "max_daily_loss_halt",
+            "default_borrow_rate",
+            "default_slippage_pct",
+            "default_commission_pct",
+        ],
+    )
+    def test_nan_rejected(self, name: str) -> None:
+        """NaN fails every range-checked field rather than slipping past its bounds."""
+        from liq.risk import RiskConfig
+
+        with pytest.raises(ValueError, match=name):
+            RiskConfig(**{name: float("nan")})
+
+    def test_decimal_nan_min_position_value_rejected(self) -> None:
+        """A Decimal NaN minimum position value is rejected as well."""
+        from liq.risk import RiskConfig
+
+        with pytest.raises(ValueError, match="min_position_value"):
+            RiskConfig(min_position_value=Decimal("NaN"))
+        with pytest.raises(ValueError, match="min_position_value"):
+            RiskConfig(min_position_value=Decimal("sNaN"))
+
 
 class TestMarketState:
     """Tests for MarketState dataclass."""
@@ -318,6 +431,302 @@ class TestMarketState:
         with pytest.raises((TypeError, AttributeError, ValidationError)):
             state.regime = "changed"  # type: ignore[misc]
 
+    def test_float_arrays_aligned_with_symbol_index(self) -> None:
+        """Prices, volatility and liquidity are exposed as aligned float64 arrays."""
+        import numpy as np
+
+        from liq.risk import MarketState
+
+        now = datetime.now(UTC)
+        bars = {
+            symbol: Bar(
+                timestamp=now,
+                symbol=symbol,
+                open=close,
+                high=close,
+                low=close,
+                close=close,
+                volume=Decimal("1000"),
+            )
+            for symbol, close in (("AAPL", Decimal("151.50")), ("MSFT", Decimal("382.25")))
+        }
+        state = MarketState(
+            current_bars=bars,
+            volatility={"AAPL": Decimal("2.50")},
+            liquidity={"AAPL": Decimal("50000000"), "MSFT": Decimal("30000000")},
+            timestamp=now,
+        )
+
+        assert state.symbol_index == {"AAPL": 0, "MSFT": 1}
+        assert state.close_prices == {"AAPL": Decimal("151.50"), "MSFT": Decimal("382.25")}
+        assert state.price_array.dtype == np.float64
+        assert state.price_array.tolist() == [151.5, 382.25]
+        assert state.volatility_array[0] == 2.5
+        assert np.isnan(state.volatility_array[1])
+        assert state.liquidity_array.tolist() == [50000000.0, 30000000.0]
+
+    def test_float_arrays_are_read_only(self) -> None:
+        """The float64 arrays cannot be mutated through the snapshot."""
+        from liq.risk import MarketState
+
+        now = datetime.now(UTC)
+        bar = Bar(
+            timestamp=now,
+            symbol="AAPL",
+            open=Decimal("150.00"),
+            high=Decimal("152.00"),
+            low=Decimal("149.00"),
+            close=Decimal("151.50"),
+            volume=Decimal("1000000"),
+        )
+        state = MarketState(
+            current_bars={"AAPL": bar},
+            volatility={"AAPL": Decimal("2.50")},
+            liquidity={"AAPL": Decimal("50000000")},
+            timestamp=now,
+        )
+
+        with pytest.raises(ValueError):
+            state.price_array[0] = 0.0
+
+    def test_sector_ids_aligned_with_symbol_index(self) -> None:
+        """Sectors are interned to int ids; unmapped symbols get -1."""
+        import numpy as np
+
+        from liq.risk import MarketState
+
+        now = datetime.now(UTC)
+        bars = {
+            symbol: Bar(
+                timestamp=now,
+                symbol=symbol,
+                open=Decimal("100"),
+                high=Decimal("100"),
+                low=Decimal("100"),
+                close=Decimal("100"),
+                volume=Decimal("1000"),
+            )
+            for symbol in ("XOM", "AAPL", "SPY")
+        }
+        state = MarketState(
+            current_bars=bars,
+            volatility={},
+            liquidity={},
+            sector_map={"XOM": "Energy", "AAPL": "Technology"},
+            timestamp=now,
+        )
+
+        assert state.sector_list == ["Energy", "Technology"]
+        assert state.sector_index == {"Energy": 0, "Technology": 1}
+        assert state.sector_ids.dtype == np.int32
+        assert state.sector_ids.tolist() == [0, 1, -1]
+
+    def test_model_copy_with_new_bars_rebuilds_views(self) -> None:
+        """A copy with updated bars prices from the new bars, not the original."""
+        from liq.risk import MarketState
+
+        now = datetime.now(UTC)
+
+        def bar(symbol: str, close: str) -> Bar:
+            price = Decimal(close)
+            return Bar(
+                timestamp=now,
+                symbol=symbol,
+                open=price,
+                high=price,
+                low=price,
+                close=price,
+                volume=Decimal("1000"),
+            )
+
+        state = MarketState(
+            current_bars={"A": bar("A", "10")}, volatility={}, liquidity={}, timestamp=now
+        )
+        copied = state.model_copy(update={"current_bars": {"B": bar("B", "20")}})
+        deep = state.model_copy(deep=True)
+
+        assert copied.close_prices == {"B": Decimal("20")}
+        assert copied.symbol_index == {"B": 0}
+        assert copied.price_array.tolist() == [20.0]
+        assert state.close_prices == {"A": Decimal("10")}
+        assert deep.close_prices == {"A": Decimal("10")}
+
+    def test_existing_instance_not_revalidated(self) -> None:
+        """Validating an existing MarketState returns the same object."""
+        from liq.risk import MarketState
+
+        state = MarketState(
+            current_bars={}, volatility={}, liquidity={}, timestamp=datetime.now(UTC)
+        )
+
+        assert MarketState.model_validate(state) is state
+
+    def test_from_json(self) -> None:
+        """MarketState validates straight from JSON bytes with exact decimals."""
+        from liq.risk import MarketState
+
+        raw = (
+            b'{"current_bars": {"AAPL": {"timestamp": "2024-01-02T21:00:00Z",'
+            b' "symbol": "AAPL", "open": "100", "high": "101", "low": "99",'
+            b' "close": "100.10", "volume": "1000"}},'
+            b' "volatility": {"AAPL": "2.5"}, "liquidity": {"AAPL": "1000000"},'
+            b' "correlations": [[1.0]], "timestamp": "2024-01-02T21:00:00Z"}'
+        )
+
+        state = MarketState.from_json(raw)
+
+        assert state.close_prices == {"AAPL": Decimal("100.10")}
+        assert state.volatility == {"AAPL": Decimal("2.5")}
+        assert state.correlation_index == {"AAPL": 0}
+        assert state.timestamp.tzinfo is not None
+
+    def test_symbol_keys_are_interned(self) -> None:
+        """Symbol keys are interned so interned lookups match by identity."""
+        import sys
+
+        from liq.risk import MarketState
+
+        symbol = "".join(["XO", "M"])  # built at runtime, not interned
+        state = MarketState(
+            current_bars={},
+            volatility={symbol: Decimal("2.5")},
+            liquidity={},
+            sector_map={symbol: "Energy"},
+            timestamp=datetime.now(UTC),
+        )
+
+        interned = sys.intern("XOM")
+        assert next(iter(state.volatility)) is interned
+        assert next(iter(state.sector_map or {})) is interned
+
+    def test_universe_frame(self) -> None:
+        """Per-symbol data is exposed as a Polars table; missing values are null."""
+        from liq.risk import MarketState
+
+        now = datetime.now(UTC)
+        bars = {
+            symbol: Bar(
+                timestamp=now,
+                symbol=symbol,
+                open=Decimal("100"),
+                high=Decimal("100"),
+                low=Decimal("100"),
+                close=Decimal("100"),
+                volume=Decimal("1000"),
+            )
+            for symbol in ("XOM", "SPY")
+        }
+        state = MarketState(
+            current_bars=bars,
+            volatility={"XOM": Decimal("2.5")},
+            liquidity={"XOM": Decimal("1000000"), "SPY": Decimal("5000000")},
+            sector_map={"XOM": "Energy"},
+            timestamp=now,
+        )
+
+        universe = state.universe
+        assert universe is state.universe
+        assert universe["symbol"].to_list() == ["XOM", "SPY"]
+        assert universe["price"].to_list() == [100.0, 100.0]
+        assert universe["vol"].to_list() == [2.5, None]
+        assert universe["sector"].to_list() == ["Energy", None]
+        assert universe["sector_id"].to_list() == [0, -1]
+
+    def test_correlation_matrix_from_pairs(self) -> None:
+        """Pair dicts are densified; one-sided pairs mirror, missing pairs are NaN."""
+        import numpy as np
+
+        from liq.risk import MarketState
+
+        now = datetime.now(UTC)
+        bar = Bar(
+            timestamp=now,
+            symbol="AAPL",
+            open=Decimal("100"),
+            high=Decimal("100"),
+            low=Decimal("100"),
+            close=Decimal("100"),
+            volume=Decimal("1000"),
+        )
+        state = MarketState(
+            current_bars={"AAPL": bar},
+            volatility={},
+            liquidity={},
+            correlations={("AAPL", "MSFT"): 0.8, ("MSFT", "GOOGL"): 0.6},
+            timestamp=now,
+        )
+
+        assert state.correlation_symbols == ["AAPL", "MSFT", "GOOGL"]
+        corr = state.correlation_matrix
+        assert corr is not None
+        assert corr[0, 1] == corr[1, 0] == 0.8
+        assert corr[1, 2] == corr[2, 1] == 0.6
+        assert np.isnan(corr[0, 2])
+        assert np.isnan(np.diag(corr)).all()
+
+    def test_correlations_from_polars_frame(self) -> None:
+        """A long-format polars frame densifies like the equivalent pair dict."""
+        import polars as pl
+
+        from liq.risk import CorrelationMatrix, MarketState
+
+        frame = pl.DataFrame(
+            {
+                "sym_a": ["AAPL", "MSFT"],
+                "sym_b": ["MSFT", "GOOGL"],
+                "corr": [0.8, None],
+            }
+        )
+        state = MarketState(
+            current_bars={},
+            volatility={},
+            liquidity={},
+            correlations=frame,
+            timestamp=datetime.now(UTC),
+        )
+
+        assert state.correlations == CorrelationMatrix.from_pairs(
+            {("AAPL", "MSFT"): 0.8, ("MSFT", "GOOGL"): None}
+        )
+
+    def test_correlations_stored_as_matrix(self) -> None:
+        """Pair dicts are converted once; a prebuilt CorrelationMatrix is kept as is."""
+        from liq.risk import CorrelationMatrix, MarketState
+
+        now = datetime.now(UTC)
+        state = MarketState(
+            current_bars={},
+            volatility={},
+            liquidity={},
+            correlations={("AAPL", "MSFT"): 0.8},
+            timestamp=now,
+        )
+
+        matrix = state.correlations
+        assert isinstance(matrix, CorrelationMatrix)
+        assert matrix.values[matrix.index["MSFT"], matrix.index["AAPL"]] == 0.8
+        assert matrix == CorrelationMatrix.from_pairs({("MSFT", "AAPL"): 0.8}, ["AAPL"])
+
+        reused = MarketState(
+            current_bars={}, volatility={}, liquidity={}, correlations=matrix, timestamp=now
+        )
+        assert reused.correlations is matrix
+
+    def test_correlation_array_shape_must_match_symbols(self) -> None:
+        """An array of correlations must be square over symbol_index."""
+        import numpy as np
+
+        from liq.risk import MarketState
+
+        with pytest.raises(ValueError, match="correlations"):
+            MarketState(
+                current_bars={},
+                volatility={},
+                liquidity={},
+                correlations=np.eye(2),
+                timestamp=datetime.now(UTC),
+            )
+
 
 class TestRiskConfigTradingCosts:
     """Tests for RiskConfig trading cost fields."""
@@ -405,6 +814,37 @@ class TestRiskConfigLeverageValidation:
             assert "max_position_pct" in str(w[0].message)
             assert "exceeds" in str(w[0].message)
 
+    def test_position_limits_warning_points_at_caller(self) -> None:
+        """The leverage warning names the code building or deriving the config."""
+        import warnings
+
+        from liq.risk import RiskConfig
+
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            config = RiskConfig(max_position_pct=0.10, max_positions=20, max_gross_leverage=1.0)
+            config.derive(max_gross_leverage=1.5)
+
+        assert [x.filename for x in w] == [__file__, __file__]
+
+    def test_position_limits_warning_log_record(self, caplog: pytest.LogCaptureFixture) -> None:
+        """The log record keeps its lazily formatted message and arguments."""
+        import warnings
+
+        from liq.risk import RiskConfig
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            with caplog.at_level("WARNING", logger="liq.risk.config"):
+                RiskConfig(max_position_pct=0.05, max_positions=50, max_gross_leverage=1.0)
+
+        (record,) = caplog.records
+        assert record.getMessage() == (
+            "Config warning: max_position_pct * max_positions = 2.50 "
+            "exceeds max_gross_leverage = 1.00"
+        )
+        assert record.args == (2.5, 1.0)
+
     def test_position_limits_within_leverage_no_warning(self) -> None:
         """No warning when max_position_pct * max_positions <= max_gross_leverage."""
         import warnings
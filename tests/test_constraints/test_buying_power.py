@@ -254,6 +254,47 @@ class TestBuyingPowerConstraintBasic:
         total_value = sum(o.quantity * Decimal("100") for o in constraint_result.orders)
         assert total_value <= Decimal("100000")
 
+    def test_order_exactly_equal_to_cash_passes(self) -> None:
+        """An order costing exactly the available cash passes unchanged."""
+        from liq.risk.constraints import BuyingPowerConstraint
+
+        now = datetime.now(UTC)
+        constraint = BuyingPowerConstraint()
+        config = RiskConfig()
+        portfolio = PortfolioState(
+            cash=Decimal("10000.10"),
+            positions={},
+            timestamp=now,
+        )
+        bar = Bar(
+            timestamp=now,
+            symbol="AAPL",
+            open=Decimal("100.001"),
+            high=Decimal("100.001"),
+            low=Decimal("100.001"),
+            close=Decimal("100.001"),
+            volume=Decimal("1000000"),
+        )
+        market = MarketState(
+            current_bars={"AAPL": bar},
+            volatility={"AAPL": Decimal("2.00")},
+            liquidity={"AAPL": Decimal("50000000")},
+            timestamp=now,
+        )
+        # 100 * $100.001 = $10000.10 exactly
+        order = OrderRequest(
+            symbol="AAPL",
+            side=OrderSide.BUY,
+            order_type=OrderType.MARKET,
+            quantity=Decimal("100"),
+            timestamp=now,
+        )
+
+        constraint_result = constraint.apply([order], portfolio, market, config)
+
+        assert constraint_result.orders == [order]
+        assert constraint_result.rejected == []
+
 
 class TestBuyingPowerConstraintWithFees:
     """Test fee deduction from buying power."""
@@ -697,6 +697,166 @@ class TestCorrelationConstraintEdgeCases:
         # Should be allowed - VIX is negatively correlated to SPY (hedging)
         assert len(constraint_result.orders) == 1
 
+    def test_array_correlations_indexed_by_symbol_index(self) -> None:
+        """A square array aligned with symbol_index is accepted as correlations."""
+        import numpy as np
+
+        constraint = CorrelationConstraint()
+        now = datetime.now(UTC)
+
+        bars = {
+            symbol: Bar(
+                timestamp=now,
+                symbol=symbol,
+                open=Decimal("100"),
+                high=Decimal("105"),
+                low=Decimal("95"),
+                close=Decimal("100"),
+                volume=Decimal("1000000"),
+            )
+            for symbol in ("AAPL", "MSFT", "XOM")
+        }
+        portfolio = PortfolioState(
+            cash=Decimal("100000"),
+            positions={},
+            timestamp=now,
+        )
+        # AAPL/MSFT highly correlated, XOM independent
+        correlations = np.array(
+            [
+                [1.0, 0.9, 0.1],
+                [0.9, 1.0, 0.2],
+                [0.1, 0.2, 1.0],
+            ]
+        )
+        market = MarketState(
+            current_bars=bars,
+            volatility={s: Decimal("2") for s in bars},
+            liquidity={s: Decimal("1000000") for s in bars},
+            correlations=correlations,
+            timestamp=now,
+        )
+        config = RiskConfig(max_correlation=0.7)
+
+        orders = [
+            OrderRequest(
+                symbol=symbol,
+                side=OrderSide.BUY,
+                order_type=OrderType.MARKET,
+                quantity=Decimal("10"),
+                time_in_force=TimeInForce.DAY,
+                timestamp=now,
+            )
+            for symbol in ("AAPL", "MSFT", "XOM")
+        ]
+
+        constraint_result = constraint.apply(orders, portfolio, market, config)
+
+        assert [o.symbol for o in constraint_result.orders] == ["AAPL", "XOM"]
+        assert len(constraint_result.rejected) == 1
+        assert "AAPL" in constraint_result.rejected[0].reason
+
+    def test_batch_conflicts_only_count_accepted_orders(self) -> None:
+        """An order correlated only with a rejected earlier order passes."""
+        constraint = CorrelationConstraint()
+        now = datetime.now(UTC)
+
+        bars = {
+            symbol: Bar(
+                timestamp=now,
+                symbol=symbol,
+                open=Decimal("100"),
+                high=Decimal("105"),
+                low=Decimal("95"),
+                close=Decimal("100"),
+                volume=Decimal("1000000"),
+            )
+            for symbol in ("AAPL", "MSFT", "NVDA")
+        }
+        portfolio = PortfolioState(
+            cash=Decimal("100000"),
+            positions={},
+            timestamp=now,
+        )
+        # AAPL-MSFT and MSFT-NVDA correlated; AAPL-NVDA not
+        market = MarketState(
+            current_bars=bars,
+            volatility={s: Decimal("2") for s in bars},
+            liquidity={s: Decimal("1000000") for s in bars},
+            correlations={
+                ("AAPL", "MSFT"): 0.9,
+                ("MSFT", "NVDA"): 0.9,
+                ("AAPL", "NVDA"): 0.1,
+            },
+            timestamp=now,
+        )
+        config = RiskConfig(max_correlation=0.7)
+
+        orders = [
+            OrderRequest(
+                symbol=symbol,
+                side=OrderSide.BUY,
+                order_type=OrderType.MARKET,
+                quantity=Decimal("10"),
+                time_in_force=TimeInForce.DAY,
+                timestamp=now,
+            )
+            for symbol in ("AAPL", "MSFT", "NVDA")
+        ]
+
+        constraint_result = constraint.apply(orders, portfolio, market, config)
+
+        assert [o.symbol for o in constraint_result.orders] == ["AAPL", "NVDA"]
+        assert [r.order.symbol for r in constraint_result.rejected] == ["MSFT"]
+
+    def test_adding_to_existing_position_not_self_correlated(self) -> None:
+        """A buy of an already-held symbol is not rejected against itself."""
+        constraint = CorrelationConstraint()
+        now = datetime.now(UTC)
+
+        bar = Bar(
+            timestamp=now,
+            symbol="AAPL",
+            open=Decimal("100"),
+            high=Decimal("105"),
+            low=Decimal("95"),
+            close=Decimal("100"),
+            volume=Decimal("1000000"),
+        )
+        position = Position(
+            symbol="AAPL",
+            quantity=Decimal("10"),
+            average_price=Decimal("100"),
+            realized_pnl=Decimal("0"),
+            timestamp=now,
+        )
+        portfolio = PortfolioState(
+            cash=Decimal("99000"),
+            positions={"AAPL": position},
+            timestamp=now,
+        )
+        market = MarketState(
+            current_bars={"AAPL": bar},
+            volatility={"AAPL": Decimal("2")},
+            liquidity={"AAPL": Decimal("1000000")},
+            correlations={("AAPL", "MSFT"): 0.9},
+            timestamp=now,
+        )
+        config = RiskConfig(max_correlation=0.7)
+
+        order = OrderRequest(
+            symbol="AAPL",
+            side=OrderSide.BUY,
+            order_type=OrderType.MARKET,
+            quantity=Decimal("10"),
+            time_in_force=TimeInForce.DAY,
+            timestamp=now,
+        )
+
+        constraint_result = constraint.apply([order], portfolio, market, config)
+
+        assert constraint_result.orders == [order]
+
 
 class TestCorrelationConstraintClassifyRisk:
     """Tests for CorrelationConstraint classify_risk method."""
@@ -8,6 +8,7 @@ Supports N trades per Y timeframe (minute, hour, day, etc.).
 
 from __future__ import annotations
 
+import dataclasses
 from datetime import UTC, datetime, timedelta
 from decimal import Decimal
 
@@ -101,6 +102,12 @@ class TestFrequencyCapConfig:
         cap = FrequencyCapConfig(max_trades=10, timeframe=Timeframe.MINUTE)
         assert cap.per_symbol is True
 
+    def test_config_is_immutable(self) -> None:
+        """Caps are frozen so a constraint's resolved windows stay valid."""
+        cap = FrequencyCapConfig(max_trades=10, timeframe=Timeframe.MINUTE)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            cap.max_trades = 5  # type: ignore[misc]
+
 
 class TestCreateFrequencyCapHelper:
     """Tests for create_frequency_cap helper function."""
@@ -533,6 +540,99 @@ class TestFrequencyCapConstraintTimeWindows:
         assert result.orders == []
         assert "minute" in result.rejected[0].reason.lower()
 
+    def test_window_slides_between_applies(self) -> None:
+        """Trades drop out of the window as market time advances."""
+        now = datetime.now(UTC)
+        constraint = FrequencyCapConstraint(
+            caps=[FrequencyCapConfig(max_trades=2, timeframe=Timeframe.MINUTE)]
+        )
+        # Recorded out of order: the later fill is reported first
+        constraint.record_trade("AAPL", now - timedelta(seconds=10), OrderSide.BUY, Decimal("1"))
+        constraint.record_trade("AAPL", now - timedelta(seconds=50), OrderSide.BUY, Decimal("1"))
+        config = RiskConfig()
+        portfolio = PortfolioState(cash=Decimal("100000"), positions={}, timestamp=now)
+        bar = Bar(
+            timestamp=now,
+            symbol="AAPL",
+            open=Decimal("100"),
+            high=Decimal("102"),
+            low=Decimal("98"),
+            close=Decimal("100"),
+            volume=Decimal("1000000"),
+        )
+        orders = [
+            OrderRequest(
+                symbol="AAPL",
+                side=OrderSide.BUY,
+                order_type=OrderType.MARKET,
+                quantity=Decimal("100"),
+                timestamp=now,
+            )
+        ]
+
+        def market_at(ts: datetime) -> MarketState:
+            return MarketState(
+                current_bars={"AAPL": bar},
+                volatility={"AAPL": Decimal("2.00")},
+                liquidity={"AAPL": Decimal("50000000")},
+                timestamp=ts,
+            )
+
+        # Both trades are inside the minute
+        assert constraint.apply(orders, portfolio, market_at(now), config).orders == []
+        # 20s later only the older trade has expired
+        later = constraint.apply(orders, portfolio, market_at(now + timedelta(seconds=20)), config)
+        assert len(later.orders) == 1
+        # History itself is kept for reporting
+        assert constraint.get_trade_count(symbol="AAPL") == 2
+
+    def test_window_restored_when_time_moves_backwards(self) -> None:
+        """An earlier market time (e.g. a replay) counts trades back in its window."""
+        t0 = datetime.now(UTC)
+        constraint = FrequencyCapConstraint(
+            caps=[
+                FrequencyCapConfig(max_trades=1, timeframe=Timeframe.MINUTE),
+                FrequencyCapConfig(max_trades=1, timeframe=Timeframe.MINUTE, per_symbol=False),
+            ]
+        )
+        constraint.record_trade("AAPL", t0, OrderSide.BUY, Decimal("1"))
+        config = RiskConfig()
+        portfolio = PortfolioState(cash=Decimal("100000"), positions={}, timestamp=t0)
+        bar = Bar(
+            timestamp=t0,
+            symbol="AAPL",
+            open=Decimal("100"),
+            high=Decimal("102"),
+            low=Decimal("98"),
+            close=Decimal("100"),
+            volume=Decimal("1000000"),
+        )
+        orders = [
+            OrderRequest(
+                symbol="AAPL",
+                side=OrderSide.BUY,
+                order_type=OrderType.MARKET,
+                quantity=Decimal("100"),
+                timestamp=t0,
+            )
+        ]
+
+        def market_at(ts: datetime) -> MarketState:
+            return MarketState(
+                current_bars={"AAPL": bar},
+                volatility={"AAPL": Decimal("2.00")},
+                liquidity={"AAPL": Decimal("50000000")},
+                timestamp=ts,
+            )
+
+        # Two minutes later the trade has left the window
+        later = constraint.apply(orders, portfolio, market_at(t0 + timedelta(minutes=2)), config)
+        assert len(later.orders) == 1
+        # Back at t0 + 30s the trade is inside the window again
+        earlier = constraint.apply(orders, portfolio, market_at(t0 + timedelta(seconds=30)), config)
+        assert earlier.orders == []
+        assert constraint.get_trade_count(symbol="AAPL") == 1
+
     def test_day_cap(self) -> None:
         """Day-level cap should work correctly."""
         now = datetime.now(UTC)
@@ -743,6 +843,22 @@ class TestFrequencyCapConstraintRecordTrade:
         assert constraint.get_trade_count(symbol="GOOGL") == 1
         assert constraint.get_trade_count(since=now - timedelta(hours=1)) == 2
 
+    def test_get_trade_count_with_out_of_order_trades(self) -> None:
+        """Late fills are counted by their own timestamp."""
+        constraint = FrequencyCapConstraint()
+        now = datetime.now(UTC)
+
+        constraint.record_trade("AAPL", now, OrderSide.BUY, Decimal("100"))
+        constraint.record_trade("GOOGL", now - timedelta(hours=3), OrderSide.BUY, Decimal("1"))
+        constraint.record_trade("AAPL", now - timedelta(hours=2), OrderSide.BUY, Decimal("100"))
+        constraint.record_trade("AAPL", now - timedelta(minutes=5), OrderSide.SELL, Decimal("1"))
+
+        since = now - timedelta(hours=1)
+        assert constraint.get_trade_count(since=since) == 2
+        assert constraint.get_trade_count(symbol="AAPL", since=since) == 2
+        assert constraint.get_trade_count(symbol="GOOGL", since=since) == 0
+        assert constraint.get_trade_count(since=now - timedelta(hours=4)) == 4
+
     def test_clear_history(self) -> None:
         """Clearing history should remove all trades."""
         constraint = FrequencyCapConstraint()
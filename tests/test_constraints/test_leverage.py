@@ -194,6 +194,54 @@ class TestGrossLeverageConstraintBasic:
         # Should be scaled to 500 shares ($50k)
         assert constraint_result.orders[0].quantity == Decimal("500")
 
+    def test_positions_changed_in_place_are_recounted(self) -> None:
+        """A snapshot whose positions change between calls is not read stale."""
+        from liq.risk.constraints import GrossLeverageConstraint
+
+        now = datetime.now(UTC)
+        constraint = GrossLeverageConstraint()
+        config = RiskConfig(max_gross_leverage=0.5, max_net_leverage=0.5)
+        portfolio = PortfolioState(cash=Decimal("100000"), positions={}, timestamp=now)
+        bar = Bar(
+            timestamp=now,
+            symbol="AAPL",
+            open=Decimal("100"),
+            high=Decimal("102"),
+            low=Decimal("98"),
+            close=Decimal("100"),
+            volume=Decimal("1000000"),
+        )
+        market = MarketState(
+            current_bars={"AAPL": bar},
+            volatility={"AAPL": Decimal("2.00")},
+            liquidity={"AAPL": Decimal("50000000")},
+            timestamp=now,
+        )
+        orders = [
+            OrderRequest(
+                symbol="AAPL",
+                side=OrderSide.BUY,
+                order_type=OrderType.MARKET,
+                quantity=Decimal("800"),
+                timestamp=now,
+            )
+        ]
+
+        # $50k of room at 0.5x of $100k equity
+        first = constraint.apply(orders, portfolio, market, config)
+        assert first.orders[0].quantity == Decimal("500")
+
+        # A $50k position added in place: 0.5x of $150k equity leaves $25k
+        portfolio.positions["TSLA"] = Position(
+            symbol="TSLA",
+            quantity=Decimal("250"),
+            average_price=Decimal("200"),
+            realized_pnl=Decimal("0"),
+            timestamp=now,
+        )
+        second = constraint.apply(orders, portfolio, market, config)
+        assert second.orders[0].quantity == Decimal("250")
+
     def test_short_positions_count_gross(self) -> None:
         """Short positions should count toward gross leverage (absolute)."""
         from liq.risk.constraints import GrossLeverageConstraint
@@ -311,6 +359,56 @@ class TestGrossLeverageConstraintBasic:
         total_value = sum(o.quantity * Decimal("100") for o in constraint_result.orders)
         assert total_value <= Decimal("100000")
 
+    def test_scaled_quantities_match_exact_decimal_scaling(self) -> None:
+        """Scaled quantities equal the exact Decimal floor of value * scale / price."""
+        from decimal import ROUND_DOWN
+
+        from liq.risk.constraints import GrossLeverageConstraint
+
+        now = datetime.now(UTC)
+        constraint = GrossLeverageConstraint()
+        config = RiskConfig(max_gross_leverage=1.0)
+        portfolio = PortfolioState(cash=Decimal("100000"), positions={}, timestamp=now)
+        prices = {"AAPL": Decimal("37.13"), "MSFT": Decimal("151.7"), "XOM": Decimal("3")}
+        quantities = {"AAPL": Decimal("700"), "MSFT": Decimal("900"), "XOM": Decimal("333")}
+        market = MarketState(
+            current_bars={
+                symbol: Bar(
+                    timestamp=now,
+                    symbol=symbol,
+                    open=price,
+                    high=price,
+                    low=price,
+                    close=price,
+                    volume=Decimal("1000000"),
+                )
+                for symbol, price in prices.items()
+            },
+            volatility=dict.fromkeys(prices, Decimal("2.00")),
+            liquidity=dict.fromkeys(prices, Decimal("50000000")),
+            timestamp=now,
+        )
+        orders = [
+            OrderRequest(
+                symbol=symbol,
+                side=OrderSide.BUY,
+                order_type=OrderType.MARKET,
+                quantity=quantity,
+                timestamp=now,
+            )
+            for symbol, quantity in quantities.items()
+        ]
+
+        constraint_result = constraint.apply(orders, portfolio, market, config)
+
+        values = {s: quantities[s] * prices[s] for s in prices}
+        scale = Decimal("100000") / sum(values.values())
+        expected = {
+            s: (values[s] * scale / prices[s]).to_integral_value(rounding=ROUND_DOWN)
+            for s in prices
+        }
+        assert {o.symbol: o.quantity for o in constraint_result.orders} == expected
+
     def test_sell_closing_long_reduces_exposure(self) -> None:
         """Sell orders closing long positions should pass (reduces exposure)."""
         from liq.risk.constraints import GrossLeverageConstraint
@@ -530,6 +628,55 @@ class TestGrossLeverageConstraintBasic:
         # Total = 300 + 700 = 1000
         assert total_qty == Decimal("1000")
 
+    def test_flip_within_limit_passes_unsplit(self) -> None:
+        """A flipping order passes whole when even its full notional fits."""
+        from liq.risk.constraints import GrossLeverageConstraint
+
+        now = datetime.now(UTC)
+        constraint = GrossLeverageConstraint()
+        config = RiskConfig(max_gross_leverage=1.0)  # 1x leverage = $100k max
+        portfolio = PortfolioState(
+            cash=Decimal("70000"),
+            positions={
+                "AAPL": Position(
+                    symbol="AAPL",
+                    quantity=Decimal("300"),
+                    average_price=Decimal("100"),
+                    realized_pnl=Decimal("0"),
+                    timestamp=now,
+                )
+            },
+            timestamp=now,
+        )
+        bar = Bar(
+            timestamp=now,
+            symbol="AAPL",
+            open=Decimal("100"),
+            high=Decimal("102"),
+            low=Decimal("98"),
+            close=Decimal("100"),
+            volume=Decimal("1000000"),
+        )
+        market = MarketState(
+            current_bars={"AAPL": bar},
+            volatility={"AAPL": Decimal("2.00")},
+            liquidity={"AAPL": Decimal("50000000")},
+            timestamp=now,
+        )
+        # Sell 500: close 300 long, open 200 short. $50k notional < $70k capacity
+        order = OrderRequest(
+            symbol="AAPL",
+            side=OrderSide.SELL,
+            order_type=OrderType.MARKET,
+            quantity=Decimal("500"),
+            timestamp=now,
+        )
+
+        constraint_result = constraint.apply([order], portfolio, market, config)
+
+        assert constraint_result.orders == [order]
+        assert constraint_result.rejected == []
+
     def test_order_scaled_to_zero_filtered(self) -> None:
         """Order scaled to zero should be filtered."""
         from liq.risk.constraints import GrossLeverageConstraint
@@ -658,6 +805,46 @@ class TestGrossLeverageConstraintBasic:
         assert result_1x.orders[0].quantity == Decimal("1000")  # 1x = $100k
         assert result_2x.orders[0].quantity == Decimal("1500")  # 1.5x within 2x
 
+    def test_order_exactly_at_limit_passes_unscaled(self) -> None:
+        """An order landing exactly on the limit passes via the exact check."""
+        from liq.risk.constraints import GrossLeverageConstraint
+
+        now = datetime.now(UTC)
+        constraint = GrossLeverageConstraint()
+        config = RiskConfig(max_gross_leverage=1.0)
+        portfolio = PortfolioState(
+            cash=Decimal("100000"),
+            positions={},
+            timestamp=now,
+        )
+        bar = Bar(
+            timestamp=now,
+            symbol="AAPL",
+            open=Decimal("100"),
+            high=Decimal("102"),
+            low=Decimal("98"),
+            close=Decimal("100"),
+            volume=Decimal("1000000"),
+        )
+        market = MarketState(
+            current_bars={"AAPL": bar},
+            volatility={"AAPL": Decimal("2.00")},
+            liquidity={"AAPL": Decimal("50000000")},
+            timestamp=now,
+        )
+        order = OrderRequest(
+            symbol="AAPL",
+            side=OrderSide.BUY,
+            order_type=OrderType.MARKET,
+            quantity=Decimal("1000"),  # $100k = 1x equity
+            timestamp=now,
+        )
+
+        result = constraint.apply([order], portfolio, market, config)
+
+        assert result.orders == [order]
+        assert result.rejected == []
+
 
 class TestGrossLeverageConstraintPropertyBased:
     """Property-based tests for GrossLeverageConstraint."""
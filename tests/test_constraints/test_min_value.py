@@ -355,6 +355,63 @@ class TestMinPositionValueConstraintBasic:
 
         assert len(constraint_result.orders) == 1
 
+    def test_fractional_and_fine_priced_orders_checked_exactly(self) -> None:
+        """Fractional quantities and very finely priced orders are valued exactly."""
+        from liq.risk.constraints import MinPositionValueConstraint
+
+        now = datetime.now(UTC)
+        constraint = MinPositionValueConstraint()
+        config = RiskConfig(min_position_value=Decimal("100"))
+        portfolio = PortfolioState(
+            cash=Decimal("100000"),
+            positions={},
+            timestamp=now,
+        )
+        bars = {
+            symbol: Bar(
+                timestamp=now,
+                symbol=symbol,
+                open=price,
+                high=price,
+                low=price,
+                close=price,
+                volume=Decimal("1000000"),
+            )
+            for symbol, price in (
+                ("BTC", Decimal("300")),
+                ("MICRO", Decimal("0.000000015")),  # far below one cent
+            )
+        }
+        market = MarketState(
+            current_bars=bars,
+            volatility={},
+            liquidity={},
+            timestamp=now,
+        )
+        orders = [
+            OrderRequest(
+                symbol=symbol,
+                side=OrderSide.BUY,
+                order_type=OrderType.MARKET,
+                quantity=quantity,
+                timestamp=now,
+            )
+            for symbol, quantity in (
+                ("BTC", Decimal("0.5")),  # $150
+                ("BTC", Decimal("0.25")),  # $75
+                ("MICRO", Decimal("10000000000")),  # $150
+            )
+        ]
+
+        constraint_result = constraint.apply(orders, portfolio, market, config)
+
+        assert [o.quantity for o in constraint_result.orders] == [
+            Decimal("0.5"),
+            Decimal("10000000000"),
+        ]
+        assert len(constraint_result.rejected) == 1
+        assert "$75.00" in constraint_result.rejected[0].reason
+
 
 class TestMinPositionValueConstraintPropertyBased:
     """Property-based tests for MinPositionValueConstraint."""
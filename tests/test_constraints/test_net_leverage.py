@@ -558,6 +558,56 @@ class TestNetLeverageConstraintEdgeCases:
         total_value = sum(o.quantity * Decimal("100") for o in constraint_result.orders)
         assert total_value <= Decimal("100000")
 
+    def test_scaled_quantities_match_exact_decimal_scaling(self) -> None:
+        """Scaled quantities equal the exact Decimal floor of |delta| * scale / price."""
+        from decimal import ROUND_DOWN
+
+        from liq.risk.constraints import NetLeverageConstraint
+
+        now = datetime.now(UTC)
+        constraint = NetLeverageConstraint()
+        config = RiskConfig(max_net_leverage=1.0)
+        portfolio = PortfolioState(cash=Decimal("100000"), positions={}, timestamp=now)
+        prices = {"AAPL": Decimal("37.13"), "MSFT": Decimal("151.7"), "XOM": Decimal("3")}
+        quantities = {"AAPL": Decimal("700"), "MSFT": Decimal("900"), "XOM": Decimal("333")}
+        market = MarketState(
+            current_bars={
+                symbol: Bar(
+                    timestamp=now,
+                    symbol=symbol,
+                    open=price,
+                    high=price,
+                    low=price,
+                    close=price,
+                    volume=Decimal("1000000"),
+                )
+                for symbol, price in prices.items()
+            },
+            volatility=dict.fromkeys(prices, Decimal("2.00")),
+            liquidity=dict.fromkeys(prices, Decimal("50000000")),
+            timestamp=now,
+        )
+        orders = [
+            OrderRequest(
+                symbol=symbol,
+                side=OrderSide.BUY,
+                order_type=OrderType.MARKET,
+                quantity=quantity,
+                timestamp=now,
+            )
+            for symbol, quantity in quantities.items()
+        ]
+
+        constraint_result = constraint.apply(orders, portfolio, market, config)
+
+        deltas = {s: quantities[s] * prices[s] for s in prices}
+        scale = Decimal("100000") / sum(deltas.values())
+        expected = {
+            s: (deltas[s] * scale / prices[s]).to_integral_value(rounding=ROUND_DOWN)
+            for s in prices
+        }
+        assert {o.symbol: o.quantity for o in constraint_result.orders} == expected
+
 
 class TestNetLeverageConstraintPropertyBased:
     """Property-based tests for NetLeverageConstraint."""
@@ -0,0 +1,58 @@
+"""Tests for the liq.risk.constraints package namespace."""
+
+from __future__ import annotations
+
+import pytest
+
+
+class TestPublicNames:
+    """The package exposes one canonical set of names."""
+
+    def test_all_lists_every_constraint(self) -> None:
+        """__all__ matches the full constraint API."""
+        import liq.risk.constraints as constraints
+
+        assert set(constraints.__all__) == {
+            "MaxPositionConstraint",
+            "MaxPositionsConstraint",
+            "MinPositionValueConstraint",
+            "GrossLeverageConstraint",
+            "NetLeverageConstraint",
+            "SectorExposureConstraint",
+            "CorrelationConstraint",
+            "BuyingPowerConstraint",
+            "ShortSellingConstraint",
+            "PyramidingConstraint",
+            "PyramidingState",
+            "FrequencyCapConstraint",
+            "FrequencyCapConfig",
+            "Timeframe",
+            "create_frequency_cap",
+        }
+        assert len(constraints.__all__) == len(set(constraints.__all__))
+
+    def test_every_public_name_is_importable(self) -> None:
+        """Every name in __all__ has a lazy import entry, and nothing else does."""
+        import liq.risk.constraints as constraints
+
+        assert set(constraints._LAZY) == set(constraints.__all__)
+
+
+class TestLazyExports:
+    """Constraint classes are imported from their submodule on first access."""
+
+    def test_exports_resolve_to_submodule_objects(self) -> None:
+        """Each exported name is the object defined in its submodule."""
+        import liq.risk.constraints as constraints
+        from liq.risk.constraints.pyramiding import PyramidingConstraint
+
+        assert constraints.PyramidingConstraint is PyramidingConstraint
+        for name in constraints.__all__:
+            assert getattr(constraints, name) is not None
+
+    def test_unknown_name_raises_attribute_error(self) -> None:
+        """Names outside the export table are not resolved."""
+        import liq.risk.constraints as constraints
+
+        with pytest.raises(AttributeError, match="NoSuchConstraint"):
+            _ = constraints.NoSuchConstraint
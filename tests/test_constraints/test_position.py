@@ -453,6 +453,174 @@ class TestMaxPositionConstraintBasic:
         # Should allow: 30 (close long) + 50 (max short) = 80
         assert constraint_result.orders[0].quantity == Decimal("80")
 
+    def test_orders_within_limit_pass_untouched(self) -> None:
+        """Adds, closes and new positions within the limit pass as the same objects."""
+        from liq.risk.constraints import MaxPositionConstraint
+
+        now = datetime.now(UTC)
+        constraint = MaxPositionConstraint()
+        config = RiskConfig(max_position_pct=0.05)  # 5% limit = $5000
+        portfolio = PortfolioState(
+            cash=Decimal("100000"),
+            positions={
+                "AAPL": Position(
+                    symbol="AAPL",
+                    quantity=Decimal("30"),
+                    average_price=Decimal("100"),
+                    realized_pnl=Decimal("0"),
+                    timestamp=now,
+                ),
+                "MSFT": Position(
+                    symbol="MSFT",
+                    quantity=Decimal("-30"),
+                    average_price=Decimal("100"),
+                    realized_pnl=Decimal("0"),
+                    timestamp=now,
+                ),
+            },
+            timestamp=now,
+        )
+        bars = {
+            symbol: Bar(
+                timestamp=now,
+                symbol=symbol,
+                open=Decimal("100"),
+                high=Decimal("102"),
+                low=Decimal("98"),
+                close=Decimal("100"),
+                volume=Decimal("1000000"),
+            )
+            for symbol in ("AAPL", "MSFT", "GOOGL")
+        }
+        market = MarketState(
+            current_bars=bars,
+            volatility=dict.fromkeys(bars, Decimal("2.00")),
+            liquidity=dict.fromkeys(bars, Decimal("50000000")),
+            timestamp=now,
+        )
+        orders = [
+            # Adds $1900 to a $3000 long
+            OrderRequest(
+                symbol="AAPL",
+                side=OrderSide.BUY,
+                order_type=OrderType.MARKET,
+                quantity=Decimal("19"),
+                timestamp=now,
+            ),
+            # Covers the whole short
+            OrderRequest(
+                symbol="MSFT",
+                side=OrderSide.BUY,
+                order_type=OrderType.MARKET,
+                quantity=Decimal("30"),
+                timestamp=now,
+            ),
+            # Opens a $4000 short
+            OrderRequest(
+                symbol="GOOGL",
+                side=OrderSide.SELL,
+                order_type=OrderType.MARKET,
+                quantity=Decimal("40"),
+                timestamp=now,
+            ),
+        ]
+
+        constraint_result = constraint.apply(orders, portfolio, market, config)
+
+        assert all(a is b for a, b in zip(constraint_result.orders, orders, strict=True))
+        assert constraint_result.rejected == []
+
+    def test_fitting_orders_pass_untouched_beside_reduced_order(self) -> None:
+        """Only the order over the limit is rebuilt; the rest pass as-is."""
+        from liq.risk.constraints import MaxPositionConstraint
+
+        now = datetime.now(UTC)
+        constraint = MaxPositionConstraint()
+        config = RiskConfig(max_position_pct=0.05)  # 5% limit = $5000
+        portfolio = PortfolioState(
+            cash=Decimal("100000"),
+            positions={},
+            timestamp=now,
+        )
+        bars = {
+            symbol: Bar(
+                timestamp=now,
+                symbol=symbol,
+                open=Decimal("100"),
+                high=Decimal("102"),
+                low=Decimal("98"),
+                close=Decimal("100"),
+                volume=Decimal("1000000"),
+            )
+            for symbol in ("AAPL", "MSFT", "GOOGL")
+        }
+        market = MarketState(
+            current_bars=bars,
+            volatility=dict.fromkeys(bars, Decimal("2.00")),
+            liquidity=dict.fromkeys(bars, Decimal("50000000")),
+            timestamp=now,
+        )
+        orders = [
+            OrderRequest(
+                symbol=symbol,
+                side=OrderSide.BUY,
+                order_type=OrderType.MARKET,
+                quantity=Decimal(quantity),
+                timestamp=now,
+            )
+            for symbol, quantity in (("AAPL", "10"), ("MSFT", "80"), ("GOOGL", "20"))
+        ]
+
+        constraint_result = constraint.apply(orders, portfolio, market, config)
+
+        passed = constraint_result.orders
+        assert passed[0] is orders[0]
+        assert passed[1].quantity == Decimal("50")
+        assert passed[2] is orders[2]
+        assert len(constraint_result.rejected) == 1
+
+    def test_order_exactly_at_limit_passes(self) -> None:
+        """An order taking the position exactly to the limit passes unreduced."""
+        from liq.risk.constraints import MaxPositionConstraint
+
+        now = datetime.now(UTC)
+        constraint = MaxPositionConstraint()
+        config = RiskConfig(max_position_pct=0.05)  # 5% limit = $5000
+        portfolio = PortfolioState(
+            cash=Decimal("100000"),
+            positions={},
+            timestamp=now,
+        )
+        bar = Bar(
+            timestamp=now,
+            symbol="AAPL",
+            open=Decimal("100"),
+            high=Decimal("102"),
+            low=Decimal("98"),
+            close=Decimal("100"),
+            volume=Decimal("1000000"),
+        )
+        market = MarketState(
+            current_bars={"AAPL": bar},
+            volatility={"AAPL": Decimal("2.00")},
+            liquidity={"AAPL": Decimal("50000000")},
+            timestamp=now,
+        )
+        orders = [
+            OrderRequest(
+                symbol="AAPL",
+                side=OrderSide.BUY,
+                order_type=OrderType.MARKET,
+                quantity=Decimal("50"),
+                timestamp=now,
+            )
+        ]
+
+        constraint_result = constraint.apply(orders, portfolio, market, config)
+
+        assert constraint_result.orders == orders
+        assert constraint_result.rejected == []
+
     def test_missing_bar_data_filters_order(self) -> None:
         """Order without bar data should be filtered."""
         from liq.risk.constraints import MaxPositionConstraint
@@ -947,6 +1115,75 @@ class TestMaxPositionsConstraintBasic:
         # Should keep HIGH and MED (top 2 by confidence)
         assert symbols == ["HIGH", "MED"]
 
+    def test_all_new_positions_fit_pass_by_confidence(self) -> None:
+        """With room for every new position, all pass ordered by confidence."""
+        from liq.risk.constraints import MaxPositionsConstraint
+
+        now = datetime.now(UTC)
+        constraint = MaxPositionsConstraint()
+        config = RiskConfig(max_positions=3)
+        portfolio = PortfolioState(
+            cash=Decimal("100000"),
+            positions={},
+            timestamp=now,
+        )
+        market = MarketState(
+            current_bars={},
+            volatility={},
+            liquidity={},
+            timestamp=now,
+        )
+        orders = [
+            OrderRequest(
+                symbol=symbol,
+                side=OrderSide.BUY,
+                order_type=OrderType.MARKET,
+                quantity=Decimal("10"),
+                timestamp=now,
+                confidence=confidence,
+            )
+            for symbol, confidence in (("LOW", 0.3), ("HIGH", 0.9), ("MED", 0.6))
+        ]
+
+        constraint_result = constraint.apply(orders, portfolio, market, config)
+
+        assert [o.symbol for o in constraint_result.orders] == ["HIGH", "MED", "LOW"]
+        assert constraint_result.rejected == []
+
+    def test_all_new_positions_fit_equal_confidence_keep_order(self) -> None:
+        """Ties in confidence keep submission order."""
+        from liq.risk.constraints import MaxPositionsConstraint
+
+        now = datetime.now(UTC)
+        constraint = MaxPositionsConstraint()
+        config = RiskConfig(max_positions=3)
+        portfolio = PortfolioState(
+            cash=Decimal("100000"),
+            positions={},
+            timestamp=now,
+        )
+        market = MarketState(
+            current_bars={},
+            volatility={},
+            liquidity={},
+            timestamp=now,
+        )
+        orders = [
+            OrderRequest(
+                symbol=symbol,
+                side=OrderSide.BUY,
+                order_type=OrderType.MARKET,
+                quantity=Decimal("10"),
+                timestamp=now,
+                confidence=confidence,
+            )
+            for symbol, confidence in (("A", 0.5), ("B", None), ("C", 0.5))
+        ]
+
+        constraint_result = constraint.apply(orders, portfolio, market, config)
+
+        assert [o.symbol for o in constraint_result.orders] == ["A", "C", "B"]
+
 
 class TestMaxPositionConstraintPropertyBased:
     """Property-based tests for MaxPositionConstraint."""
@@ -506,6 +506,53 @@ class TestSectorExposureConstraintMultipleSectors:
             "100"
         )  # MSFT scaled to $10k remaining
 
+    def test_orders_filling_sector_exactly_to_limit_pass(self) -> None:
+        """Orders summing exactly to the sector limit pass unscaled."""
+        from liq.risk.constraints import SectorExposureConstraint
+
+        now = datetime.now(UTC)
+        constraint = SectorExposureConstraint()
+        config = RiskConfig(max_sector_pct=0.30)  # 30% limit = $30k
+        portfolio = PortfolioState(
+            cash=Decimal("100000"),
+            positions={},
+            timestamp=now,
+        )
+        bars = {
+            symbol: Bar(
+                timestamp=now,
+                symbol=symbol,
+                open=Decimal("100"),
+                high=Decimal("102"),
+                low=Decimal("98"),
+                close=Decimal("100"),
+                volume=Decimal("1000000"),
+            )
+            for symbol in ("AAPL", "MSFT", "XOM")
+        }
+        market = MarketState(
+            current_bars=bars,
+            volatility={},
+            liquidity={},
+            sector_map={"AAPL": "Technology", "MSFT": "Technology", "XOM": "Energy"},
+            timestamp=now,
+        )
+        orders = [
+            OrderRequest(
+                symbol=symbol,
+                side=OrderSide.BUY,
+                order_type=OrderType.MARKET,
+                quantity=Decimal("150"),  # $15k each
+                timestamp=now,
+            )
+            for symbol in ("AAPL", "MSFT", "XOM")
+        ]
+
+        constraint_result = constraint.apply(orders, portfolio, market, config)
+
+        assert constraint_result.orders == orders
+        assert constraint_result.rejected == []
+
 
 class TestSectorExposureConstraintEdgeCases:
     """Edge case tests."""
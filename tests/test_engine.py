@@ -366,6 +366,54 @@ class TestRiskEngineConstraints:
         # Should produce an order (basic test that custom constraints work)
         assert len(result.orders) >= 0  # Just verify it runs
 
+    def test_chain_stops_once_no_orders_remain(self) -> None:
+        """Constraints after the batch empties are not applied."""
+        from liq.risk.engine import RiskEngine
+        from liq.risk.types import ConstraintResult, RejectedOrder
+
+        class RejectAll:
+            name = "RejectAll"
+
+            def apply(self, orders, portfolio_state, market_state, risk_config):
+                rejected = [
+                    RejectedOrder(order=o, constraint_name=self.name, reason="no") for o in orders
+                ]
+                return ConstraintResult(orders=[], rejected=rejected, warnings=[])
+
+        class Recorder:
+            name = "Recorder"
+            calls = 0
+
+            def apply(self, orders, portfolio_state, market_state, risk_config):
+                Recorder.calls += 1
+                return ConstraintResult(orders=list(orders), rejected=[], warnings=[])
+
+        now = datetime.now(UTC)
+        engine = RiskEngine(constraints=[RejectAll(), Recorder()])
+        portfolio = PortfolioState(cash=Decimal("100000"), positions={}, timestamp=now)
+        bar = Bar(
+            timestamp=now,
+            symbol="AAPL",
+            open=Decimal("100"),
+            high=Decimal("102"),
+            low=Decimal("98"),
+            close=Decimal("100"),
+            volume=Decimal("1000000"),
+        )
+        market = MarketState(
+            current_bars={"AAPL": bar},
+            volatility={"AAPL": Decimal("2.00")},
+            liquidity={"AAPL": Decimal("50000000")},
+            timestamp=now,
+        )
+        signals = [Signal(symbol="AAPL", timestamp=now, direction="long", strength=1.0)]
+
+        result = engine.process_signals(signals, portfolio, market, RiskConfig())
+
+        assert result.orders == []
+        assert "RejectAll" in result.constraint_violations
+        assert Recorder.calls == 0
+
     def test_constraint_violations_tracked(self) -> None:
         """Constraint violations should be tracked in result."""
         from liq.risk.engine import RiskEngine
@@ -774,6 +822,71 @@ class TestRiskEngineMultipleSignals:
         assert len(symbols) >= 1  # At least one order
 
 
+class TestRiskEngineResultReuse:
+    """Test reusing a RiskEngineResult across calls via ``out``."""
+
+    def _market(self, now: datetime) -> MarketState:
+        bar = Bar(
+            timestamp=now,
+            symbol="AAPL",
+            open=Decimal("100"),
+            high=Decimal("102"),
+            low=Decimal("98"),
+            close=Decimal("100"),
+            volume=Decimal("1000000"),
+        )
+        return MarketState(
+            current_bars={"AAPL": bar},
+            volatility={"AAPL": Decimal("2.00")},
+            liquidity={"AAPL": Decimal("50000000")},
+            timestamp=now,
+        )
+
+    def test_out_containers_refilled_in_place(self) -> None:
+        """Passing ``out`` reuses its containers and matches a fresh result."""
+        from liq.risk.engine import RiskEngine, RiskEngineResult
+
+        now = datetime.now(UTC)
+        engine = RiskEngine()
+        config = RiskConfig()
+        portfolio = PortfolioState(cash=Decimal("100000"), positions={}, timestamp=now)
+        market = self._market(now)
+        signals = [Signal(symbol="AAPL", timestamp=now, direction="long", strength=1.0)]
+        out = RiskEngineResult()
+        orders_list = out.orders
+
+        fresh = engine.process_signals(signals, portfolio, market, config)
+        result = engine.process_signals(signals, portfolio, market, config, out=out)
+        again = engine.process_signals(signals, portfolio, market, config, out=out)
+
+        assert result is out
+        assert again is out
+        assert result.orders is orders_list
+        assert [(o.symbol, o.quantity) for o in result.orders] == [
+            (o.symbol, o.quantity) for o in fresh.orders
+        ]
+        assert result.stop_losses == fresh.stop_losses
+
+    def test_out_with_different_halt_state_shares_containers(self) -> None:
+        """A halt-state change returns a copy that still shares containers."""
+        from liq.risk.engine import RiskEngine, RiskEngineResult
+
+        now = datetime.now(UTC)
+        engine = RiskEngine()
+        config = RiskConfig()
+        portfolio = PortfolioState(cash=Decimal("0"), positions={}, timestamp=now)
+        market = self._market(now)
+        signals = [Signal(symbol="AAPL", timestamp=now, direction="long", strength=1.0)]
+        out = RiskEngineResult()
+
+        result = engine.process_signals(signals, portfolio, market, config, out=out)
+
+        assert result.halted is True
+        assert out.halted is False
+        assert result.orders is out.orders
+        assert result.orders == []
+
+
 class TestRiskEngineZeroConfig:
     """Test zero-config usage."""
 
@@ -630,6 +630,13 @@ class TestDefaultConstraintChain:
         assert "GrossLeverageConstraint" in constraint_types
         assert "NetLeverageConstraint" in constraint_types
 
+    def test_default_chain_built_once_per_engine(self) -> None:
+        """The default chain and sizer are reused across calls."""
+        engine = RiskEngine()
+
+        assert engine._get_constraints() is engine._get_constraints()
+        assert engine._get_sizer() is engine._get_sizer()
+
     def test_default_chain_order(self) -> None:
         """Constraints should be in the correct order."""
         engine = RiskEngine()
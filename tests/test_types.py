@@ -474,6 +474,24 @@ class TestRejectedOrder:
         with pytest.raises(AttributeError):
             rejected.reason = "New reason"  # type: ignore
 
+    def test_slotted_without_instance_dict(self):
+        """RejectedOrder and ConstraintResult use __slots__."""
+        from liq.risk.types import ConstraintResult, RejectedOrder
+
+        order = OrderRequest(
+            symbol="AAPL",
+            side=OrderSide.BUY,
+            order_type=OrderType.MARKET,
+            quantity=Decimal("100"),
+            timestamp=datetime.now(UTC),
+        )
+
+        rejected = RejectedOrder(order=order, constraint_name="Test", reason="Test reason")
+        result = ConstraintResult(orders=[], rejected=[rejected])
+
+        assert not hasattr(rejected, "__dict__")
+        assert not hasattr(result, "__dict__")
+
 
 class TestConstraintResult:
     """Tests for ConstraintResult dataclass."""